@@ -0,0 +1,370 @@
+"""
+bench_etl.py — ETL 파싱 / 변환 함수 벤치마크 (합성 픽스처, 오프라인)
+ETL 벤치마크 컴포넌트
+
+함수별로 처리량(items/sec, 반복 중 최고치)과 최대 메모리(tracemalloc, 별도 1회 실행)를 재고
+저장된 기준값(baseline.json)과 비교해 회귀를 표시한다.
+- 처리량이 기준보다 --tolerance(기본 15%) 이상 낮으면 SLOW
+- 최대 메모리가 기준보다 --mem-tolerance(기본 20%) 이상 크면 MEM
+- 기준값은 측정한 머신에 묶인 값 — 다른 머신이면 같은 프로세스에서 잰 기준 작업(reference)의
+  처리량 비로 기준 처리량을 보정해 비교한다 (--same-machine-only면 비교는 참고용, --check 통과)
+
+사용법:
+    python scripts/bench/bench_etl.py                          # 기본 규모(2k, 20k) 측정 + 기준 비교
+    python scripts/bench/bench_etl.py --sizes 2000 98682       # full Unihan 규모 포함
+    python scripts/bench/bench_etl.py --only parse_unihan extract_components
+    python scripts/bench/bench_etl.py --save-baseline          # 현재 결과를 기준값으로 저장
+    python scripts/bench/bench_etl.py --check                  # 회귀가 있으면 종료 코드 1 (CI용)
+    python scripts/bench/bench_etl.py --check --same-machine-only   # 기준값과 같은 환경일 때만 실패
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.bench.synth_corpus import ensure_corpus
+from scripts.etl.corpus import Corpus
+from scripts.etl.parse_unihan import parse_unihan, select_target
+from scripts.etl.parse_ids import parse_ids_with_expr, extract_components
+from scripts.etl.ids_tree import IdsResolver
+from scripts.etl.load_db import (
+    iter_character_rows,
+    iter_phonetic_class_rows,
+    iter_reading_rows,
+    iter_phonetic_link_rows,
+    iter_decomposition_rows,
+    iter_component_index_rows,
+    iter_phonetic_series_rows,
+)
+from scripts.etl.stable_ids import character_id, phonetic_class_id
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+BASELINE_VERSION = 1
+DEFAULT_SIZES = (2_000, 20_000)
+DEFAULT_REPEAT = 3
+MIN_BENCH_TIME = 0.2  # 초 — 한 번이 이보다 짧으면 반복 횟수를 늘려 잼
+TOLERANCE = 0.15
+MEM_TOLERANCE = 0.20
+MEM_SLACK_KB = 64  # 작은 측정값의 잡음 — 증가분이 이보다 작으면 MEM으로 보지 않음
+REFERENCE_LINES = 5_000  # 기준 작업 입력 줄 수
+
+
+@dataclass
+class Fixture:
+    """규모 하나의 입력 — 파싱 결과는 변환 벤치마크가 공유"""
+    size: int
+    unihan_path: Path
+    ids_path: Path
+    unihan: dict
+    ids_map_expr: dict
+    ids_exprs: list[str]  # ids.txt 셋째 열 (분해 불가 / 비 CJK 포함)
+    corpus: Corpus  # hangul 규모 (kHangul 전체) — 행 생성기 입력
+    char_ids: dict[str, str]
+    code_ids: dict[str, str]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    run: Callable[[Fixture], int]  # 처리한 항목 수 반환
+    unit: str                      # 항목 단위 (표시용)
+
+
+def _consume(rows: Any) -> int:
+    return sum(1 for _ in rows)
+
+
+# 각 함수는 처리한 입력 항목 수를 돌려준다 (처리량 = 항목 수 / 시간)
+
+
+def bench_parse_unihan(fx: Fixture) -> int:
+    return len(parse_unihan(fx.unihan_path))
+
+
+def bench_select_target(fx: Fixture) -> int:
+    select_target(fx.unihan, "default")  # 전체 획수 정렬 후 상위 2,000자
+    return len(fx.unihan)
+
+
+def bench_parse_ids(fx: Fixture) -> int:
+    parse_ids_with_expr(fx.ids_path)
+    return len(fx.ids_exprs)
+
+
+def bench_extract_components(fx: Fixture) -> int:
+    for expr in fx.ids_exprs:
+        extract_components(expr)
+    return len(fx.ids_exprs)
+
+
+def bench_resolve_ids(fx: Fixture) -> int:
+    resolver = IdsResolver(fx.ids_map_expr)  # 매번 새로 — 메모 없이 시작
+    for char in fx.ids_map_expr:
+        resolver.tree(char)
+        resolver.resolve(char)
+    return len(fx.ids_map_expr)
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    b.name: b for b in (
+        Benchmark("parse_unihan", bench_parse_unihan, "chars"),
+        Benchmark("select_target", bench_select_target, "chars"),
+        Benchmark("parse_ids_with_expr", bench_parse_ids, "lines"),
+        Benchmark("extract_components", bench_extract_components, "exprs"),
+        Benchmark("resolve_ids", bench_resolve_ids, "chars"),
+        Benchmark("iter_character_rows", lambda fx: _consume(iter_character_rows(fx.corpus)), "rows"),
+        Benchmark("iter_phonetic_class_rows", lambda fx: _consume(iter_phonetic_class_rows(fx.corpus)), "rows"),
+        Benchmark(
+            "iter_reading_rows",
+            lambda fx: _consume(iter_reading_rows(fx.corpus, fx.char_ids)),
+            "rows",
+        ),
+        Benchmark(
+            "iter_decomposition_rows",
+            lambda fx: _consume(iter_decomposition_rows(fx.corpus, fx.char_ids, IdsResolver(fx.ids_map_expr))),
+            "rows",
+        ),
+        Benchmark(
+            "iter_component_index_rows",
+            lambda fx: _consume(iter_component_index_rows(fx.corpus, fx.char_ids, IdsResolver(fx.ids_map_expr))),
+            "rows",
+        ),
+        Benchmark(
+            "iter_phonetic_series_rows",
+            lambda fx: _consume(iter_phonetic_series_rows(fx.corpus, fx.char_ids, IdsResolver(fx.ids_map_expr))),
+            "rows",
+        ),
+        Benchmark(
+            "iter_phonetic_link_rows",
+            lambda fx: _consume(iter_phonetic_link_rows(fx.corpus, fx.char_ids, fx.code_ids)),
+            "rows",
+        ),
+    )
+}
+
+
+_REFERENCE_INPUT = [
+    f"U+{cp:X}\tkHangul\t{chr(0xAC00 + cp % 11172)}:0N {chr(0xAC00 + cp % 997)}:0E"
+    for cp in range(0x4E00, 0x4E00 + REFERENCE_LINES)
+]
+
+
+def bench_reference(fx: Fixture | None) -> int:
+    """머신 속도 보정용 고정 작업 — 입력이 코드에 박혀 있어 ETL 코드가 바뀌어도 그대로"""
+    rows = {}
+    for line in _REFERENCE_INPUT:
+        cp_str, field, value = line.split("\t")
+        rows[cp_str] = {"field": field, "values": [v.split(":")[0] for v in value.split()]}
+    return len(rows)
+
+
+# 회귀 판정 대상이 아닌 보정용 벤치마크 (결과 표에 나오지 않음)
+REFERENCE = Benchmark("reference", bench_reference, "lines")
+
+
+def load_fixture(size: int, seed: int = 0) -> Fixture:
+    unihan_path, ids_path = ensure_corpus(size, seed)
+    with redirect_stdout(io.StringIO()):
+        unihan = parse_unihan(unihan_path)
+    ids_map_expr = parse_ids_with_expr(ids_path)
+    ids_exprs = []
+    with ids_path.open(encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) >= 3:
+                ids_exprs.append(parts[2])
+    target = select_target(unihan, "hangul")
+    corpus = Corpus(unihan, target, ids_map_expr, "hangul")
+    char_ids = {char: character_id(ord(char)) for _, char, _ in corpus.items()}
+    code_ids = {row["code"]: phonetic_class_id(row["code"]) for row in iter_phonetic_class_rows(corpus)}
+    return Fixture(
+        size, unihan_path, ids_path, unihan, ids_map_expr, ids_exprs, corpus, char_ids, code_ids,
+    )
+
+
+def measure(bench: Benchmark, fx: Fixture | None, repeat: int) -> dict:
+    """
+    처리량은 repeat회 중 최고치, 메모리는 tracemalloc으로 1회 더 실행해 최대치
+    (측정 대상의 진행 출력은 버림)
+    """
+    with redirect_stdout(io.StringIO()):
+        return _measure(bench, fx, repeat)
+
+
+def _measure(bench: Benchmark, fx: Fixture | None, repeat: int) -> dict:
+    best = float("inf")
+    items = 0
+    loops = 1
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(loops):
+            items = bench.run(fx)
+        elapsed = (time.perf_counter() - started) / loops
+        best = min(best, elapsed)
+        # 너무 짧으면 타이머 오차가 커지므로 다음 반복부터 여러 번 묶어서 잼
+        if elapsed * loops < MIN_BENCH_TIME:
+            loops = max(loops, int(MIN_BENCH_TIME / max(elapsed, 1e-6)) + 1)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        bench.run(fx)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "items": items,
+        "seconds": best,
+        "items_per_sec": items / best if best > 0 else 0.0,
+        "peak_kb": peak / 1024,
+    }
+
+
+def machine_info() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(terse=True),
+        "machine": platform.machine(),
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict | None:
+    if not path.exists():
+        return None
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != BASELINE_VERSION:
+        print(f"  [bench] 기준값 형식이 다름 (version={data.get('version')}) — 비교 생략")
+        return None
+    return data
+
+
+def compare(
+    key: str,
+    result: dict,
+    baseline: dict | None,
+    tolerance: float,
+    mem_tolerance: float,
+    scale: float = 1.0,
+) -> tuple[str, list[str]]:
+    """(기준 대비 표시 문자열, 회귀 목록) — scale은 기준 처리량 보정 배율 (다른 머신)"""
+    base = (baseline or {}).get("results", {}).get(key)
+    if base is None:
+        return "-", []
+    expected = base["items_per_sec"] * scale
+    speed = result["items_per_sec"] / expected - 1 if expected else 0.0
+    mem = result["peak_kb"] / base["peak_kb"] - 1 if base["peak_kb"] else 0.0
+    flags = []
+    if speed < -tolerance:
+        flags.append("SLOW")
+    if mem > mem_tolerance and result["peak_kb"] - base["peak_kb"] > MEM_SLACK_KB:
+        flags.append("MEM")
+    return f"{speed:+.0%} / {mem:+.0%}", flags
+
+
+def run(
+    sizes: list[int],
+    names: list[str],
+    repeat: int,
+    baseline: dict | None,
+    tolerance: float,
+    mem_tolerance: float,
+    seed: int = 0,
+    scale: float = 1.0,
+) -> tuple[dict[str, dict], list[str]]:
+    results: dict[str, dict] = {}
+    regressions: list[str] = []
+    header = f"  {'벤치마크':<28}{'규모':>8}{'items':>10}{'items/sec':>14}{'ms':>10}{'peak KB':>11}  기준 대비(속도/메모리)"
+    print(header)
+    print("  " + "-" * (len(header) + 6))
+    for size in sizes:
+        fx = load_fixture(size, seed)
+        for name in names:
+            bench = BENCHMARKS[name]
+            key = f"{name}@{size}"
+            result = measure(bench, fx, repeat)
+            results[key] = result
+            delta, flags = compare(key, result, baseline, tolerance, mem_tolerance, scale)
+            if flags:
+                regressions.append(f"{key} ({', '.join(flags)})")
+            print(
+                f"  {name:<28}{size:>8,}{result['items']:>10,}{result['items_per_sec']:>14,.0f}"
+                f"{result['seconds'] * 1000:>10.1f}{result['peak_kb']:>11,.0f}  {delta}"
+                + (f"  ← {' '.join(flags)}" if flags else "")
+            )
+    return results, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ETL 파싱 / 변환 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), metavar="N")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), metavar="NAME",
+                        help=f"실행할 벤치마크 ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값 파일에 저장 (같은 키만 덮어씀)")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="허용 처리량 감소 비율 (기본 0.15)")
+    parser.add_argument("--mem-tolerance", type=float, default=MEM_TOLERANCE, help="허용 메모리 증가 비율 (기본 0.20)")
+    parser.add_argument("--check", action="store_true", help="회귀가 있으면 종료 코드 1")
+    parser.add_argument("--same-machine-only", action="store_true",
+                        help="기준값과 다른 환경이면 보정 비교를 참고용으로만 (--check 통과)")
+    parser.add_argument("--json", type=Path, metavar="PATH", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    machine = machine_info()
+    same_machine = baseline is not None and baseline.get("machine") == machine
+    reference = measure(REFERENCE, None, args.repeat)["items_per_sec"]
+    scale = 1.0
+    if baseline is not None and not same_machine:
+        print(f"  [bench] 기준값은 다른 환경에서 측정됨: {baseline.get('machine')}")
+        if baseline.get("reference"):
+            scale = reference / baseline["reference"]
+            print(f"  [bench] 기준 작업 처리량 비 {scale:.2f}× 로 기준 처리량 보정")
+        else:
+            print("  [bench] 기준값에 기준 작업 측정치가 없음 — 보정 없이 비교")
+        if args.same_machine_only:
+            print("  [bench] --same-machine-only: 비교는 참고용")
+
+    results, regressions = run(
+        args.sizes, args.only or list(BENCHMARKS), args.repeat,
+        baseline, args.tolerance, args.mem_tolerance, args.seed, scale,
+    )
+    report = {
+        "version": BASELINE_VERSION, "machine": machine, "reference": reference, "results": results,
+    }
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\n  → 결과: {args.json}")
+    if args.save_baseline:
+        merged = {**baseline["results"], **results} if same_machine else results
+        args.baseline.write_text(
+            json.dumps({**report, "results": dict(sorted(merged.items()))}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"  → 기준값 저장: {args.baseline}")
+
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건: {', '.join(regressions)}")
+        if args.check and (same_machine or not args.same_machine_only):
+            sys.exit(1)
+    elif baseline is not None:
+        print("\n회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
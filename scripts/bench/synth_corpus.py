@@ -0,0 +1,202 @@
+"""
+synth_corpus.py — 벤치마크용 합성 Unihan.zip / ids.txt 생성기
+ETL 벤치마크 컴포넌트
+
+실제 파일과 같은 형식·분포를 흉내 낸다 (시드 고정 → 같은 인자면 같은 파일).
+- 블록 순서대로 codepoint 배정: CJK 기본(4E00) → 확장 A(3400) → 확장 B(20000) …
+  (멤버 파일은 codepoint 오름차순, 파서가 쓰지 않는 필드 행도 섞음)
+- kHangul 약 45% (1~3음, 드물게 같은 음 반복), kPhonetic 약 60% (가끔 여러 값 / '*')
+- kTotalStrokes 1~30 (중간 값에 몰린 분포, 가끔 두 값), kRSUnicode "부수.잔여획" (가끔 ')
+- IDS: 약 88%가 2~3단 중첩 표현, 일부는 분해 불가(자기 자신) 또는 CJK 밖 부품
+
+사용법:
+    python scripts/bench/synth_corpus.py --size 20000 --out /tmp/bench
+    paths = ensure_corpus(20000)   # 캐시 디렉터리에 없으면 생성 → (unihan_zip, ids_txt)
+"""
+
+import argparse
+import random
+import zipfile
+from pathlib import Path
+
+# 프로젝트 루트의 data/ 폴더 (hanja-app/ 상위)
+DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
+FIXTURE_DIR = DATA_DIR / ".cache" / "bench"
+SYNTH_VERSION = 1  # 생성 규칙이 바뀌면 올려서 캐시된 픽스처를 새로 만듦
+
+# codepoint 배정 순서 (블록 시작, 크기)
+CJK_BLOCKS = (
+    (0x4E00, 20_992),  # CJK 기본
+    (0x3400, 6_592),   # 확장 A
+    (0x20000, 42_720), # 확장 B
+    (0x2A700, 4_154),  # 확장 C
+    (0x2B740, 222),    # 확장 D
+    (0x2B820, 5_762),  # 확장 E
+    (0x2CEB0, 7_473),  # 확장 F
+    (0x30000, 4_939),  # 확장 G
+    (0x31350, 4_192),  # 확장 H
+    (0x2EBF0, 622),    # 확장 I
+    (0xF900, 472),     # 호환 한자
+    (0x2F800, 542),    # 호환 한자 보충
+)
+FULL_UNIHAN_SIZE = sum(count for _, count in CJK_BLOCKS)  # 98,682 (Unicode 15.1)
+SIZES = (2_000, 10_000, 20_000, 50_000, FULL_UNIHAN_SIZE)
+
+HANGUL_SYLLABLES = (
+    "가각간갈감갑강개거건걸검게격견결겸경계고곡곤골공과곽관광괘괴교구국군굴궁권궐궤귀규균극근금급긍기긴길"
+    "나낙난남납낭내녀년념녕노농뇌능니다단달담답당대덕도독돈동두둔득등라락란람랍랑래랭략량려력련렬렴렵령례"
+    "로록론롱뢰료룡루류륙륜률륭륵름릉리린림립마막만말망매맥맹면멸명모목몰몽묘무묵문물미민밀박반발방배백번"
+    "벌범법벽변별병보복본봉부북분불붕비빈빙사삭산살삼삽상새색생서석선설섬섭성세소속손솔송쇄쇠수숙순술숭습"
+    "승시식신실심십쌍씨아악안알암압앙애액야약양어억언엄업여역연열염엽영예오옥온옹와완왈왕왜외요욕용우욱운"
+    "울웅원월위유육윤율융은을음읍응의이익인일임입잉자작잔잠잡장재쟁저적전절점접정제조족존졸종좌죄주죽준중"
+    "즉즐증지직진질짐집징차착찬찰참창채책처척천철첨첩청체초촉촌총촬최추축춘출충취측층치칙친칠침칭쾌타탁탄"
+    "탈탐탑탕태택토통퇴투특파판팔패팽편폄평폐포폭표품풍피필핍하학한할함합항해핵행향허헌험혁현혈혐협형혜호"
+    "혹혼홀홍화확환활황회획횡효후훈훼휘휴흉흑흔흘흠흡흥희힐"
+)
+DEFINITION_WORDS = (
+    "water", "clear", "pure", "bright", "tree", "wood", "fire", "earth", "metal", "person",
+    "hand", "heart", "mind", "speak", "words", "go", "walk", "stop", "rain", "mountain",
+    "river", "field", "grain", "rice", "silk", "thread", "gate", "door", "roof", "house",
+    "king", "jade", "stone", "bamboo", "grass", "insect", "fish", "bird", "horse", "cow",
+)
+IDS_OPERATORS_2 = "⿰⿱⿴⿵⿶⿷⿸⿹⿺⿻"
+IDS_OPERATORS_3 = "⿲⿳"
+# 자주 쓰이는 부품 (부수) — 나머지는 이미 배정된 글자에서 뽑음
+COMMON_COMPONENTS = "氵木扌亻口日月火土金言糸艹辶宀心忄阝女目禾竹米衤貝車門雨山石王田虫魚鳥馬"
+
+
+def codepoints(size: int) -> list[int]:
+    """블록 순서대로 size개 — 멤버 파일처럼 오름차순 정렬해서 반환"""
+    result: list[int] = []
+    for start, count in CJK_BLOCKS:
+        take = min(count, size - len(result))
+        result.extend(range(start, start + take))
+        if len(result) >= size:
+            break
+    if len(result) < size:
+        raise ValueError(f"size가 너무 큼: {size:,} (최대 {FULL_UNIHAN_SIZE:,})")
+    return sorted(result)
+
+
+def _strokes(rng: random.Random) -> int:
+    return max(1, min(30, int(rng.gauss(12, 5))))
+
+
+def _records(cps: list[int], rng: random.Random) -> dict[str, list[str]]:
+    """멤버 파일별 행 목록 (codepoint 순)"""
+    readings: list[str] = []
+    dictionary: list[str] = []
+    irg: list[str] = []
+    for cp in cps:
+        c = f"U+{cp:X}"
+        strokes = _strokes(rng)
+        radical = rng.randint(1, 214)
+
+        # Unihan_Readings.txt — 필드명 알파벳순
+        readings.append(f"{c}\tkCantonese\tjat{rng.randint(1, 6)}")
+        if rng.random() < 0.7:
+            words = rng.sample(DEFINITION_WORDS, rng.randint(1, 4))
+            readings.append(f"{c}\tkDefinition\t{'; '.join(words)}")
+        if rng.random() < 0.45:
+            values = [rng.choice(HANGUL_SYLLABLES) for _ in range(rng.choice((1, 1, 1, 2, 2, 3)))]
+            readings.append(
+                f"{c}\tkHangul\t" + " ".join(f"{v}:0{rng.choice('ENX')}" for v in values)
+            )
+        readings.append(f"{c}\tkJapanese\tイチ")
+        readings.append(f"{c}\tkMandarin\tyī")
+
+        # Unihan_DictionaryLikeData.txt
+        dictionary.append(f"{c}\tkCangjie\t{''.join(rng.choice('ABCDEFGHIJ') for _ in range(3))}")
+        dictionary.append(f"{c}\tkFourCornerCode\t{rng.randint(0, 9999):04d}.{rng.randint(0, 9)}")
+        if rng.random() < 0.1:
+            dictionary.append(f"{c}\tkFrequency\t{rng.randint(1, 5)}")
+        if rng.random() < 0.6:
+            codes = [f"{rng.randint(1, 1700)}{rng.choice(('', '', '', 'A', '*'))}"]
+            if rng.random() < 0.05:
+                codes.append(str(rng.randint(1, 1700)))
+            dictionary.append(f"{c}\tkPhonetic\t{' '.join(codes)}")
+
+        # Unihan_IRGSources.txt
+        irg.append(f"{c}\tkIRG_GSource\tG0-{rng.randint(0x3021, 0x7E7E):04X}")
+        if rng.random() < 0.4:
+            irg.append(f"{c}\tkIRG_KSource\tK0-{rng.randint(0x3021, 0x7E7E):04X}")
+        prime = "'" if rng.random() < 0.03 else ""
+        irg.append(f"{c}\tkRSUnicode\t{radical}{prime}.{max(0, strokes - 3)}")
+        total = f"{strokes} {strokes + 1}" if rng.random() < 0.02 else str(strokes)
+        irg.append(f"{c}\tkTotalStrokes\t{total}")
+    return {
+        "Unihan_Readings.txt": readings,
+        "Unihan_DictionaryLikeData.txt": dictionary,
+        "Unihan_IRGSources.txt": irg,
+    }
+
+
+def _ids_expr(char: str, pool: list[str], rng: random.Random, depth: int = 0) -> str:
+    """부품 pool에서 뽑아 만든 IDS (2~3단 중첩)"""
+
+    def part() -> str:
+        if depth < 2 and rng.random() < 0.25:
+            return _ids_expr(char, pool, rng, depth + 1)
+        return rng.choice(COMMON_COMPONENTS) if rng.random() < 0.5 else rng.choice(pool)
+
+    if rng.random() < 0.1:
+        return rng.choice(IDS_OPERATORS_3) + part() + part() + part()
+    return rng.choice(IDS_OPERATORS_2) + part() + part()
+
+
+def _ids_lines(cps: list[int], rng: random.Random) -> list[str]:
+    pool = [chr(cp) for cp in cps[: max(50, len(cps) // 20)]]
+    lines = [";; -*- coding: utf-8-mcs-er -*-", "# synthetic IDS"]
+    for cp in cps:
+        char = chr(cp)
+        roll = rng.random()
+        if roll < 0.88:
+            expr = _ids_expr(char, pool, rng)
+        elif roll < 0.94:
+            expr = char  # 분해 불가
+        else:
+            expr = rng.choice(IDS_OPERATORS_2) + "&CDP-8B7C;" + rng.choice(COMMON_COMPONENTS)
+        extra = f"\t{_ids_expr(char, pool, rng)}[J]" if rng.random() < 0.1 else ""
+        lines.append(f"U+{cp:X}\t{char}\t{expr}{extra}")
+    return lines
+
+
+def write_corpus(size: int, out_dir: Path, seed: int = 0) -> tuple[Path, Path]:
+    """out_dir에 Unihan.zip + ids.txt 생성 → (unihan_zip, ids_txt)"""
+    rng = random.Random(f"{seed}:{size}")
+    cps = codepoints(size)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    unihan_path = out_dir / "Unihan.zip"
+    ids_path = out_dir / "ids.txt"
+    header = "# Unihan (synthetic)\n#\n"
+    with zipfile.ZipFile(unihan_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, lines in _records(cps, rng).items():
+            zf.writestr(name, header + "\n".join(lines) + "\n# EOF\n")
+        zf.writestr("Unihan_Variants.txt", header)
+    ids_path.write_text("\n".join(_ids_lines(cps, rng)) + "\n", encoding="utf-8")
+    return unihan_path, ids_path
+
+
+def ensure_corpus(size: int, seed: int = 0, root: Path = FIXTURE_DIR) -> tuple[Path, Path]:
+    """캐시 디렉터리(data/.cache/bench/v<버전>-<size>-<seed>)에 없으면 생성"""
+    out_dir = root / f"v{SYNTH_VERSION}-{size}-{seed}"
+    unihan_path, ids_path = out_dir / "Unihan.zip", out_dir / "ids.txt"
+    if not (unihan_path.exists() and ids_path.exists()):
+        print(f"  [synth] {size:,}자 픽스처 생성 → {out_dir}")
+        write_corpus(size, out_dir, seed)
+    return unihan_path, ids_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 Unihan.zip / ids.txt 생성")
+    parser.add_argument("--size", type=int, default=20_000, help=f"글자 수 (기본 20,000, 최대 {FULL_UNIHAN_SIZE:,})")
+    parser.add_argument("--out", type=Path, required=True, help="출력 디렉터리")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    unihan_path, ids_path = write_corpus(args.size, args.out, args.seed)
+    print(f"  → {unihan_path} ({unihan_path.stat().st_size / 1024 / 1024:.1f}MB)")
+    print(f"  → {ids_path} ({ids_path.stat().st_size / 1024 / 1024:.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
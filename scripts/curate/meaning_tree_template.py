@@ -15,8 +15,7 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from scripts.etl.parse_unihan import parse_unihan, filter_target, cp_to_char
-from scripts.etl.parse_ids import parse_ids_with_expr
+from scripts.etl.corpus import Corpus
 
 
 # 300자 선정 기준
@@ -96,7 +95,7 @@ def generate_template(char: str, hangul: str = "", definition: str = "") -> dict
     }
 
 
-def select_300_chars(target: dict, ids_map_expr: dict) -> list[tuple[str, str, dict]]:
+def select_300_chars(corpus: Corpus) -> list[tuple[str, str, dict]]:
     """
     300자 우선순위 선정:
       1. kHangul 보유 (필수)
@@ -105,21 +104,18 @@ def select_300_chars(target: dict, ids_map_expr: dict) -> list[tuple[str, str, d
     반환: [(codepoint_str, char, data), ...]
     """
     candidates = []
-    for cp_str, data in target.items():
-        char = cp_to_char(cp_str)
+    for cp_str, char, data in corpus.items():
         if not data.get("kHangul"):
             continue
 
-        strokes_raw = data.get("kTotalStrokes", "99")
-        try:
-            strokes = int(strokes_raw.split()[0])
-        except Exception:
+        strokes = corpus.strokes[cp_str]
+        if strokes is None:
             strokes = 99
 
         if strokes > MAX_STROKES:
             continue
 
-        has_ids = char in ids_map_expr
+        has_ids = char in corpus.ids_map_expr
         # IDS 분해 성공 글자를 우선 (0 < 1), 그 다음 획수 오름차순
         candidates.append((0 if has_ids else 1, strokes, cp_str, char, data))
 
@@ -150,30 +146,24 @@ def main():
             print(f"  ERROR: {data_dir}에 Unihan.zip, ids.txt 파일이 필요합니다")
             sys.exit(1)
 
-        unihan = parse_unihan(unihan_zip)
-        target = filter_target(unihan)
-        ids_map_expr = parse_ids_with_expr(ids_path)
+        corpus = Corpus.load(unihan_zip, ids_path)
+        ids_map_expr = corpus.ids_map_expr
 
-        selected = select_300_chars(target, ids_map_expr)
+        selected = select_300_chars(corpus)
         print(f"  → 선정 완료: {len(selected)}자")
 
         # Unihan 데이터에서 hangul, definition 자동 채움
         templates = []
         for cp_str, char, data in selected:
-            hangul_raw = data.get("kHangul", "")
-            # 첫 번째 음만 추출
-            hangul = hangul_raw.split()[0].split(":")[0] if hangul_raw else ""
+            hangul = corpus.hangul[cp_str]  # 첫 번째 음만
             definition = data.get("kDefinition", "")
             templates.append(generate_template(char, hangul=hangul, definition=definition))
 
         # 통계 출력
         ids_count = sum(1 for _, ch, _ in selected if ch in ids_map_expr)
-        strokes_list = []
-        for _, _, d in selected:
-            try:
-                strokes_list.append(int(d.get("kTotalStrokes", "0").split()[0]))
-            except Exception:
-                pass
+        strokes_list = [
+            corpus.strokes[cp] for cp, _, _ in selected if corpus.strokes[cp] is not None
+        ]
         avg_strokes = sum(strokes_list) / len(strokes_list) if strokes_list else 0
         print(f"  → IDS 분해 성공: {ids_count}/{len(selected)} ({ids_count/len(selected):.1%})")
         print(f"  → 평균 획수: {avg_strokes:.1f}획")
@@ -0,0 +1,241 @@
+"""
+build_pack.py — 오프라인 사전 팩 빌드 (PWA용 정적 파일)
+Phase 1 ETL 파이프라인 컴포넌트
+
+글자별 상세 문서(documents.iter_document_rows)를 codepoint % shard_mod 로 나눠
+gzip JSON 샤드로 쓰고, 로컬 검색용 색인과 매니페스트를 함께 만든다.
+클라이언트(src/lib/pack.ts)는 매니페스트만 매번 확인하고, 파일은 Cache Storage에 둔다.
+- 파일 이름에 내용 해시가 들어가므로 바뀐 샤드만 새 이름이 된다 → 이전 버전과 다른 파일만 받으면 됨
+- manifest.delta에 직전 버전 대비 바뀐 / 없어진 샤드와 받을 바이트 수를 기록
+- 같은 입력이면 바이트 단위로 같은 파일 (gzip mtime 0, 키 정렬) — 변경이 없으면 버전도 그대로
+- versions/에 최근 KEEP_VERSIONS개 매니페스트를 남기고, 거기서 참조하지 않는 파일은 지운다
+
+출력 (기본 public/packs/):
+    manifest.json                  현재 버전 매니페스트
+    index.<hash>.json.gz           [[char, codepoint, strokes, [음...], 뜻 앞부분, id], ...]
+    chars-NN.<hash>.json.gz        {"format": 1, "docs": {char: CharacterDocument}}
+    versions/<version>.json        버전별 매니페스트
+
+사용법:
+    python build_pack.py                      # 원본 + Supabase 큐레이션 데이터 (의미 트리 등)
+    python build_pack.py --scale hangul
+    python build_pack.py --offline            # 큐레이션 데이터 없이 (Supabase 불필요)
+    python build_pack.py --out /tmp/packs --shards 64
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.corpus import Corpus
+from scripts.etl.parse_unihan import SCALES
+from scripts.etl.load_db import DATA_DIR, get_supabase_client, make_id_resolvers
+from scripts.etl.documents import CuratedData, iter_document_rows
+from scripts.etl.instrument import stage
+
+PACK_FORMAT = 1
+PACK_SHARDS = 32     # 기본 샤드 수 — 바꾸면 모든 샤드가 새 파일이 된다
+KEEP_VERSIONS = 3    # 남겨 둘 이전 버전 수 (갱신 중인 클라이언트가 옛 파일을 받을 수 있게)
+GLOSS_CHARS = 60     # 색인에 넣을 뜻(unihan_def) 앞부분 길이
+PACK_DIR = Path(__file__).parent.parent.parent / "public" / "packs"
+
+
+@dataclass
+class PackFile:
+    file: str
+    hash: str
+    bytes: int
+    count: int
+
+
+def _encode(payload: object) -> bytes:
+    """키 정렬 compact JSON → gzip (mtime 0이라 같은 내용이면 같은 바이트)"""
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    return gzip.compress(text.encode("utf-8"), compresslevel=9, mtime=0)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _write_file(out_dir: Path, prefix: str, payload: object, count: int) -> PackFile:
+    data = _encode(payload)
+    digest = content_hash(data)
+    name = f"{prefix}.{digest}.json.gz"
+    path = out_dir / name
+    if not path.exists():
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    return PackFile(name, digest, len(data), count)
+
+
+def index_entry(doc: dict) -> list:
+    """색인 한 줄 — [char, codepoint, strokes, [음 (대표음 먼저, 중복 제거)], 뜻 앞부분, id]"""
+    character = doc["character"]
+    readings = list(dict.fromkeys(r["value"] for r in character["readings"]))
+    gloss = (character.get("unihan_def") or "")[:GLOSS_CHARS]
+    return [
+        character["char"], character["codepoint"], character["strokes"], readings, gloss,
+        character["id"],
+    ]
+
+
+def pack_delta(previous: dict | None, manifest: dict) -> dict | None:
+    """직전 매니페스트 대비 받아야 할 파일 — 샤드 id 기준"""
+    if previous is None:
+        return None
+    old = {s["id"]: s["hash"] for s in previous.get("shards", [])}
+    new = {s["id"]: s for s in manifest["shards"]}
+    changed = sorted(i for i, s in new.items() if old.get(i) != s["hash"])
+    removed = sorted(i for i in old if i not in new)
+    index_changed = previous.get("index", {}).get("hash") != manifest["index"]["hash"]
+    return {
+        "from": previous["version"],
+        "changed": changed,
+        "removed": removed,
+        "index_changed": index_changed,
+        "bytes": sum(new[i]["bytes"] for i in changed)
+                 + (manifest["index"]["bytes"] if index_changed else 0),
+    }
+
+
+def _referenced(manifest: dict) -> set[str]:
+    return {manifest["index"]["file"], *(s["file"] for s in manifest["shards"])}
+
+
+def prune_pack_dir(out_dir: Path, keep: int = KEEP_VERSIONS) -> int:
+    """최근 keep개 버전이 참조하지 않는 팩 파일 / 버전 매니페스트 삭제 — 지운 파일 수"""
+    versions_dir = out_dir / "versions"
+    manifests = [
+        (json.loads(p.read_text(encoding="utf-8")), p) for p in versions_dir.glob("*.json")
+    ] if versions_dir.exists() else []
+    manifests.sort(key=lambda mp: (mp[0]["built_at"], mp[1].stat().st_mtime), reverse=True)
+    live: set[str] = set()
+    removed = 0
+    for i, (manifest, path) in enumerate(manifests):
+        if i < keep:
+            live |= _referenced(manifest)
+        else:
+            path.unlink()
+            removed += 1
+    for path in out_dir.glob("*.json.gz"):
+        if path.name not in live:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def build_pack(
+    docs: Iterable[dict],
+    out_dir: Path = PACK_DIR,
+    shards: int = PACK_SHARDS,
+    meta: dict | None = None,
+    keep: int = KEEP_VERSIONS,
+) -> dict:
+    """
+    문서 행(iter_document_rows) → 샤드 / 색인 / 매니페스트
+    이전 버전과 내용이 같으면 매니페스트를 다시 쓰지 않고 기존 것을 돌려준다.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    buckets: list[dict[str, dict]] = [{} for _ in range(shards)]
+    index: list[list] = []
+    for row in docs:
+        doc = row["doc"]
+        buckets[doc["character"]["codepoint"] % shards][row["char"]] = doc
+        index.append(index_entry(doc))
+    index.sort(key=lambda entry: entry[1])
+
+    index_file = _write_file(out_dir, "index", index, len(index))
+    shard_files = [
+        _write_file(out_dir, f"chars-{i:02d}", {"format": PACK_FORMAT, "docs": bucket}, len(bucket))
+        for i, bucket in enumerate(buckets)
+    ]
+    version = content_hash(
+        json.dumps([shards, index_file.hash, *(f.hash for f in shard_files)]).encode("utf-8")
+    )
+
+    manifest_path = out_dir / "manifest.json"
+    previous = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else None
+    if previous is not None and previous.get("version") == version:
+        print(f"  [pack] 변경 없음 — 버전 {version} 유지")
+        return previous
+
+    manifest = {
+        "format": PACK_FORMAT,
+        "version": version,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **(meta or {}),
+        "count": len(index),
+        "shard_mod": shards,
+        "index": asdict(index_file),
+        "shards": [{"id": i, **asdict(f)} for i, f in enumerate(shard_files)],
+    }
+    manifest["delta"] = pack_delta(previous, manifest)
+
+    versions_dir = out_dir / "versions"
+    versions_dir.mkdir(exist_ok=True)
+    text = json.dumps(manifest, ensure_ascii=False, indent=1)
+    (versions_dir / f"{version}.json").write_text(text, encoding="utf-8")
+    tmp = manifest_path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, manifest_path)
+
+    removed = prune_pack_dir(out_dir, keep)
+    total = index_file.bytes + sum(f.bytes for f in shard_files)
+    print(f"  [pack] 버전 {version}: {len(index):,}자, 샤드 {shards}개, 전체 {total / 1024:,.0f}KB (gzip)")
+    if manifest["delta"] is not None:
+        delta = manifest["delta"]
+        print(
+            f"  [pack] {delta['from']} 대비: 샤드 {len(delta['changed'])}/{shards}개 변경"
+            f"{', 색인 변경' if delta['index_changed'] else ''}, 받을 크기 {delta['bytes'] / 1024:,.0f}KB"
+        )
+    if removed:
+        print(f"  [pack] 이전 버전 파일 {removed}개 정리")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 사전 팩 빌드")
+    parser.add_argument("--scale", choices=SCALES, default="default", help="대상 규모 (run_etl.py와 같게)")
+    parser.add_argument("--out", type=Path, default=PACK_DIR, metavar="DIR", help="출력 디렉터리 (기본 public/packs)")
+    parser.add_argument("--shards", type=int, default=PACK_SHARDS, metavar="N", help=f"샤드 수 (기본 {PACK_SHARDS})")
+    parser.add_argument("--offline", action="store_true", help="Supabase 큐레이션 데이터 없이 빌드")
+    args = parser.parse_args()
+
+    print("[pack] 오프라인 사전 팩 빌드\n")
+    print("[1/3] 데이터 파싱 중...")
+    corpus = Corpus.load(DATA_DIR / "Unihan.zip", DATA_DIR / "ids.txt", scale=args.scale)
+    print(f"  → 대상: {len(corpus.target)}자\n")
+
+    print("[2/3] 큐레이션 데이터 조회 중...")
+    curated = None
+    if args.offline:
+        print("  --offline: 의미 트리 / 解說 없이 빌드")
+    else:
+        with stage("pack.curated"):
+            curated = CuratedData.fetch(get_supabase_client())
+    print()
+
+    print("[3/3] 팩 쓰는 중...")
+    resolvers = make_id_resolvers(None, corpus)
+    with stage("pack.build") as s:
+        manifest = build_pack(
+            iter_document_rows(corpus, resolvers["characters"], curated),
+            args.out, args.shards,
+            meta={"scale": args.scale, "curated": curated is not None},
+        )
+        s.rows_out = manifest["count"]
+    print(f"\n[완료] {args.out / 'manifest.json'}")
+
+
+if __name__ == "__main__":
+    main()
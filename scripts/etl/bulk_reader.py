@@ -0,0 +1,206 @@
+"""
+bulk_reader.py — hanja 스키마 테이블 대량 조회 (keyset 페이지네이션)
+Phase 1 ETL 파이프라인 컴포넌트
+
+OFFSET 페이지네이션(.range)은 페이지가 뒤로 갈수록 느려지고, ORDER BY가 없으면
+동시 쓰기 중에 행이 겹치거나 빠질 수 있다. 여기서는 키 순으로 정렬해
+"마지막으로 받은 키보다 큰 행"을 한 페이지씩 받는다 (WHERE key > :last ORDER BY key LIMIT n).
+- 키는 테이블 PK (복합 키는 (a, b) 사전순 비교)
+- parallel > 1이면 첫 키 컬럼(UUID)의 값 공간을 겹치지 않는 구간으로 나눠 동시에 조회
+  (구간마다 크기 제한 큐 — 앞 구간을 내보내는 동안 뒤 구간은 READ_QUEUE_PAGES 페이지까지만 미리 받음)
+- iter_rows()는 페이지 단위 제너레이터, fetch_all()은 리스트
+- filters로 PostgREST 필터를 덧붙일 수 있다 (예: ("type", "neq", "kHangul"))
+
+사용법:
+    reader = BulkReader(supabase, parallel=4)
+    for row in reader.iter_rows("readings", "id,character_id"):
+        ...
+    chars = reader.fetch_all("characters", "id,char")
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.instrument import attach_http
+
+PAGE_SIZE = 1000  # Supabase 기본 max-rows와 같게
+READ_PARALLEL = 4  # 기본 동시 구간 수
+READ_QUEUE_PAGES = 4  # 구간별로 미리 받아 둘 페이지 수 — 메모리 상한은 parallel × 이 값 × page_size행
+PUT_POLL = 0.5  # 조회 스레드가 소비 측 중단을 확인하는 간격 (초)
+DB_SCHEMA = "hanja"
+
+# 테이블별 keyset 키 (PK) — 첫 컬럼은 UUID라 구간 분할에 쓴다
+TABLE_KEYS: dict[str, tuple[str, ...]] = {
+    "characters": ("id",),
+    "readings": ("id",),
+    "phonetic_classes": ("id",),
+    "decompositions": ("character_id",),
+    "character_phonetic_class": ("character_id", "phonetic_class_id"),
+    "component_index": ("character_id", "component"),
+    "phonetic_series": ("phonetic_class_id",),
+    "meaning_senses": ("id",),
+    "meaning_edges": ("id",),
+    "character_details": ("character_id",),
+    "radical_details": ("character_id",),
+    "character_documents": ("character_id",),
+}
+
+Filter = tuple[str, str, Any]  # (컬럼, PostgREST 연산자, 값)
+_DONE = object()  # 구간 큐의 끝 표시
+
+
+def uuid_ranges(parts: int) -> list[tuple[str | None, str | None]]:
+    """UUID 값 공간을 parts개의 [lo, hi) 구간으로 (처음/끝은 열린 구간)"""
+    bounds = [f"{i * (1 << 128) // parts:032x}" for i in range(1, parts)]
+    bounds = [f"{b[:8]}-{b[8:12]}-{b[12:16]}-{b[16:20]}-{b[20:]}" for b in bounds]
+    return list(zip([None, *bounds], [*bounds, None]))
+
+
+def _quote(value: Any) -> str:
+    """PostgREST or=() 필터 값 인용 (쉼표·괄호가 든 값도 안전하게)"""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+class BulkReader:
+    def __init__(
+        self,
+        supabase: Any,
+        schema: str = DB_SCHEMA,
+        page_size: int = PAGE_SIZE,
+        parallel: int = 1,
+    ) -> None:
+        # schema()는 호출마다 새 HTTP 클라이언트를 만들므로 한 번만 생성해 연결 재사용
+        self._db = supabase.schema(schema)
+        attach_http(self._db)
+        self.page_size = page_size
+        self.parallel = max(1, parallel)
+        self.requests = 0
+        self.rows = 0
+        self._lock = threading.Lock()  # 조회 스레드들이 함께 세는 requests / rows
+
+    def _scan(
+        self,
+        table: str,
+        columns: str,
+        key: tuple[str, ...],
+        lo: str | None = None,
+        hi: str | None = None,
+        filters: tuple[Filter, ...] = (),
+    ) -> Iterator[list[dict]]:
+        """[lo, hi) 구간을 keyset으로 한 페이지씩"""
+        first = key[0]
+        last: dict | None = None
+        while True:
+            query = self._db.table(table).select(columns)
+            for column, op, value in filters:
+                query = query.filter(column, op, value)
+            if lo is not None:
+                query = query.gte(first, lo)
+            if hi is not None:
+                query = query.lt(first, hi)
+            if last is not None:
+                if len(key) == 1:
+                    query = query.gt(first, last[first])
+                else:
+                    a, b = key
+                    query = query.or_(
+                        f"{a}.gt.{_quote(last[a])},"
+                        f"and({a}.eq.{_quote(last[a])},{b}.gt.{_quote(last[b])})"
+                    )
+            for column in key:
+                query = query.order(column)
+            page = query.limit(self.page_size).execute().data
+            with self._lock:
+                self.requests += 1
+                self.rows += len(page)
+            if page:
+                yield page
+            if len(page) < self.page_size:
+                return
+            last = page[-1]
+
+    def iter_pages(
+        self,
+        table: str,
+        columns: str = "*",
+        key: tuple[str, ...] | None = None,
+        filters: tuple[Filter, ...] = (),
+    ) -> Iterator[list[dict]]:
+        """키 순 페이지 제너레이터 — parallel > 1이면 구간별로 동시에 받아 키 순서대로 내보냄"""
+        key = key or TABLE_KEYS.get(table, ("id",))
+        if columns != "*":
+            # keyset 조건에 키 값이 필요하므로 projection에 키 컬럼 포함
+            selected = columns.split(",")
+            columns = ",".join([*selected, *(k for k in key if k not in selected)])
+
+        if self.parallel == 1:
+            yield from self._scan(table, columns, key, filters=filters)
+            return
+        ranges = uuid_ranges(self.parallel)
+        queues: list[queue.Queue] = [queue.Queue(maxsize=READ_QUEUE_PAGES) for _ in ranges]
+        stop = threading.Event()  # 소비 측이 중간에 그만두면 (제너레이터 close / 예외) 조회 중단
+
+        def put(pages: queue.Queue, item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=PUT_POLL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def scan_range(pages: queue.Queue, lo: str | None, hi: str | None) -> None:
+            try:
+                for page in self._scan(table, columns, key, lo, hi, filters):
+                    if not put(pages, page):
+                        return
+            except BaseException as e:
+                put(pages, e)
+                return
+            put(pages, _DONE)
+
+        with ThreadPoolExecutor(max_workers=self.parallel, thread_name_prefix="read") as pool:
+            for pages, (lo, hi) in zip(queues, ranges):
+                pool.submit(scan_range, pages, lo, hi)
+            try:
+                # 구간 순서대로 내보내므로 전체가 키 순
+                for pages in queues:
+                    while (item := pages.get()) is not _DONE:
+                        if isinstance(item, BaseException):
+                            raise item
+                        yield item
+            finally:
+                stop.set()
+
+    def iter_rows(
+        self,
+        table: str,
+        columns: str = "*",
+        key: tuple[str, ...] | None = None,
+        filters: tuple[Filter, ...] = (),
+    ) -> Iterator[dict]:
+        for page in self.iter_pages(table, columns, key, filters):
+            yield from page
+
+    def fetch_all(
+        self,
+        table: str,
+        columns: str = "*",
+        key: tuple[str, ...] | None = None,
+        filters: tuple[Filter, ...] = (),
+    ) -> list[dict]:
+        rows: list[dict] = []
+        for page in self.iter_pages(table, columns, key, filters):
+            rows.extend(page)
+        return rows
+
+    def count(self, table: str, key: tuple[str, ...] | None = None) -> int:
+        """키 컬럼만 받아 행 수 계산"""
+        key = key or TABLE_KEYS.get(table, ("id",))
+        return sum(len(page) for page in self.iter_pages(table, ",".join(key), key))
@@ -0,0 +1,162 @@
+"""
+cache.py — 파싱 결과 디스크 캐시 (content-addressed)
+Phase 1 ETL 파이프라인 컴포넌트
+
+Unihan.zip / ids.txt 파싱 결과를 원본 파일 해시 + 요청 필드 기준으로
+data/.cache/ 아래에 pickle로 저장한다. 원본이나 UNIHAN_FIELDS가 바뀌면
+키가 달라지므로 자동으로 다시 파싱된다.
+
+사용법:
+    from scripts.etl.cache import cached_parse_unihan, cached_parse_ids_with_expr
+    from scripts.etl.cache import cached_parse_unihan_store  # 배열 기반 저장소
+
+    unihan = cached_parse_unihan(DATA_DIR / "Unihan.zip")
+    ids_map_expr = cached_parse_ids_with_expr(DATA_DIR / "ids.txt")
+
+환경변수:
+    HANJA_ETL_NO_CACHE=1   캐시를 사용하지 않음 (항상 새로 파싱)
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.parse_unihan import parse_unihan, UNIHAN_FIELDS
+from scripts.etl.parse_ids import parse_ids_with_expr
+from scripts.etl.unihan_store import UnihanStore, parse_unihan_store
+
+
+# 파서 출력 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 1
+CACHE_DIR_NAME = ".cache"
+HASH_CHUNK_SIZE = 1 << 20  # 1MB
+MAX_ENTRIES_PER_KIND = 4  # 종류별 보관 캐시 수 (오래된 것부터 삭제)
+
+
+def file_digest(path: Path) -> str:
+    """파일 내용의 sha256 (hex)"""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_key(kind: str, source: Path, params: Any = None) -> str:
+    """원본 해시 + 파라미터로 캐시 키 생성"""
+    h = hashlib.sha256()
+    h.update(f"{kind}:v{CACHE_VERSION}:".encode())
+    h.update(file_digest(source).encode())
+    h.update(repr(params).encode())
+    return f"{kind}-{h.hexdigest()[:24]}"
+
+
+def _cache_dir(source: Path) -> Path:
+    return source.parent / CACHE_DIR_NAME
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("HANJA_ETL_NO_CACHE", "") in ("", "0")
+
+
+def _load_or_build(kind: str, source: Path, params: Any, build: Callable[[], Any]) -> Any:
+    """캐시 적중 시 pickle 로드, 아니면 build() 후 저장"""
+    if not cache_enabled():
+        return build()
+
+    key = cache_key(kind, source, params)
+    cache_dir = _cache_dir(source)
+    cache_path = cache_dir / f"{key}.pkl"
+
+    if cache_path.exists():
+        try:
+            # 수십만 개 객체 생성 중 GC가 반복 실행되지 않도록 잠시 중단
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with cache_path.open("rb") as f:
+                    data = pickle.load(f)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            os.utime(cache_path)  # 최근 사용 표시 (정리 순서 기준)
+            print(f"  [cache] {source.name} → {cache_path.name} (적중)")
+            return data
+        except Exception as e:
+            # 손상된 캐시는 무시하고 재생성
+            print(f"  [cache] {cache_path.name} 로드 실패, 재생성: {e}")
+
+    data = build()
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # 동시 실행 시 반쯤 쓰인 파일을 읽지 않도록 임시 파일 → rename
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    # 같은 종류의 오래된 캐시 정리
+    entries = sorted(
+        cache_dir.glob(f"{kind}-*.pkl"),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for old in entries[MAX_ENTRIES_PER_KIND:]:
+        old.unlink(missing_ok=True)
+
+    print(f"  [cache] {source.name} → {cache_path.name} (저장)")
+    return data
+
+
+def cached_parse_unihan(
+    zip_path: Path,
+    fields: set[str] = UNIHAN_FIELDS,
+    codepoints: set[str] | None = None,
+    jobs: int = 1,
+) -> dict[str, dict]:
+    """
+    parse_unihan() 캐시 래퍼 — 키: Unihan.zip 해시 + 필드 집합 (+ 코드포인트 제한)
+    jobs는 결과에 영향이 없으므로 키에 포함하지 않는다.
+    """
+    params = (sorted(fields), sorted(codepoints) if codepoints is not None else None)
+    return _load_or_build(
+        "unihan",
+        zip_path,
+        params,
+        lambda: parse_unihan(zip_path, fields, codepoints, jobs=jobs),
+    )
+
+
+def cached_parse_unihan_store(
+    zip_path: Path,
+    fields: set[str] = UNIHAN_FIELDS,
+    codepoints: set[str] | None = None,
+) -> UnihanStore:
+    """parse_unihan_store() 캐시 래퍼 — 키 구성은 cached_parse_unihan과 동일"""
+    params = (sorted(fields), sorted(codepoints) if codepoints is not None else None)
+    return _load_or_build(
+        "unihan_store",
+        zip_path,
+        params,
+        lambda: parse_unihan_store(zip_path, fields, codepoints),
+    )
+
+
+def cached_parse_ids_with_expr(ids_path: Path) -> dict[str, dict]:
+    """parse_ids_with_expr() 캐시 래퍼 — 키: ids.txt 해시"""
+    return _load_or_build(
+        "ids",
+        ids_path,
+        None,
+        lambda: parse_ids_with_expr(ids_path),
+    )
@@ -0,0 +1,197 @@
+"""
+checkpoint.py — 적재 체크포인트 / 재개 (--resume)
+Phase 1 ETL 파이프라인 컴포넌트
+
+적재 중 끝난 단계·테이블·배치를 data/.cache/load_state.json에 기록한다.
+배치 경계는 WriteController가 실행마다 다르게 자르므로, 배치 번호 대신
+테이블별 행 생성 순서의 인덱스 구간 [start, end)로 저장한다 (행 생성기는 결정적).
+상태는 입력 지문(Unihan.zip / ids.txt 해시 + scale)에 묶여 있어서
+입력이 바뀌면 이전 기록은 버리고 처음부터 적재한다.
+
+사용법:
+    checkpoint = LoadCheckpoint.open(state_path, input_fingerprint(unihan, ids, "default"), resume=True)
+    checkpoint.is_table_done("characters")
+    rows = checkpoint.table("readings").pending(rows)   # 끝난 행 건너뜀
+    checkpoint.clear()   # 전체 적재 성공 후
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from bisect import bisect_right
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.cache import CACHE_DIR_NAME, file_digest
+
+# 행 생성 규칙(load_db.iter_*)이 바뀌면 올려서 기존 체크포인트를 무효화
+STATE_VERSION = 1
+STATE_FILE_NAME = "load_state.json"
+SAVE_INTERVAL = 1.0  # 초 — 배치 완료마다 쓰되 이 간격보다 자주 쓰지 않음
+
+
+def input_fingerprint(unihan_path: Path, ids_path: Path, scale: str, variant: str = "") -> str:
+    """
+    적재 입력 지문 — 원본 두 파일 해시 + 대상 규모
+    variant: 행 생성 설정 (예: 부품 색인 방식) — 달라지면 같은 입력이라도 행 순서·수가 바뀜
+    """
+    h = hashlib.sha256()
+    h.update(f"load:v{STATE_VERSION}:{scale}:{variant}:".encode())
+    h.update(file_digest(unihan_path).encode())
+    h.update(file_digest(ids_path).encode())
+    return h.hexdigest()[:24]
+
+
+def default_state_path(unihan_path: Path) -> Path:
+    return unihan_path.parent / CACHE_DIR_NAME / STATE_FILE_NAME
+
+
+class TableCheckpoint:
+    """한 테이블의 완료 행 구간 — 행 생성 순서 인덱스 기준"""
+
+    def __init__(self, owner: "LoadCheckpoint", table: str, ranges: list[list[int]]) -> None:
+        self.owner = owner
+        self.table = table
+        self.ranges = ranges          # 정렬·병합된 [start, end) 목록 (상태 파일과 같은 객체)
+        self._queue: deque[int] = deque()
+        self.skipped = 0
+
+    def is_done(self, index: int) -> bool:
+        i = bisect_right(self.ranges, [index, float("inf")]) - 1
+        return i >= 0 and self.ranges[i][0] <= index < self.ranges[i][1]
+
+    def pending(self, rows: Iterable[dict]) -> Iterator[dict]:
+        """끝난 행을 건너뛰고, 내보낸 행의 인덱스를 순서대로 기억"""
+        for index, row in enumerate(rows):
+            if self.is_done(index):
+                self.skipped += 1
+                continue
+            self._queue.append(index)
+            yield row
+
+    def take(self, count: int) -> list[int]:
+        """방금 만들어진 배치(앞에서부터 count행)의 인덱스"""
+        return [self._queue.popleft() for _ in range(count)]
+
+    def complete(self, indexes: list[int]) -> None:
+        start = prev = None
+        for index in indexes:
+            if start is None:
+                start = prev = index
+            elif index == prev + 1:
+                prev = index
+            else:
+                self._add(start, prev + 1)
+                start = prev = index
+        if start is not None:
+            self._add(start, prev + 1)
+        self.owner.save()
+
+    def _add(self, start: int, end: int) -> None:
+        ranges = self.ranges
+        i = bisect_right(ranges, [start, float("inf")])
+        # 왼쪽 구간과 겹치거나 맞닿으면 합침
+        if i > 0 and ranges[i - 1][1] >= start:
+            i -= 1
+            start = ranges[i][0]
+            end = max(end, ranges[i][1])
+        j = i
+        while j < len(ranges) and ranges[j][0] <= end:
+            end = max(end, ranges[j][1])
+            j += 1
+        ranges[i:j] = [[start, end]]
+
+    @property
+    def rows_done(self) -> int:
+        return sum(end - start for start, end in self.ranges)
+
+
+class LoadCheckpoint:
+    def __init__(self, path: Path, fingerprint: str, state: dict | None = None) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.state = state or {"fingerprint": fingerprint, "stages": [], "tables": {}}
+        self._tables: dict[str, TableCheckpoint] = {}
+        self._last_save = 0.0
+
+    @classmethod
+    def open(cls, path: Path, fingerprint: str, resume: bool = False) -> "LoadCheckpoint":
+        """resume=True이고 같은 입력의 상태 파일이 있으면 이어서, 아니면 새로 시작"""
+        if resume and path.exists():
+            try:
+                state = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                print(f"  [resume] 상태 파일을 읽지 못함 ({e}) → 처음부터 적재")
+            else:
+                if state.get("fingerprint") == fingerprint:
+                    checkpoint = cls(path, fingerprint, state)
+                    print(checkpoint.summary())
+                    return checkpoint
+                print("  [resume] 입력이 바뀌어 이전 체크포인트를 버림 → 처음부터 적재")
+        elif resume:
+            print("  [resume] 체크포인트 없음 → 처음부터 적재")
+        checkpoint = cls(path, fingerprint)
+        checkpoint.save(force=True)
+        return checkpoint
+
+    # ── 단계 / 테이블 ────────────────────────────
+    def is_stage_done(self, stage: str) -> bool:
+        return stage in self.state["stages"]
+
+    def mark_stage_done(self, stage: str) -> None:
+        if stage not in self.state["stages"]:
+            self.state["stages"].append(stage)
+        self.save(force=True)
+
+    def _table_state(self, table: str) -> dict:
+        return self.state["tables"].setdefault(table, {"done": False, "ranges": []})
+
+    def is_table_done(self, table: str) -> bool:
+        return self._table_state(table)["done"]
+
+    def mark_table_done(self, table: str) -> None:
+        self._table_state(table)["done"] = True
+        self.save(force=True)
+
+    def table(self, table: str) -> TableCheckpoint:
+        if table not in self._tables:
+            self._tables[table] = TableCheckpoint(self, table, self._table_state(table)["ranges"])
+        return self._tables[table]
+
+    # ── 저장 ────────────────────────────────────
+    def save(self, force: bool = False) -> None:
+        """임시 파일 + os.replace로 원자적 저장 (중간에 죽어도 이전 상태는 온전)"""
+        now = time.monotonic()
+        if not force and now - self._last_save < SAVE_INTERVAL:
+            return
+        self._last_save = now
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".load_state-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        """전체 적재 성공 — 재개할 것이 없으므로 상태 파일 삭제"""
+        self.path.unlink(missing_ok=True)
+
+    def summary(self) -> str:
+        lines = [f"  [resume] 체크포인트 {self.path.name} (입력 {self.fingerprint[:12]})"]
+        for stage in self.state["stages"]:
+            lines.append(f"    {stage}: 완료")
+        for table, info in self.state["tables"].items():
+            if info["done"]:
+                lines.append(f"    {table}: 완료")
+            else:
+                done = sum(end - start for start, end in info["ranges"])
+                lines.append(f"    {table}: {done:,}행 완료 (구간 {len(info['ranges'])}개)")
+        return "\n".join(lines)
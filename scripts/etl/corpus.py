@@ -0,0 +1,139 @@
+"""
+corpus.py — 파이프라인 1회 실행 동안 공유하는 파싱 결과 객체
+Phase 1 ETL 파이프라인 컴포넌트
+
+Unihan/IDS를 한 번만 파싱하고, 검증·적재·리포트 단계가 같은 Corpus를
+받아 쓴다. 획수·부수·대표음 등 파생 값도 여기서 한 번만 계산한다.
+
+사용법:
+    from scripts.etl.corpus import Corpus
+
+    corpus = Corpus.load(DATA_DIR / "Unihan.zip", DATA_DIR / "ids.txt")
+    corpus.char_by_cp["U+6E05"]   # '清'
+    corpus.strokes["U+6E05"]      # 11
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.parse_unihan import (
+    TARGET_COUNT,
+    select_target,
+    cp_to_char,
+    parse_strokes,
+    parse_frequency,
+    parse_radical,
+    primary_hangul,
+)
+from scripts.etl.cache import (
+    cached_parse_unihan,
+    cached_parse_unihan_store,
+    cached_parse_ids_with_expr,
+)
+from scripts.etl.unihan_store import UnihanStore
+from scripts.etl.ids_tree import IdsResolver
+from scripts.etl.instrument import stage
+
+
+class Corpus:
+    """
+    파싱된 Unihan 전체(unihan), 학습 대상(target), IDS 분해(ids_map_expr)와
+    target 기준 파생 뷰를 묶은 객체
+    """
+
+    def __init__(
+        self,
+        unihan: dict,
+        target: dict,
+        ids_map_expr: dict,
+        scale: str = "default",
+    ) -> None:
+        self.unihan = unihan
+        self.target = target
+        self.ids_map_expr = ids_map_expr
+        self.scale = scale
+        self._ids_resolver: IdsResolver | None = None
+
+        # 파생 뷰 (target 기준, codepoint_str 키)
+        self.char_by_cp: dict[str, str] = {}
+        self.strokes: dict[str, int | None] = {}
+        self.frequency: dict[str, int | None] = {}
+        self.radicals: dict[str, str | None] = {}
+        self.hangul: dict[str, str] = {}
+        for cp_str, data in target.items():
+            self.char_by_cp[cp_str] = cp_to_char(cp_str)
+            self.strokes[cp_str] = parse_strokes(data.get("kTotalStrokes"))
+            self.frequency[cp_str] = parse_frequency(data.get("kFrequency"))
+            self.radicals[cp_str] = parse_radical(data.get("kRSUnicode"))
+            self.hangul[cp_str] = primary_hangul(data.get("kHangul"))
+
+    @classmethod
+    def load(
+        cls,
+        unihan_path: Path,
+        ids_path: Path,
+        scale: str = "default",
+        jobs: int = 1,
+        columnar: bool = False,
+    ) -> "Corpus":
+        """
+        Unihan.zip + ids.txt를 (캐시 경유로) 파싱하여 Corpus 생성
+        scale: 대상 규모 (parse_unihan.SCALES)
+        columnar=True면 Unihan을 배열 기반 UnihanStore로 보관 (jobs 무시)
+        """
+        with stage("parse.unihan") as s:
+            if columnar:
+                unihan = cached_parse_unihan_store(unihan_path)
+            else:
+                unihan = cached_parse_unihan(unihan_path, jobs=jobs)
+            s.rows_out = len(unihan)
+        with stage("parse.filter", rows_in=len(unihan)) as s:
+            target = select_target(unihan, scale)
+            s.rows_out = len(target)
+        with stage("parse.ids") as s:
+            ids_map_expr = cached_parse_ids_with_expr(ids_path)
+            s.rows_out = len(ids_map_expr)
+        return cls(unihan, target, ids_map_expr, scale)
+
+    def __len__(self) -> int:
+        return len(self.target)
+
+    @property
+    def expected_count(self) -> int:
+        """검증 기준 대상 글자 수 — 규모에 따라 Unihan 전체에서 산출"""
+        if self.scale == "default":
+            return TARGET_COUNT
+        if self.scale == "hangul":
+            return self.hangul_total
+        return len(self.unihan)
+
+    @property
+    def hangul_total(self) -> int:
+        """Unihan 전체 중 kHangul 보유 글자 수"""
+        return sum(1 for data in self.unihan.values() if "kHangul" in data)
+
+    def items(self):
+        """(codepoint_str, char, data) 순회 — target 순서 유지"""
+        for cp_str, data in self.target.items():
+            yield cp_str, self.char_by_cp[cp_str], data
+
+    def ids_for(self, char: str) -> dict | None:
+        return self.ids_map_expr.get(char)
+
+    @property
+    def ids_resolver(self) -> IdsResolver:
+        """IDS 트리 / 재귀 분해 (처음 쓸 때 생성, 결과는 실행 동안 메모)"""
+        if self._ids_resolver is None:
+            self._ids_resolver = IdsResolver(self.ids_map_expr)
+        return self._ids_resolver
+
+    def summary(self) -> str:
+        text = (
+            f"  → Unihan 전체: {len(self.unihan):,}자\n"
+            f"  → 학습 대상: {len(self.target):,}자 (scale={self.scale})\n"
+            f"  → IDS 분해: {len(self.ids_map_expr):,}자"
+        )
+        if isinstance(self.unihan, UnihanStore):
+            text += "\n" + self.unihan.memory_report()
+        return text
@@ -0,0 +1,333 @@
+"""
+delta.py — 증분(delta) ETL: 원본 행과 DB 현재 상태를 비교해 바뀐 행만 기록
+Phase 1 ETL 파이프라인 컴포넌트
+
+테이블마다 원본(Corpus) 행과 DB 행을 자연 키로 맞춰 보고, 비교 컬럼의 지문(fingerprint)이
+다르면 update, DB에 없으면 insert, 원본에 없으면 delete로 분류한다.
+- characters는 char, phonetic_classes는 code 기준 (id가 바뀐 옛 행도 update로 맞춰짐)
+- 하위 테이블의 DB 행은 character_id / phonetic_class_id를 같은 char / code의 원본 id로 바꿔
+  비교한다 (characters 갱신이 CASCADE된 뒤의 상태) — id 전환 후 첫 실행에도 옛 id 행이 맞춰짐
+- readings는 (character_id, type, value)로 맞추고 id로 삭제
+- readings / decompositions / character_phonetic_class / component_index의 delete는
+  이번 원본에 있는 글자의 행만 대상 — 예전 재실행으로 쌓인 중복 readings도 여기서 정리
+- characters / phonetic_classes의 delete는 prune=True일 때만
+  (meaning_senses 등 큐레이션 데이터가 CASCADE로 함께 삭제되므로)
+
+사용법:
+    deltas = compute_deltas(supabase, corpus)
+    print(format_delta_report(deltas))   # dry-run 리포트
+    apply_deltas(supabase, deltas)
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.corpus import Corpus
+from scripts.etl.id_resolver import IdResolver
+from scripts.etl.load_db import (
+    LOAD_DAG,
+    READINGS_CONFLICT,
+    iter_character_rows,
+    iter_phonetic_class_rows,
+    iter_reading_rows,
+    iter_phonetic_link_rows,
+    iter_decomposition_rows,
+    iter_component_index_rows,
+    iter_phonetic_series_rows,
+    make_id_resolvers,
+    run_dag,
+)
+from scripts.etl.upserter import BatchUpserter, MAX_IN_FLIGHT
+from scripts.etl.bulk_reader import BulkReader, READ_PARALLEL
+from scripts.etl.write_control import INITIAL_BATCH_BYTES
+
+SAMPLE_SIZE = 3  # 리포트에 보여줄 변경 예시 수 (종류별)
+REBASE_COLUMNS = ("character_id", "phonetic_class_id")  # 원본 id로 맞출 FK 컬럼
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    table: str
+    key_columns: tuple[str, ...]     # 원본/DB 행을 맞추는 자연 키
+    columns: tuple[str, ...]         # 지문 대상 컬럼 (키 포함)
+    on_conflict: str | None          # upsert 충돌 키 (None이면 PK)
+    rows: Callable[[Corpus, dict[str, IdResolver]], Iterable[dict]]
+    owns_children: bool = False      # True면 원본 글자 범위 밖 delete는 prune일 때만
+    scope: Callable[[dict], bool] | None = None  # ETL이 관리하는 DB 행인지 (readings.type 등)
+    delete_key: tuple[str, ...] | None = None    # 삭제 키 (None이면 key_columns)
+
+
+TABLE_SPECS: dict[str, TableSpec] = {
+    "characters": TableSpec(
+        "characters", ("char",),
+        ("id", "char", "codepoint", "strokes", "radical", "unihan_def"),
+        "char",
+        lambda corpus, resolvers: iter_character_rows(corpus),
+        owns_children=True,
+    ),
+    "phonetic_classes": TableSpec(
+        "phonetic_classes", ("code",), ("id", "code"), "code",
+        lambda corpus, resolvers: iter_phonetic_class_rows(corpus),
+        owns_children=True,
+    ),
+    "readings": TableSpec(
+        "readings", ("character_id", "type", "value"),
+        ("id", "character_id", "type", "value", "is_primary"),
+        READINGS_CONFLICT,
+        lambda corpus, resolvers: iter_reading_rows(corpus, resolvers["characters"]),
+        scope=lambda row: row.get("type") == "kHangul",
+        delete_key=("id",),
+    ),
+    "decompositions": TableSpec(
+        "decompositions", ("character_id",),
+        ("character_id", "ids", "components", "confidence", "tree", "depth", "primitives"),
+        "character_id",
+        lambda corpus, resolvers: iter_decomposition_rows(corpus, resolvers["characters"]),
+    ),
+    "character_phonetic_class": TableSpec(
+        "character_phonetic_class", ("character_id", "phonetic_class_id"),
+        ("character_id", "phonetic_class_id"), None,
+        lambda corpus, resolvers: iter_phonetic_link_rows(
+            corpus, resolvers["characters"], resolvers["phonetic_classes"]
+        ),
+    ),
+    "component_index": TableSpec(
+        "component_index", ("character_id", "component"),
+        (
+            "character_id", "component", "char", "position", "operator",
+            "transitive", "via", "strokes", "frequency", "codepoint",
+        ),
+        None,
+        lambda corpus, resolvers: iter_component_index_rows(corpus, resolvers["characters"]),
+    ),
+    "phonetic_series": TableSpec(
+        "phonetic_series", ("phonetic_class_id",),
+        (
+            "phonetic_class_id", "code", "root", "main_reading", "consistency",
+            "member_count", "readings", "members",
+        ),
+        None,
+        lambda corpus, resolvers: iter_phonetic_series_rows(corpus, resolvers["characters"]),
+    ),
+}
+
+
+def row_fingerprint(row: dict, columns: tuple[str, ...]) -> str:
+    """비교 컬럼 값의 정규화된 JSON → 16자리 해시 (JSONB는 객체 키 순서를 바꾸므로 키 정렬)"""
+    payload = json.dumps(
+        [row.get(c) for c in columns], ensure_ascii=False, separators=(",", ":"), sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class TableDelta:
+    spec: TableSpec
+    inserts: list[dict] = field(default_factory=list)
+    updates: list[tuple[dict, dict]] = field(default_factory=list)  # (원본 행, DB 행)
+    deletes: list[dict] = field(default_factory=list)               # DB 행
+    unchanged: int = 0
+    kept: int = 0  # 원본에 없지만 prune이 꺼져 있어 남겨 둔 행
+
+    @property
+    def table(self) -> str:
+        return self.spec.table
+
+    @property
+    def changed(self) -> int:
+        return len(self.inserts) + len(self.updates) + len(self.deletes)
+
+    def upsert_rows(self) -> list[dict]:
+        return self.inserts + [src for src, _ in self.updates]
+
+    def delete_keys(self) -> list[dict]:
+        columns = self.spec.delete_key or self.spec.key_columns
+        return [{c: row[c] for c in columns} for row in self.deletes]
+
+
+def id_rebase(
+    spec: TableSpec,
+    source_rows: Iterable[dict],
+    db_rows: Iterable[dict],
+) -> dict[str, str]:
+    """자연 키가 같은 DB 행의 옛 id → 원본 id (id가 다른 행만)"""
+    source_ids = {tuple(row[c] for c in spec.key_columns): row["id"] for row in source_rows}
+    rebase: dict[str, str] = {}
+    for row in db_rows:
+        new_id = source_ids.get(tuple(row.get(c) for c in spec.key_columns))
+        if new_id is not None and new_id != row["id"]:
+            rebase[row["id"]] = new_id
+    return rebase
+
+
+def rebase_row(row: dict, rebase: dict[str, str]) -> dict:
+    """DB 행의 FK를 원본 id로 — characters / phonetic_classes 갱신이 CASCADE된 뒤의 값"""
+    changed = {c: rebase[row[c]] for c in REBASE_COLUMNS if row.get(c) in rebase}
+    return {**row, **changed} if changed else row
+
+
+def diff_table(
+    spec: TableSpec,
+    source_rows: Iterable[dict],
+    db_rows: Iterable[dict],
+    char_ids: set[str],
+    prune: bool = False,
+) -> TableDelta:
+    """원본 행과 DB 행을 키로 맞춰 insert / update / delete 분류"""
+    delta = TableDelta(spec)
+
+    def key_of(row: dict) -> tuple:
+        return tuple(row.get(c) for c in spec.key_columns)
+
+    db_by_key: dict[tuple, dict] = {}
+    duplicates: list[dict] = []  # 같은 키의 DB 행이 여럿 (옛 id 행이 남은 경우, delete_key로만 구분 가능)
+    for row in db_rows:
+        if spec.scope is None or spec.scope(row):
+            previous = db_by_key.get(key_of(row))
+            if previous is not None and spec.delete_key is not None:
+                duplicates.append(previous)
+            db_by_key[key_of(row)] = row
+
+    for row in source_rows:
+        existing = db_by_key.pop(key_of(row), None)
+        if existing is None:
+            delta.inserts.append(row)
+        elif row_fingerprint(row, spec.columns) != row_fingerprint(existing, spec.columns):
+            delta.updates.append((row, existing))
+        else:
+            delta.unchanged += 1
+
+    # 남은 DB 행 = 원본에 없는 행
+    for row in [*db_by_key.values(), *duplicates]:
+        if spec.owns_children:
+            in_scope = prune
+        else:
+            in_scope = row.get("character_id") in char_ids
+        if in_scope:
+            delta.deletes.append(row)
+        else:
+            delta.kept += 1
+    return delta
+
+
+def compute_deltas(
+    supabase: Any,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver] | None = None,
+    prune: bool = False,
+) -> dict[str, TableDelta]:
+    """전체 테이블의 delta 계산 (DB는 읽기만 함)"""
+    resolvers = resolvers or make_id_resolvers(supabase, corpus)
+    reader = BulkReader(supabase, parallel=READ_PARALLEL)
+    char_ids = {row["id"] for row in iter_character_rows(corpus)}
+    rebase: dict[str, str] = {}  # characters / phonetic_classes의 DB id → 원본 id
+    deltas: dict[str, TableDelta] = {}
+    for name, spec in TABLE_SPECS.items():
+        db_rows = reader.fetch_all(spec.table, ",".join(spec.columns))
+        source_rows = spec.rows(corpus, resolvers)
+        if spec.owns_children:
+            source_rows = list(source_rows)
+            rebase.update(id_rebase(spec, source_rows, db_rows))
+        elif rebase:
+            db_rows = [rebase_row(row, rebase) for row in db_rows]
+        deltas[name] = diff_table(spec, source_rows, db_rows, char_ids, prune)
+        print(
+            f"  [delta] {name}: DB {len(db_rows):,}행 비교 → "
+            f"변경 {deltas[name].changed:,} / 동일 {deltas[name].unchanged:,}"
+        )
+    return deltas
+
+
+def _short(value: Any, limit: int = 40) -> str:
+    text = json.dumps(value, ensure_ascii=False) if not isinstance(value, str) else value
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def format_delta_report(deltas: dict[str, TableDelta]) -> str:
+    """테이블별 insert / update / delete 수 + 변경 예시"""
+    lines = [
+        f"  {'테이블':<26}{'insert':>8}{'update':>8}{'delete':>8}{'동일':>8}",
+        "  " + "-" * 58,
+    ]
+    for delta in deltas.values():
+        lines.append(
+            f"  {delta.table:<26}{len(delta.inserts):>8,}{len(delta.updates):>8,}"
+            f"{len(delta.deletes):>8,}{delta.unchanged:>8,}"
+        )
+    total = sum(d.changed for d in deltas.values())
+    lines.append(f"  → 변경 합계 {total:,}행" + (" (변경 없음)" if total == 0 else ""))
+
+    for delta in deltas.values():
+        key_columns = delta.spec.key_columns
+
+        def key_text(row: dict) -> str:
+            return ",".join(_short(row.get(c), 12) for c in key_columns)
+
+        for row in delta.inserts[:SAMPLE_SIZE]:
+            lines.append(f"    + {delta.table}[{key_text(row)}]")
+        for src, old in delta.updates[:SAMPLE_SIZE]:
+            changed = [
+                f"{c}: {_short(old.get(c))} → {_short(src.get(c))}"
+                for c in delta.spec.columns if src.get(c) != old.get(c)
+            ]
+            lines.append(f"    ~ {delta.table}[{key_text(src)}] {'; '.join(changed)}")
+        for row in delta.deletes[:SAMPLE_SIZE]:
+            lines.append(f"    - {delta.table}[{key_text(row)}]")
+        if delta.kept:
+            lines.append(f"    ! {delta.table}: 원본에 없는 {delta.kept:,}행 유지 (--prune으로 삭제)")
+    return "\n".join(lines)
+
+
+async def apply_deltas_async(upserter: BatchUpserter, deltas: dict[str, TableDelta]) -> None:
+    """LOAD_DAG 순서로 변경분 기록 — 테이블마다 upsert 후 delete"""
+
+    async def apply(delta: TableDelta) -> None:
+        rows = delta.upsert_rows()
+        if rows:
+            await upserter.upsert(
+                delta.table, rows, on_conflict=delta.spec.on_conflict, total=len(rows),
+            )
+        if delta.deletes:
+            await upserter.delete(
+                delta.table, delta.spec.delete_key or delta.spec.key_columns, delta.delete_keys(),
+                total=len(delta.deletes),
+            )
+        print(
+            f"  {delta.table}: +{len(delta.inserts)} ~{len(delta.updates)} "
+            f"-{len(delta.deletes)} 반영 완료"
+        )
+
+    # 변경 없는 테이블은 건너뛰고, 선행 관계는 남은 테이블끼리만 유지
+    changed = {name for name, delta in deltas.items() if delta.changed}
+    await run_dag({
+        name: (
+            tuple(dep for dep in deps if dep in changed),
+            lambda delta=deltas[name]: apply(delta),
+        )
+        for name, (deps, _) in LOAD_DAG.items()
+        if name in changed
+    })
+
+
+def apply_deltas(
+    supabase: Any,
+    deltas: dict[str, TableDelta],
+    max_in_flight: int = MAX_IN_FLIGHT,
+    batch_bytes: int = INITIAL_BATCH_BYTES,
+) -> None:
+    """동기 진입점 — 변경분이 없으면 DB에 쓰지 않음"""
+    if not any(d.changed for d in deltas.values()):
+        print("  변경 없음 — 기록할 행이 없습니다")
+        return
+    upserter = BatchUpserter(supabase, max_in_flight=max_in_flight, batch_bytes=batch_bytes)
+    try:
+        asyncio.run(apply_deltas_async(upserter, deltas))
+    finally:
+        upserter.close()
+        print(upserter.controller.summary())
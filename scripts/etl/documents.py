@@ -0,0 +1,315 @@
+"""
+documents.py — 글자별 상세 문서(character_documents) 생성
+Phase 1 ETL 파이프라인 컴포넌트
+
+/hanja/[char] 한 페이지가 characters / readings / decompositions / phonetic_series /
+meaning_senses / meaning_edges / character_details 를 따로 읽던 것을
+글자마다 미리 조립한 JSONB 문서 하나(char PK 조회 한 번)로 대체한다.
+- ETL 원본(Corpus)에서: 글자 정보, kHangul 음, IDS 분해, 음 계열 요약
+- DB 큐레이션 데이터에서: kHangul 외 음, 의미 트리, 字形 解說, 부수 정보, 급수
+- 문서 지문(doc_hash)이 DB와 같으면 다시 쓰지 않음 (증분 갱신)
+- 다시 쓰는 글자는 검색어(search_terms, search_index.py)도 문서에서 뽑아 통째로 교체
+- 큐레이션 테이블이 바뀌면 DB 트리거가 해당 글자 문서를 지우고 (010_character_documents.sql)
+  프론트는 정규화 테이블 조회로 대체 — 다음 ETL 실행 / 이 스크립트가 다시 만든다
+
+사용법:
+    python documents.py               # Supabase의 문서를 원본 + 큐레이션 데이터로 갱신
+    python documents.py --scale hangul
+    stats = load_into(sink, corpus, resolvers, documents=DocumentBuilder(supabase))   # load_db
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.corpus import Corpus
+from scripts.etl.id_resolver import IdResolver
+from scripts.etl.ids_tree import IdsResolver
+from scripts.etl.parse_unihan import SCALES
+from scripts.etl.load_db import (
+    DATA_DIR,
+    DB_SCHEMA,
+    get_supabase_client,
+    make_id_resolvers,
+    iter_character_rows,
+    iter_reading_rows,
+    iter_decomposition_rows,
+    iter_phonetic_series_rows,
+)
+from scripts.etl.search_index import iter_search_term_rows
+from scripts.etl.sinks import Sink, UpsertResult
+from scripts.etl.upserter import BatchUpserter
+from scripts.etl.bulk_reader import BulkReader, READ_PARALLEL
+from scripts.etl.instrument import stage
+
+# 문서 구조가 바뀌면 올림 — 지문이 모두 달라져 다음 실행에서 전체가 다시 쓰인다
+DOCUMENT_VERSION = 1
+
+
+@dataclass
+class CuratedData:
+    """ETL 원본에 없는 큐레이션 데이터 (character_id별)"""
+
+    details: dict[str, dict] = field(default_factory=dict)        # character_details
+    radicals: dict[str, dict] = field(default_factory=dict)       # radical_details
+    senses: dict[str, list[dict]] = field(default_factory=dict)   # meaning_senses
+    edges: dict[str, list[dict]] = field(default_factory=dict)    # meaning_edges
+    readings: dict[str, list[dict]] = field(default_factory=dict) # kHangul 외 readings
+    grade_levels: dict[str, int] = field(default_factory=dict)    # characters.grade_level
+
+    @classmethod
+    def fetch(cls, supabase: Any) -> "CuratedData":
+        """큐레이션 테이블 전체 조회 (keyset 페이지네이션)"""
+        reader = BulkReader(supabase, DB_SCHEMA, parallel=READ_PARALLEL)
+        curated = cls()
+
+        def group(table: str, columns: str = "*", filters: tuple = ()) -> dict[str, list[dict]]:
+            grouped: dict[str, list[dict]] = {}
+            for row in reader.iter_rows(table, columns, filters=filters):
+                grouped.setdefault(row["character_id"], []).append(row)
+            return grouped
+
+        curated.details = {
+            row["character_id"]: row for row in reader.iter_rows("character_details")
+        }
+        curated.radicals = {
+            row["character_id"]: row for row in reader.iter_rows("radical_details")
+        }
+        curated.senses = group("meaning_senses")
+        curated.edges = group("meaning_edges")
+        curated.readings = group(
+            "readings", "id,character_id,type,value,is_primary",
+            filters=(("type", "neq", "kHangul"),),
+        )
+        curated.grade_levels = {
+            row["id"]: row["grade_level"]
+            for row in reader.iter_rows(
+                "characters", "id,grade_level", filters=(("grade_level", "not.is", "null"),),
+            )
+        }
+        print(
+            f"  [documents] 큐레이션: 解說 {len(curated.details):,}자, 부수 {len(curated.radicals):,}자, "
+            f"의미 트리 {len(curated.senses):,}자, 추가 음 {len(curated.readings):,}자 "
+            f"({reader.requests:,}회 조회)"
+        )
+        return curated
+
+
+def build_meaning_tree(senses: list[dict], edges: list[dict]) -> list[dict]:
+    """
+    의미(sense) + 관계(edge) → 트리 (queries.ts getMeaningTree와 같은 구성)
+    루트는 자식으로 등장하지 않는 의미, sort_order 순 — edge는 id 순으로 붙여 결과를 고정
+    """
+    if not senses:
+        return []
+    ordered = sorted(senses, key=lambda s: (s.get("sort_order") or 0, s["id"]))
+    nodes = {
+        s["id"]: {
+            "id": s["id"],
+            "label": s["label"],
+            "short_gloss": s.get("short_gloss"),
+            "example": s.get("example"),
+            "children": [],
+        }
+        for s in ordered
+    }
+    child_ids = set()
+    for edge in sorted(edges, key=lambda e: e["id"]):
+        child_ids.add(edge["child_sense_id"])
+        parent, child = nodes.get(edge["parent_sense_id"]), nodes.get(edge["child_sense_id"])
+        if parent is not None and child is not None:
+            child["relation"] = edge["relation"]
+            parent["children"].append(child)
+    return [nodes[s["id"]] for s in ordered if s["id"] not in child_ids]
+
+
+def document_hash(doc: dict) -> str:
+    """정규화된 JSON → 16자리 해시 (JSONB는 객체 키 순서를 바꾸므로 키 정렬)"""
+    payload = json.dumps(doc, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _details(row: dict | None) -> dict | None:
+    if row is None:
+        return None
+    return {
+        "explanation": row.get("explanation"),
+        "shuowen_chinese": row.get("shuowen_chinese"),
+        "shuowen_korean": row.get("shuowen_korean"),
+    }
+
+
+def iter_document_rows(
+    corpus: Corpus,
+    char_ids: IdResolver | dict[str, str],
+    curated: CuratedData | None = None,
+    ids_resolver: IdsResolver | None = None,
+) -> Iterator[dict]:
+    """
+    글자별 문서 행 (character_documents) — {char, character_id, doc, doc_hash}
+    doc 구조는 src/types/hanja.ts CharacterDocument 참고
+    """
+    curated = curated or CuratedData()
+    resolver = ids_resolver or corpus.ids_resolver
+
+    readings: dict[str, list[dict]] = {}
+    for row in iter_reading_rows(corpus, char_ids):
+        readings.setdefault(row["character_id"], []).append(row)
+    decompositions = {
+        row["character_id"]: row for row in iter_decomposition_rows(corpus, char_ids, resolver)
+    }
+    series_of: dict[str, dict] = {}
+    for series in iter_phonetic_series_rows(corpus, char_ids, resolver):
+        for member in series["members"]:
+            series_of[member["char"]] = series
+
+    for row in iter_character_rows(corpus):
+        char_id, char = row["id"], row["char"]
+        own_readings = sorted(
+            readings.get(char_id, []) + curated.readings.get(char_id, []),
+            key=lambda r: (not r["is_primary"], r["type"], r["value"], r["id"]),
+        )
+        series = series_of.get(char)
+        radical = curated.radicals.get(char_id)
+        doc = {
+            "version": DOCUMENT_VERSION,
+            "character": {
+                **row,
+                "grade_level": curated.grade_levels.get(char_id),
+                "readings": own_readings,
+                "decomposition": decompositions.get(char_id),
+            },
+            "phonetic": None if series is None else {
+                "phonetic_class_id": series["phonetic_class_id"],
+                "code": series["code"],
+                "root": series["root"],
+                "main_reading": series["main_reading"],
+                "consistency": series["consistency"],
+                "siblings": series["members"],
+            },
+            "meaning_tree": build_meaning_tree(
+                curated.senses.get(char_id, []), curated.edges.get(char_id, []),
+            ),
+            "details": _details(curated.details.get(char_id)),
+            "radical": None if radical is None else {
+                k: v for k, v in radical.items() if k != "character_id"
+            },
+        }
+        yield {"char": char, "character_id": char_id, "doc": doc, "doc_hash": document_hash(doc)}
+
+
+class DocumentBuilder:
+    """
+    character_documents + search_terms 적재 작업 — load_db.load_into(documents=...)로
+    LOAD_DAG 끝에 붙거나 refresh_documents()로 따로 실행한다.
+    supabase가 있으면 작업 시작 시점에 큐레이션 데이터와 기존 지문을 읽어, 지문이 같은 문서는 건너뛴다.
+    없으면 (로컬 sink) 큐레이션 데이터 없이 전체를 쓴다.
+    검색어를 먼저 교체하고 문서를 쓴다 — 중간에 실패해도 지문이 옛 값이라 다음 실행이 다시 교체한다.
+    """
+
+    name = "character_documents"
+    # 문서에 들어가는 ETL 테이블 — 하나라도 실패하면 문서를 만들지 않음
+    deps = ("characters", "readings", "decompositions", "phonetic_series")
+
+    def __init__(self, supabase: Any = None) -> None:
+        self.supabase = supabase
+        self.written = 0
+        self.unchanged = 0
+
+    def known_hashes(self) -> dict[str, str]:
+        if self.supabase is None:
+            return {}
+        reader = BulkReader(self.supabase, DB_SCHEMA, parallel=READ_PARALLEL)
+        return {
+            row["char"]: row["doc_hash"]
+            for row in reader.iter_rows("character_documents", "char,doc_hash")
+        }
+
+    async def load(
+        self,
+        sink: Sink,
+        corpus: Corpus,
+        resolvers: dict[str, IdResolver],
+    ) -> UpsertResult:
+        if self.supabase is not None:
+            curated = await asyncio.to_thread(CuratedData.fetch, self.supabase)
+            known = await asyncio.to_thread(self.known_hashes)
+        else:
+            curated, known = CuratedData(), {}
+
+        # 지문 비교 — 바뀐 글자의 문서 행과 검색어만 남김
+        changed: list[dict] = []
+        terms: list[dict] = []
+        for row in iter_document_rows(corpus, resolvers["characters"], curated):
+            if known.get(row["char"]) == row["doc_hash"]:
+                self.unchanged += 1
+                continue
+            changed.append(row)
+            terms.extend(iter_search_term_rows(row["doc"]))
+        self.written = len(changed)
+
+        result = UpsertResult("character_documents")
+        if changed:
+            await self.replace_search_terms(sink, [row["character_id"] for row in changed], terms)
+            result = await sink.upsert(
+                "character_documents", changed, on_conflict="char", total=len(changed),
+            )
+        print(
+            f"  character_documents: {result.rows}개 적재 완료"
+            + (f" (지문 동일 {self.unchanged:,}개 건너뜀)" if self.unchanged else "")
+        )
+        return result
+
+    async def replace_search_terms(self, sink: Sink, character_ids: list[str], terms: list[dict]) -> None:
+        """글자별 검색어 통째 교체 — 기존 행 삭제 후 upsert (copy sink는 병합 시 삭제 조건으로 정리)"""
+        if sink.name != "copy":
+            await sink.delete(
+                "search_terms", ("character_id",),
+                ({"character_id": char_id} for char_id in character_ids), total=len(character_ids),
+            )
+        result = await sink.upsert("search_terms", terms, total=len(terms))
+        print(f"  search_terms: {len(character_ids):,}자 {result.rows:,}개 적재 완료")
+
+
+def refresh_documents(supabase: Any, corpus: Corpus, resolvers: dict[str, IdResolver] | None = None) -> None:
+    """
+    Supabase REST로 문서만 갱신 (--delta 이후, 큐레이션 데이터 수정 후)
+    바뀐 문서만 쓰므로 변경이 없으면 조회만 한다.
+    """
+    resolvers = resolvers or make_id_resolvers(supabase, corpus)
+    upserter = BatchUpserter(supabase)
+    builder = DocumentBuilder(supabase)
+    try:
+        with stage("documents.refresh") as s:
+            asyncio.run(builder.load(upserter, corpus, resolvers))
+            s.rows_out = builder.written
+    finally:
+        upserter.close()
+        print(upserter.controller.summary())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="글자별 상세 문서(character_documents) 갱신")
+    parser.add_argument("--scale", choices=SCALES, default="default", help="대상 규모 (run_etl.py와 같게)")
+    args = parser.parse_args()
+
+    print("[documents] 글자별 상세 문서 갱신\n")
+    supabase = get_supabase_client()
+
+    print("[1/2] 데이터 파싱 중...")
+    corpus = Corpus.load(DATA_DIR / "Unihan.zip", DATA_DIR / "ids.txt", scale=args.scale)
+    print(f"  → 대상: {len(corpus.target)}자\n")
+
+    print("[2/2] 문서 갱신 중...")
+    refresh_documents(supabase, corpus)
+    print("\n[완료] character_documents 갱신 완료!")
+
+
+if __name__ == "__main__":
+    main()
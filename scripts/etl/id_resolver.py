@@ -0,0 +1,70 @@
+"""
+id_resolver.py — 적재 중 키 → id 조회 캐시
+Phase 1 ETL 파이프라인 컴포넌트
+
+characters / phonetic_classes upsert 응답으로 받은 (key, id)를 기억해 두고,
+이후 readings / character_phonetic_class / decompositions 적재 시 재사용한다.
+캐시에 없는 키가 처음 나올 때만 테이블 전체 조회로 보충한다.
+
+사용법:
+    resolver = IdResolver("characters", "char", fetch=lambda: reader.iter_rows(...))
+    resolver.record(resp.data)     # upsert 응답 행
+    resolver.get("清")             # → UUID 문자열 또는 None
+    print(resolver.stats())
+"""
+
+from typing import Callable, Iterable
+
+
+class IdResolver:
+    def __init__(
+        self,
+        table: str,
+        key_column: str,
+        fetch: Callable[[], Iterable[dict]],
+        id_column: str = "id",
+    ) -> None:
+        self.table = table
+        self.key_column = key_column
+        self.id_column = id_column
+        self._fetch = fetch
+        self._ids: dict[str, str] = {}
+        self._fetched = False
+        self.hits = 0
+        self.misses = 0
+        self.fallback_fetches = 0
+
+    def record(self, rows: Iterable[dict] | None) -> None:
+        """upsert/select 응답 행에서 (key, id)를 캐시에 추가"""
+        if not rows:
+            return
+        for row in rows:
+            key = row.get(self.key_column)
+            row_id = row.get(self.id_column)
+            if key is not None and row_id is not None:
+                self._ids[key] = row_id
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        row_id = self._ids.get(key)
+        if row_id is not None:
+            self.hits += 1
+            return row_id
+
+        self.misses += 1
+        # 응답으로 채우지 못한 키 — 전체 조회는 실행당 한 번만
+        if not self._fetched:
+            self._fetched = True
+            self.fallback_fetches += 1
+            print(f"  [id] {self.table}: '{key}' 캐시 미스 → 전체 조회로 보충")
+            self.record(self._fetch())
+            row_id = self._ids.get(key)
+        return row_id if row_id is not None else default
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def stats(self) -> str:
+        return (
+            f"{self.table}.{self.key_column}: 캐시 {len(self._ids):,}개, "
+            f"적중 {self.hits:,} / 미스 {self.misses:,}, 전체 조회 {self.fallback_fetches}회"
+        )
@@ -0,0 +1,260 @@
+"""
+ids_tree.py — IDS 구조 트리 파서 + 재귀 분해(원자 부품까지) 해석기
+Phase 1 ETL 파이프라인 컴포넌트
+
+extract_components()는 연산자를 버리고 리프만 펼치므로 '⿱⿰木木一'과 '⿰木⿱木一'이
+같아지고, 부품 자체가 다시 분해되는 경우도 따라가지 않는다.
+여기서는 연산자 인자 수(arity)에 맞춰 트리를 만들고, 부품을 재귀로 펼쳐
+더 이상 분해되지 않는 원자 부품(primitive)까지 내려간다.
+
+트리 JSON (decompositions.tree):
+    리프 = 문자열, 노드 = [연산자, 자식, 자식(, 자식)]
+    '⿱⿰木木一' → ['⿱', ['⿰', '木', '木'], '一']
+
+- 해석 결과(깊이, 원자 부품 집합)는 글자별로 메모이제이션 — 전체 규모에서도 부품당 1회 계산
+- 순환(A → … → A)에 속한 글자는 원자로, MAX_DEPTH에 닿은 부품은 그 지점에서 멈춘다
+- 트리를 파싱할 수 없는 표현은 tree=None, 부품은 extract_components() 결과로 대신 펼친다
+
+사용법:
+    resolver = IdsResolver(ids_map_expr)
+    resolver.tree("清")        # ['⿰', '氵', '青']
+    resolver.resolve("清")     # Resolution(depth=3, primitives=(...))
+"""
+
+from dataclasses import dataclass
+from typing import Union
+
+# 연산자 → 자식 수 (Unicode 15.1의 ⿼⿽⿾⿿㇯ 포함)
+IDS_ARITY = {
+    "⿰": 2, "⿱": 2, "⿴": 2, "⿵": 2, "⿶": 2, "⿷": 2,
+    "⿸": 2, "⿹": 2, "⿺": 2, "⿻": 2, "⿼": 2, "⿽": 2, "㇯": 2,
+    "⿲": 3, "⿳": 3,
+    "⿾": 1, "⿿": 1,
+}
+# 미상 부품 표시 — 트리에는 남기고 원자 부품에서는 뺌
+IDS_PLACEHOLDERS = frozenset("〓？?")
+MAX_DEPTH = 16  # 재귀 분해 최대 단계 (실제 IDS는 10단계 미만)
+
+IdsTree = Union[str, list]
+
+
+class IdsSyntaxError(ValueError):
+    pass
+
+
+def _tokenize(ids_expr: str) -> list[str]:
+    """
+    연산자 / 글자 / 엔티티(&CDP-8B7C;) 단위로 분리
+    지역 표시([GTJ])와 이체자 선택자(VS)는 버림
+    """
+    tokens: list[str] = []
+    i, n = 0, len(ids_expr)
+    while i < n:
+        ch = ids_expr[i]
+        if ch == "&":
+            end = ids_expr.find(";", i)
+            if end < 0:
+                raise IdsSyntaxError(f"닫히지 않은 엔티티: {ids_expr!r}")
+            tokens.append(ids_expr[i:end + 1])
+            i = end + 1
+            continue
+        if ch == "[":
+            break
+        cp = ord(ch)
+        if not (ch.isspace() or 0xFE00 <= cp <= 0xFE0F or 0xE0100 <= cp <= 0xE01EF):
+            tokens.append(ch)
+        i += 1
+    return tokens
+
+
+def parse_ids_tree(ids_expr: str) -> IdsTree:
+    """
+    IDS 표현 → 트리 (전위 표기, 연산자 인자 수 기준)
+    '⿰木⿱木一' → ['⿰', '木', ['⿱', '木', '一']]
+    """
+    tokens = _tokenize(ids_expr)
+    pos = 0
+
+    def node() -> IdsTree:
+        nonlocal pos
+        if pos >= len(tokens):
+            raise IdsSyntaxError(f"부품 부족: {ids_expr!r}")
+        token = tokens[pos]
+        pos += 1
+        arity = IDS_ARITY.get(token)
+        if arity is None:
+            return token
+        return [token, *(node() for _ in range(arity))]
+
+    tree = node()
+    if pos != len(tokens):
+        raise IdsSyntaxError(f"남는 부품 {len(tokens) - pos}개: {ids_expr!r}")
+    return tree
+
+
+def tree_leaves(tree: IdsTree) -> list[str]:
+    """트리의 리프 (왼쪽부터)"""
+    if isinstance(tree, str):
+        return [tree]
+    leaves: list[str] = []
+    for child in tree[1:]:
+        leaves.extend(tree_leaves(child))
+    return leaves
+
+
+def tree_positions(tree: IdsTree) -> list[tuple[str, int, str | None]]:
+    """
+    리프별 (리프, 위치, 바로 위 연산자) — 위치는 왼쪽부터 0, 1, …
+    '⿰木⿱木一' → [('木', 0, '⿰'), ('木', 1, '⿱'), ('一', 2, '⿱')]
+    """
+    result: list[tuple[str, int, str | None]] = []
+
+    def walk(node: IdsTree, operator: str | None) -> None:
+        if isinstance(node, str):
+            result.append((node, len(result), operator))
+            return
+        for child in node[1:]:
+            walk(child, node[0])
+
+    walk(tree, None)
+    return result
+
+
+def is_component(token: str) -> bool:
+    """원자 부품으로 셀 수 있는 리프인지 (엔티티 / 미상 표시 제외)"""
+    return len(token) == 1 and token not in IDS_PLACEHOLDERS
+
+
+@dataclass(frozen=True)
+class Resolution:
+    depth: int                   # 원자 부품까지의 분해 단계 (원자 자신은 0)
+    primitives: tuple[str, ...]  # 원자 부품 (codepoint 순, 중복 없음)
+    components: tuple[str, ...] = ()  # 모든 단계의 부품 (primitives 포함, codepoint 순)
+
+
+def _primitive(char: str) -> Resolution:
+    return Resolution(0, (char,))
+
+
+class IdsResolver:
+    """
+    ids_map_expr(parse_ids_with_expr 결과) 위의 트리 파싱 + 재귀 분해 (둘 다 메모이제이션)
+    한 번 만든 객체를 실행 동안 공유한다 (스트리밍 묶음 사이에서도).
+    """
+
+    def __init__(self, ids_map_expr: dict[str, dict], max_depth: int = MAX_DEPTH) -> None:
+        self.ids_map_expr = ids_map_expr
+        self.max_depth = max_depth
+        self._trees: dict[str, IdsTree | None] = {}
+        self._resolved: dict[str, Resolution] = {}
+        self.syntax_errors = 0
+        self.truncated = 0  # 순환에 속한 글자 / 깊이 제한으로 멈춘 횟수
+
+    def tree(self, char: str) -> IdsTree | None:
+        """글자의 IDS 트리 (분해 데이터가 없거나 파싱 실패면 None)"""
+        if char in self._trees:
+            return self._trees[char]
+        data = self.ids_map_expr.get(char)
+        tree = None
+        if data is not None:
+            try:
+                tree = parse_ids_tree(data["ids_expr"])
+            except IdsSyntaxError:
+                self.syntax_errors += 1
+        self._trees[char] = tree
+        return tree
+
+    def direct_components(self, char: str) -> list[tuple[str, int, str | None]]:
+        """
+        한 단계 아래 부품의 (부품, 위치, 바로 위 연산자) — 자기 자신 / 엔티티 제외
+        트리가 없으면 extract_components() 결과 순서를 위치로, 연산자는 None
+        """
+        tree = self.tree(char)
+        if tree is not None:
+            leaves = tree_positions(tree)
+        else:
+            components = self.ids_map_expr.get(char, {}).get("components", [])
+            leaves = [(leaf, i, None) for i, leaf in enumerate(components)]
+        return [entry for entry in leaves if is_component(entry[0]) and entry[0] != char]
+
+    def _children(self, char: str) -> list[str]:
+        return [leaf for leaf, _, _ in self.direct_components(char)]
+
+    def resolve(self, char: str) -> Resolution:
+        """원자 부품까지 재귀로 펼친 결과"""
+        if char not in self._resolved:
+            self._resolve_from(char)
+        return self._resolved[char]
+
+    def _resolve_from(self, root: str) -> None:
+        """
+        root에서 닿는 미해석 글자를 강연결요소(Tarjan, 반복형) 단위로 해석
+        요소는 하위부터 나오므로 요소를 닫을 때 바깥 부품은 이미 해석되어 있다.
+        순환 여부가 탐색 순서와 무관하게 정해져 결과가 결정적이다 (스트리밍 / 단계별 실행 동일).
+        """
+        index: dict[str, int] = {root: 0}
+        low: dict[str, int] = {root: 0}
+        stack = [root]
+        on_stack = {root}
+        work = [(root, iter(self._children(root)))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child in self._resolved:
+                    continue
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(self._children(child))))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.append(member)
+                        if member == node:
+                            break
+                    self._close(members)
+
+    def _close(self, members: list[str]) -> None:
+        if len(members) > 1:
+            # 순환 (A → … → A) — 순환에 속한 글자는 원자로 봄
+            self.truncated += len(members)
+            for member in members:
+                self._resolved[member] = _primitive(member)
+            return
+
+        char = members[0]
+        children = self._children(char)
+        if not children:
+            self._resolved[char] = _primitive(char)
+            return
+        depth = 0
+        primitives: set[str] = set()
+        components: set[str] = set()
+        for child in children:
+            sub = self._resolved[child]
+            if sub.depth >= self.max_depth:
+                # 하위 결과가 이미 최대 깊이 — 그 부품에서 멈춤
+                self.truncated += 1
+                sub = _primitive(child)
+            depth = max(depth, sub.depth)
+            primitives.update(sub.primitives)
+            components.add(child)
+            components.update(sub.components)
+        self._resolved[char] = Resolution(depth + 1, tuple(sorted(primitives)), tuple(sorted(components)))
+
+    def summary(self) -> str:
+        return (
+            f"  [ids] 트리 {len(self._trees):,}개 / 분해 {len(self._resolved):,}개 메모, "
+            f"파싱 실패 {self.syntax_errors}건, 순환·깊이 제한 {self.truncated}건"
+        )
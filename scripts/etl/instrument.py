@@ -0,0 +1,259 @@
+"""
+instrument.py — 단계별 계측 (벽시계 / CPU 시간, 메모리 최고치, 입출력 행, HTTP 요청·바이트)
+Phase 1 ETL 파이프라인 컴포넌트
+
+파이프라인 각 단계를 stage() 컨텍스트로 감싸면 실행 중인 RunReport에 기록된다.
+RunReport가 없으면 (모듈 단독 실행, 다른 스크립트에서 import) stage()는 아무것도 하지 않는다.
+
+- CPU 시간은 프로세스 전체 기준 — 동시에 도는 적재 단계끼리는 겹쳐서 잡힌다
+- 메모리는 단계가 끝난 시점의 프로세스 최대 RSS와 단계 중 증가분 (단계별 독립 최고치가 아님)
+- HTTP는 attach_http()로 훅을 건 클라이언트의 요청 수 / 요청 본문 바이트
+- profile_dir를 주면 단계마다 cProfile 덤프(<profile_dir>/<단계>.prof) — 겹치는 단계는 먼저 시작한 것만
+
+사용법:
+    report = RunReport.start()
+    with stage("parse.ids") as s:
+        ids_map = parse_ids_with_expr(path)
+        s.rows_out = len(ids_map)
+    print(report.table())
+    report.write_json(DATA_DIR / "etl_reports" / "run.json")
+"""
+
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import resource
+except ImportError:  # Windows — 메모리 열은 비워 둠
+    resource = None
+
+REPORT_VERSION = 1
+REPORT_DIR_NAME = "etl_reports"
+
+
+def _peak_rss() -> int | None:
+    """프로세스 최대 RSS (바이트)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux는 KB 단위
+
+
+class HttpCounter:
+    """httpx request 훅으로 요청 수 / 본문 바이트 누적 (요청 스레드 여러 개에서 호출)"""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+    def on_request(self, request: Any) -> None:
+        try:
+            size = len(request.content)
+        except Exception:  # 스트리밍 본문 — 크기 미상
+            size = 0
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+
+    def snapshot(self) -> tuple[int, int]:
+        with self._lock:
+            return self.requests, self.bytes_sent
+
+
+HTTP = HttpCounter()
+
+
+def attach_http(client: Any) -> None:
+    """postgrest 클라이언트(supabase.schema(...))의 httpx 세션에 요청 계수 훅을 건다"""
+    session = getattr(client, "session", None)
+    if session is None or not hasattr(session, "event_hooks"):
+        return
+    hooks = session.event_hooks
+    if HTTP.on_request not in hooks.get("request", []):
+        hooks["request"] = [*hooks.get("request", []), HTTP.on_request]
+        session.event_hooks = hooks
+
+
+@dataclass
+class StageMetrics:
+    name: str
+    start: float = 0.0                # 실행 시작 기준 시작 시각 (초)
+    wall: float = 0.0                 # 초
+    cpu: float = 0.0                  # 초 (프로세스 전체)
+    peak_rss: int | None = None       # 바이트 (단계 종료 시점의 프로세스 최대 RSS)
+    rss_growth: int | None = None     # 바이트 (단계 중 최대 RSS 증가분)
+    rows_in: int | None = None
+    rows_out: int | None = None
+    http_requests: int = 0
+    http_bytes: int = 0
+    profile: str | None = None        # cProfile 덤프 경로
+    error: str | None = None
+
+    @property
+    def rows_per_sec(self) -> float | None:
+        rows = self.rows_out if self.rows_out is not None else self.rows_in
+        if rows is None or self.wall <= 0:
+            return None
+        return rows / self.wall
+
+
+@dataclass
+class RunReport:
+    started_at: str
+    argv: list[str]
+    profile_dir: Path | None = None
+    stages: list[StageMetrics] = field(default_factory=list)
+    meta: dict[str, Any] = field(default_factory=dict)
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+    _profiling: bool = field(default=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def start(cls, profile_dir: Path | None = None, argv: list[str] | None = None) -> "RunReport":
+        """새 보고서를 만들어 현재 실행의 기록 대상으로 등록 (profile_dir가 있으면 단계별 cProfile)"""
+        global _current
+        report = cls(
+            started_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            argv=list(sys.argv if argv is None else argv),
+            profile_dir=profile_dir,
+        )
+        _current = report
+        return report
+
+    def finish(self) -> None:
+        global _current
+        if _current is self:
+            _current = None
+
+    def add(self, metrics: StageMetrics) -> None:
+        with self._lock:
+            self.stages.append(metrics)
+
+    def table(self) -> str:
+        """단계별 표 (시작 순서)"""
+        header = (
+            f"  {'단계':<34}{'wall(s)':>9}{'cpu(s)':>9}{'RSS(MB)':>9}{'+MB':>7}"
+            f"{'rows in':>10}{'rows out':>10}{'rows/s':>10}{'HTTP':>7}{'KB sent':>10}"
+        )
+        lines = [header, "  " + "-" * (len(header) - 2)]
+
+        def num(value: Any, fmt: str) -> str:
+            return "-" if value is None else format(value, fmt)
+
+        for s in sorted(self.stages, key=lambda s: s.start):
+            mb = lambda v: None if v is None else v / 1024 / 1024
+            lines.append(
+                f"  {s.name[:33]:<34}{s.wall:>9.2f}{s.cpu:>9.2f}"
+                f"{num(mb(s.peak_rss), '.0f'):>9}{num(mb(s.rss_growth), '.0f'):>7}"
+                f"{num(s.rows_in, ','):>10}{num(s.rows_out, ','):>10}"
+                f"{num(s.rows_per_sec, ',.0f'):>10}"
+                f"{s.http_requests or '-':>7}{num(s.http_bytes / 1024 if s.http_bytes else None, ',.0f'):>10}"
+                + (" FAIL" if s.error else "")
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": REPORT_VERSION,
+            "started_at": self.started_at,
+            "argv": self.argv,
+            "profile_dir": str(self.profile_dir) if self.profile_dir else None,
+            "meta": self.meta,
+            "stages": [
+                {**asdict(s), "rows_per_sec": s.rows_per_sec}
+                for s in sorted(self.stages, key=lambda s: s.start)
+            ],
+        }
+
+    def write_json(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+
+_current: RunReport | None = None
+
+
+def current_report() -> RunReport | None:
+    return _current
+
+
+def default_report_path(data_dir: Path) -> Path:
+    """data/etl_reports/run-YYYYmmdd-HHMMSS.json"""
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return data_dir / REPORT_DIR_NAME / f"run-{stamp}.json"
+
+
+def _profile_name(stage_name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", stage_name) + ".prof"
+
+
+class _NullStage:
+    """기록하지 않을 때 stage()가 돌려주는 객체 — 속성 대입만 받아 줌"""
+    rows_in = rows_out = None
+
+
+@contextmanager
+def stage(name: str, rows_in: int | None = None) -> Iterator[Any]:
+    """
+    단계 계측 — 블록 안에서 s.rows_in / s.rows_out을 채우면 함께 기록
+    예외가 나도 기록하고 (error 열) 예외는 그대로 전달한다.
+    """
+    report = _current
+    if report is None:
+        yield _NullStage()
+        return
+
+    metrics = StageMetrics(name, rows_in=rows_in)
+    profiler = None
+    if report.profile_dir is not None:
+        with report._lock:
+            # cProfile은 스레드당 하나만 활성화 가능 — 겹치는(동시 적재) 단계는 바깥 것만
+            if not report._profiling:
+                report._profiling = True
+                profiler = cProfile.Profile()
+    rss_before = _peak_rss()
+    requests_before, bytes_before = HTTP.snapshot()
+    wall_start = time.perf_counter()
+    metrics.start = wall_start - report._t0
+    cpu_start = time.process_time()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield metrics
+    except BaseException as e:
+        metrics.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        metrics.wall = time.perf_counter() - wall_start
+        metrics.cpu = time.process_time() - cpu_start
+        metrics.peak_rss = _peak_rss()
+        if metrics.peak_rss is not None and rss_before is not None:
+            metrics.rss_growth = metrics.peak_rss - rss_before
+        requests_after, bytes_after = HTTP.snapshot()
+        metrics.http_requests = requests_after - requests_before
+        metrics.http_bytes = bytes_after - bytes_before
+        if profiler is not None:
+            report.profile_dir.mkdir(parents=True, exist_ok=True)
+            path = report.profile_dir / _profile_name(name)
+            profiler.dump_stats(path)
+            metrics.profile = str(path)
+            with report._lock:
+                report._profiling = False
+        report.add(metrics)
+
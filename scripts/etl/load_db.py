@@ -8,12 +8,16 @@ Phase 1 ETL 파이프라인 컴포넌트
 환경변수 필요:
     SUPABASE_URL=https://xxx.supabase.co
     SUPABASE_SERVICE_KEY=eyJ...
+
+선택:
+    HANJA_ETL_COMPONENT_INDEX=direct   component_index에 직접 부품만 (기본: 간접 부품 포함)
 """
 
 import os
-import json
+import asyncio
+from collections import Counter
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterator
 
 from dotenv import load_dotenv
 
@@ -27,34 +31,48 @@ except ImportError:
 # ETL 모듈 임포트
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from scripts.etl.parse_unihan import parse_unihan, filter_target, cp_to_char
-from scripts.etl.parse_ids import parse_ids_with_expr
+from scripts.etl.corpus import Corpus
+from scripts.etl.id_resolver import IdResolver
+from scripts.etl.ids_tree import IdsResolver
+from scripts.etl.stable_ids import character_id, phonetic_class_id, reading_id
+from scripts.etl.upserter import BatchUpserter, MAX_IN_FLIGHT
+from scripts.etl.sinks import Sink, UpsertResult
+from scripts.etl.instrument import stage
+from scripts.etl.bulk_reader import BulkReader, READ_PARALLEL
+from scripts.etl.write_control import INITIAL_BATCH_BYTES
+from scripts.etl.checkpoint import LoadCheckpoint
 
 
 # 프로젝트 루트의 data/ 폴더 (hanja-app/ 상위)
 DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
-BATCH_SIZE = 100  # Supabase upsert 배치 크기
-PAGE_SIZE = 1000  # Supabase select 페이지네이션 크기
 DB_SCHEMA = "hanja"  # 별도 스키마 사용 (기존 public과 격리)
-
-
-def fetch_all_rows(supabase: "Client", table: str, columns: str) -> list[dict]:
-    """Supabase 기본 1,000행 제한을 우회하여 전체 행을 페이지네이션으로 조회"""
-    all_rows: list[dict] = []
-    offset = 0
-    while True:
-        resp = (
-            supabase.schema(DB_SCHEMA)
-            .table(table)
-            .select(columns)
-            .range(offset, offset + PAGE_SIZE - 1)
-            .execute()
+# readings upsert 충돌 키 (005_stable_ids.sql의 UNIQUE) — v4 id로 적재된 옛 행도 맞춰 id를 갱신
+READINGS_CONFLICT = "character_id,type,value"
+
+
+def make_id_resolvers(supabase: "Client | None", corpus: Corpus | None = None) -> dict[str, IdResolver]:
+    """
+    적재 1회 동안 공유할 id 캐시 (upsert 응답으로 채우고, 미스 시 전체 조회)
+    corpus를 주면 결정적 id(stable_ids)로 미리 채워 DB 왕복 없이 해석한다.
+    supabase가 None이면 (로컬 sink) 미스 시 조회하지 않는다.
+    """
+    if supabase is None:
+        fetch_chars = fetch_codes = lambda: iter(())
+    else:
+        reader = BulkReader(supabase, DB_SCHEMA, parallel=READ_PARALLEL)
+        fetch_chars = lambda: reader.iter_rows("characters", "id,char")
+        fetch_codes = lambda: reader.iter_rows("phonetic_classes", "id,code")
+    resolvers = {
+        "characters": IdResolver("characters", "char", fetch=fetch_chars),
+        "phonetic_classes": IdResolver("phonetic_classes", "code", fetch=fetch_codes),
+    }
+    if corpus is not None:
+        resolvers["characters"].record(
+            {"char": char, "id": character_id(int(cp_str[2:], 16))}
+            for cp_str, char, _ in corpus.items()
         )
-        all_rows.extend(resp.data)
-        if len(resp.data) < PAGE_SIZE:
-            break
-        offset += PAGE_SIZE
-    return all_rows
+        resolvers["phonetic_classes"].record(iter_phonetic_class_rows(corpus))
+    return resolvers
 
 
 def get_supabase_client() -> "Client":
@@ -71,147 +89,479 @@ def get_supabase_client() -> "Client":
     return client
 
 
-def load_characters(supabase: "Client", target: dict, ids_map: dict):
-    """characters 테이블 적재"""
-    print("[1/4] characters 테이블 적재 중...")
-    rows = []
-    for cp_str, data in target.items():
-        char = cp_to_char(cp_str)
-        # kRSUnicode에서 부수 추출 (예: "85.8" → "85")
-        rs = data.get("kRSUnicode", "")
-        radical_num = rs.split(".")[0].rstrip("'") if rs else None
-
-        strokes_raw = data.get("kTotalStrokes", "")
-        try:
-            strokes = int(strokes_raw.split()[0]) if strokes_raw else None
-        except Exception:
-            strokes = None
-
-        rows.append({
+# ── 행 생성기 (Corpus → 테이블 행) ────────────────
+
+
+def iter_character_rows(corpus: Corpus) -> Iterator[dict]:
+    for cp_str, char, data in corpus.items():
+        codepoint = int(cp_str[2:], 16)
+        yield {
+            "id": character_id(codepoint),
             "char": char,
-            "codepoint": int(cp_str[2:], 16),
-            "strokes": strokes,
-            "radical": radical_num,
+            "codepoint": codepoint,
+            "strokes": corpus.strokes[cp_str],
+            "radical": corpus.radicals[cp_str],  # kRSUnicode 부수 (예: "85.8" → "85")
             "unihan_def": data.get("kDefinition", "")[:500],
-        })
+        }
 
-    # 배치 upsert
-    for i in range(0, len(rows), BATCH_SIZE):
-        batch = rows[i:i + BATCH_SIZE]
-        supabase.schema(DB_SCHEMA).table("characters").upsert(batch, on_conflict="char").execute()
-        print(f"  → {i + len(batch)}/{len(rows)} 완료")
 
-    print(f"  characters: {len(rows)}개 적재 완료")
+def iter_phonetic_class_rows(corpus: Corpus) -> Iterator[dict]:
+    """고유 kPhonetic 코드 → phonetic_classes 행 (코드 정렬 순)"""
+    codes = {data.get("kPhonetic", "") for data in corpus.target.values()}
+    codes.discard("")
+    for code in sorted(codes):
+        yield {"id": phonetic_class_id(code), "code": code}
 
 
-def load_readings(supabase: "Client", target: dict):
-    """readings 테이블 적재"""
-    print("[2/4] readings 테이블 적재 중...")
-    # character_id 조회 (페이지네이션 적용)
-    all_chars = fetch_all_rows(supabase, "characters", "id,char")
-    char_to_id = {row["char"]: row["id"] for row in all_chars}
-
-    rows = []
-    for cp_str, data in target.items():
-        char = cp_to_char(cp_str)
-        char_id = char_to_id.get(char)
+def iter_reading_rows(corpus: Corpus, char_ids: IdResolver | dict[str, str]) -> Iterator[dict]:
+    for cp_str, char, data in corpus.items():
+        char_id = char_ids.get(char)
         if not char_id:
             continue
         hangul = data.get("kHangul", "")
         if hangul:
+            codepoint = int(cp_str[2:], 16)
+            seen: set[str] = set()
             # 여러 음이 있을 경우 분리 (예: "부:0N 불:0E")
             readings_list = hangul.split()
             for idx, reading in enumerate(readings_list):
                 value = reading.split(":")[0] if ":" in reading else reading
-                rows.append({
+                # 같은 음이 두 번 나오면 id가 겹치므로 첫 번째만
+                if value in seen:
+                    continue
+                seen.add(value)
+                yield {
+                    "id": reading_id(codepoint, "kHangul", value),
                     "character_id": char_id,
                     "type": "kHangul",
                     "value": value,
                     "is_primary": idx == 0,  # 첫 번째 음만 primary
-                })
+                }
 
-    for i in range(0, len(rows), BATCH_SIZE):
-        batch = rows[i:i + BATCH_SIZE]
-        supabase.schema(DB_SCHEMA).table("readings").upsert(batch).execute()
-        print(f"  → {i + len(batch)}/{len(rows)} 완료")
 
-    print(f"  readings: {len(rows)}개 적재 완료")
-
-
-def load_phonetic_classes(supabase: "Client", target: dict):
-    """phonetic_classes 및 character_phonetic_class 테이블 적재"""
-    print("[3/4] phonetic_classes 테이블 적재 중...")
-    # 고유 phonetic 코드 수집
-    phonetic_codes = set()
-    for data in target.values():
-        code = data.get("kPhonetic", "")
-        if code:
-            phonetic_codes.add(code)
-
-    # phonetic_classes upsert
-    pc_rows = [{"code": code} for code in phonetic_codes]
-    for i in range(0, len(pc_rows), BATCH_SIZE):
-        supabase.schema(DB_SCHEMA).table("phonetic_classes").upsert(
-            pc_rows[i:i + BATCH_SIZE], on_conflict="code"
-        ).execute()
-
-    # ID 조회 (페이지네이션 적용)
-    all_pcs = fetch_all_rows(supabase, "phonetic_classes", "id,code")
-    code_to_id = {row["code"]: row["id"] for row in all_pcs}
-
-    # character_id 조회 (페이지네이션 적용)
-    all_chars = fetch_all_rows(supabase, "characters", "id,char")
-    char_to_id = {row["char"]: row["id"] for row in all_chars}
-
-    # character_phonetic_class 적재
-    cp_rows = []
-    for cp_str, data in target.items():
-        char = cp_to_char(cp_str)
+def iter_phonetic_link_rows(
+    corpus: Corpus,
+    char_ids: IdResolver | dict[str, str],
+    code_ids: IdResolver | dict[str, str],
+) -> Iterator[dict]:
+    for _, char, data in corpus.items():
         code = data.get("kPhonetic", "")
         if not code:
             continue
-        char_id = char_to_id.get(char)
-        pc_id = code_to_id.get(code)
+        char_id = char_ids.get(char)
+        pc_id = code_ids.get(code)
         if char_id and pc_id:
-            cp_rows.append({"character_id": char_id, "phonetic_class_id": pc_id})
-
-    for i in range(0, len(cp_rows), BATCH_SIZE):
-        supabase.schema(DB_SCHEMA).table("character_phonetic_class").upsert(
-            cp_rows[i:i + BATCH_SIZE]
-        ).execute()
-
-    print(f"  phonetic_classes: {len(pc_rows)}개 적재 완료")
-
-
-def load_decompositions(supabase: "Client", target: dict, ids_map_expr: dict):
-    """decompositions 테이블 적재"""
-    print("[4/4] decompositions 테이블 적재 중...")
-    all_chars = fetch_all_rows(supabase, "characters", "id,char")
-    char_to_id = {row["char"]: row["id"] for row in all_chars}
-
-    rows = []
-    for cp_str, data in target.items():
-        char = cp_to_char(cp_str)
-        char_id = char_to_id.get(char)
+            yield {"character_id": char_id, "phonetic_class_id": pc_id}
+
+
+def iter_decomposition_rows(
+    corpus: Corpus,
+    char_ids: IdResolver | dict[str, str],
+    ids_resolver: IdsResolver | None = None,
+) -> Iterator[dict]:
+    """tree / depth / primitives는 ids_resolver(기본 corpus.ids_resolver)로 계산"""
+    resolver = ids_resolver or corpus.ids_resolver
+    for _, char, _ in corpus.items():
+        char_id = char_ids.get(char)
         if not char_id:
             continue
-        ids_data = ids_map_expr.get(char)
+        ids_data = corpus.ids_for(char)
         if ids_data and len(ids_data["components"]) >= 2:
-            rows.append({
+            resolved = resolver.resolve(char)
+            yield {
                 "character_id": char_id,
                 "ids": ids_data["ids_expr"],
                 "components": ids_data["components"],
                 "confidence": 90,
-            })
+                "tree": resolver.tree(char),
+                "depth": resolved.depth,
+                "primitives": list(resolved.primitives),
+            }
+
+
+def component_index_transitive() -> bool:
+    """component_index에 간접 부품까지 넣을지 (HANJA_ETL_COMPONENT_INDEX=direct면 직접 부품만)"""
+    return os.environ.get("HANJA_ETL_COMPONENT_INDEX", "") != "direct"
+
+
+def iter_component_index_rows(
+    corpus: Corpus,
+    char_ids: IdResolver | dict[str, str],
+    ids_resolver: IdsResolver | None = None,
+    transitive: bool | None = None,
+) -> Iterator[dict]:
+    """
+    부품 → 글자 역색인 행 (글자·부품 쌍마다 1행)
+    - 직접 부품: IDS 트리에서 처음 나온 위치(왼쪽부터 0)와 바로 위 연산자
+    - 간접 부품(transitive): 직접 부품을 재귀로 펼쳐 나온 부품 — 위치 / 연산자 / via는
+      그 부품을 품은 직접 부품 기준
+    strokes / frequency / codepoint는 조회 정렬용으로 복사해 둔다.
+    transitive를 주지 않으면 HANJA_ETL_COMPONENT_INDEX 설정을 따른다.
+    """
+    resolver = ids_resolver or corpus.ids_resolver
+    if transitive is None:
+        transitive = component_index_transitive()
+    for cp_str, char, _ in corpus.items():
+        char_id = char_ids.get(char)
+        if not char_id or corpus.ids_for(char) is None:
+            continue
+        direct = resolver.direct_components(char)
+        base = {
+            "character_id": char_id,
+            "char": char,
+            "strokes": corpus.strokes[cp_str],
+            "frequency": corpus.frequency[cp_str],
+            "codepoint": int(cp_str[2:], 16),
+        }
+        seen: set[str] = set()
+        for leaf, position, operator in direct:
+            if leaf in seen:
+                continue
+            seen.add(leaf)
+            yield {**base, "component": leaf, "position": position, "operator": operator,
+                   "transitive": False, "via": None}
+        if not transitive:
+            continue
+        for leaf, position, operator in direct:
+            for component in resolver.resolve(leaf).components:
+                if component in seen or component == char:
+                    continue
+                seen.add(component)
+                yield {**base, "component": component, "position": position, "operator": operator,
+                       "transitive": True, "via": leaf}
+
+
+def _display_order(corpus: Corpus, cp_str: str) -> tuple:
+    """frequency(없으면 뒤) → strokes → codepoint — component_index 조회와 같은 정렬"""
+    frequency, strokes = corpus.frequency[cp_str], corpus.strokes[cp_str]
+    return (frequency is None, frequency or 0, strokes is None, strokes or 0, int(cp_str[2:], 16))
+
+
+def iter_phonetic_series_rows(
+    corpus: Corpus,
+    char_ids: IdResolver | dict[str, str],
+    ids_resolver: IdsResolver | None = None,
+) -> Iterator[dict]:
+    """
+    kPhonetic 계열별 요약 행 (phonetic_series) — 형제 패널이 한 번에 읽을 값을 미리 계산
+    - members: 구성 글자 (char / 대표음 / 뜻), _display_order 순
+    - root: 2자 이상이 공유하는 직접 부품 중 가장 많은 것 — 같으면 계열 안의 글자, codepoint 순
+    - readings: 대표음별 글자 수 (많은 순), consistency: 가장 흔한 대표음의 비율
+    """
+    resolver = ids_resolver or corpus.ids_resolver
+    classes: dict[str, list[tuple[str, str, dict]]] = {}
+    for cp_str, char, data in corpus.items():
+        code = data.get("kPhonetic", "")
+        if code and char_ids.get(char):
+            classes.setdefault(code, []).append((cp_str, char, data))
 
-    for i in range(0, len(rows), BATCH_SIZE):
-        batch = rows[i:i + BATCH_SIZE]
-        supabase.schema(DB_SCHEMA).table("decompositions").upsert(
-            batch, on_conflict="character_id"
-        ).execute()
-        print(f"  → {i + len(batch)}/{len(rows)} 완료")
+    for code in sorted(classes):
+        members = sorted(classes[code], key=lambda m: _display_order(corpus, m[0]))
+        member_chars = {char for _, char, _ in members}
 
-    print(f"  decompositions: {len(rows)}개 적재 완료")
+        shared = Counter(
+            leaf
+            for _, char, _ in members
+            for leaf in {leaf for leaf, _, _ in resolver.direct_components(char)}
+        )
+        candidates = [(count, leaf in member_chars, -ord(leaf), leaf)
+                      for leaf, count in shared.items() if count >= 2]
+        root = max(candidates)[3] if candidates else None
+
+        readings = Counter(corpus.hangul[cp_str] for cp_str, _, _ in members if corpus.hangul[cp_str])
+        ranked = readings.most_common()
+        yield {
+            "phonetic_class_id": phonetic_class_id(code),
+            "code": code,
+            "root": root,
+            "main_reading": ranked[0][0] if ranked else None,
+            "consistency": round(ranked[0][1] / readings.total(), 3) if ranked else None,
+            "member_count": len(members),
+            "readings": [{"reading": value, "count": count} for value, count in ranked],
+            "members": [
+                {
+                    "character_id": char_ids.get(char),
+                    "char": char,
+                    "reading": corpus.hangul[cp_str],
+                    "meaning": data.get("kDefinition", "")[:500],
+                }
+                for cp_str, char, data in members
+            ],
+        }
+
+
+# ── 테이블별 적재 ────────────────────────────────
+
+
+async def load_characters(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+) -> UpsertResult:
+    """characters 테이블 적재 (id는 stable_ids로 미리 결정)"""
+    print("[1/4] characters 테이블 적재 중...")
+    result = await sink.upsert(
+        "characters", iter_character_rows(corpus),
+        on_conflict="char", total=len(corpus),
+    )
+    print(f"  characters: {result.rows}개 적재 완료")
+    return result
+
+
+async def load_readings(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+) -> UpsertResult:
+    """readings 테이블 적재 (자연 키 기준 upsert — 재실행 / id 전환 시 중복 행 없음)"""
+    print("[2/4] readings 테이블 적재 중...")
+    result = await sink.upsert(
+        "readings", iter_reading_rows(corpus, resolvers["characters"]),
+        on_conflict=READINGS_CONFLICT,
+    )
+    print(f"  readings: {result.rows}개 적재 완료")
+    return result
+
+
+async def load_phonetic_class_codes(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+) -> UpsertResult:
+    """phonetic_classes 테이블 적재 (characters와 무관하므로 먼저/동시에 가능)"""
+    print("[3/4] phonetic_classes 테이블 적재 중...")
+    result = await sink.upsert(
+        "phonetic_classes", iter_phonetic_class_rows(corpus),
+        on_conflict="code",
+    )
+    print(f"  phonetic_classes: {result.rows}개 적재 완료")
+    return result
+
+
+async def load_phonetic_series(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+) -> UpsertResult:
+    """phonetic_series 테이블 적재 (계열별 성부 / 구성 글자 / 음 일관성, phonetic_classes 이후)"""
+    result = await sink.upsert(
+        "phonetic_series", iter_phonetic_series_rows(corpus, resolvers["characters"]),
+    )
+    print(f"  phonetic_series: {result.rows}개 적재 완료")
+    return result
+
+
+async def load_phonetic_links(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+) -> UpsertResult:
+    """character_phonetic_class 테이블 적재 (characters, phonetic_classes 이후)"""
+    result = await sink.upsert(
+        "character_phonetic_class",
+        iter_phonetic_link_rows(corpus, resolvers["characters"], resolvers["phonetic_classes"]),
+    )
+    print(f"  character_phonetic_class: {result.rows}개 적재 완료")
+    return result
+
+
+async def load_decompositions(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+) -> UpsertResult:
+    """decompositions 테이블 적재"""
+    print("[4/4] decompositions 테이블 적재 중...")
+    result = await sink.upsert(
+        "decompositions", iter_decomposition_rows(corpus, resolvers["characters"]),
+        on_conflict="character_id",
+    )
+    print(f"  decompositions: {result.rows}개 적재 완료")
+    print(corpus.ids_resolver.summary())
+    return result
+
+
+async def load_component_index(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+) -> UpsertResult:
+    """
+    component_index 테이블 적재 (부품 → 글자 역색인, characters 이후)
+    rest sink는 이번 글자의 기존 행 중 새 행 집합에 없는 것(색인 방식 / IDS 변경)을 지운다
+    — copy sink는 병합 SQL, --delta는 변경분 계산이 같은 일을 한다.
+    """
+    keys: set[tuple[str, str]] = set()
+
+    def rows() -> Iterator[dict]:
+        for row in iter_component_index_rows(corpus, resolvers["characters"]):
+            keys.add((row["character_id"], row["component"]))
+            yield row
+
+    result = await sink.upsert("component_index", rows())
+    print(f"  component_index: {result.rows}개 적재 완료")
+    if sink.name == "rest":
+        char_ids = {resolvers["characters"].get(char) for _, char, _ in corpus.items()}
+        stale = await asyncio.to_thread(_stale_component_keys, sink.supabase, char_ids, keys)
+        if stale:
+            await sink.delete(
+                "component_index", ("character_id", "component"),
+                ({"character_id": char_id, "component": component} for char_id, component in stale),
+                total=len(stale),
+            )
+            print(f"  component_index: 새 색인에 없는 {len(stale):,}개 삭제")
+    return result
+
+
+def _stale_component_keys(
+    supabase: "Client",
+    char_ids: set[str | None],
+    keys: set[tuple[str, str]],
+) -> list[tuple[str, str]]:
+    """DB의 component_index 중 char_ids 글자의 행이면서 keys에 없는 (character_id, component) — 글자순"""
+    reader = BulkReader(supabase, DB_SCHEMA, parallel=READ_PARALLEL)
+    return sorted(
+        (row["character_id"], row["component"])
+        for row in reader.iter_rows("component_index", "character_id,component")
+        if row["character_id"] in char_ids and (row["character_id"], row["component"]) not in keys
+    )
+
+
+# 테이블 적재 의존 관계 (FK 기준) — 이름: (선행 작업, 적재 코루틴)
+LOAD_DAG: dict[str, tuple[tuple[str, ...], Callable[..., Awaitable[UpsertResult]]]] = {
+    "characters": ((), load_characters),
+    "phonetic_classes": ((), load_phonetic_class_codes),
+    "readings": (("characters",), load_readings),
+    "decompositions": (("characters",), load_decompositions),
+    "character_phonetic_class": (("characters", "phonetic_classes"), load_phonetic_links),
+    "component_index": (("characters",), load_component_index),
+    "phonetic_series": (("phonetic_classes",), load_phonetic_series),
+}
+
+
+class DependencyFailed(RuntimeError):
+    """선행 테이블 적재 실패로 시작하지 않은 작업"""
+
+
+async def run_dag(
+    jobs: dict[str, tuple[tuple[str, ...], Callable[[], Awaitable[None]]]],
+) -> None:
+    """
+    {이름: (선행 작업, 코루틴 팩토리)}를 의존 순서대로 실행 — 선행 작업이 끝난 작업은 동시에
+    실패한 작업에 의존하는 작업은 건너뛰고, 끝난 뒤 예외를 다시 던진다.
+    """
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run(name: str) -> None:
+        deps, job = jobs[name]
+        for dep in deps:
+            try:
+                await tasks[dep]
+            except Exception as e:
+                raise DependencyFailed(f"{name}: 선행 작업 {dep} 실패") from e
+        await job()
+
+    for name in jobs:
+        tasks[name] = asyncio.create_task(run(name))
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    failed = {
+        name: exc for name, exc in zip(tasks, results)
+        if isinstance(exc, BaseException) and not isinstance(exc, DependencyFailed)
+    }
+    skipped = [name for name, exc in zip(tasks, results) if isinstance(exc, DependencyFailed)]
+    if failed:
+        for name, exc in failed.items():
+            print(f"  [dag] {name} 적재 실패: {exc}")
+        raise RuntimeError(
+            f"적재 실패: {', '.join(failed)} (미실행: {', '.join(skipped) or '없음'})"
+        ) from next(iter(failed.values()))
+
+
+async def load_all_async(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+    documents: Any = None,
+) -> None:
+    """
+    LOAD_DAG 순서대로 전체 적재 — 선행 작업이 끝난 테이블은 동시에 적재
+    (id를 미리 알고 있으므로 characters 커밋 직후 의존 테이블을 병렬로 올릴 수 있다)
+    sink에 체크포인트가 있으면 이미 끝난 테이블은 건너뛰고, 끝난 테이블을 기록한다.
+    documents(documents.DocumentBuilder)를 주면 문서에 들어가는 테이블 뒤에 글자별 문서도 적재한다.
+    """
+    checkpoint = sink.checkpoint
+
+    async def run(name: str, load: Callable[..., Awaitable[UpsertResult]]) -> None:
+        if checkpoint is not None and checkpoint.is_table_done(name):
+            print(f"  {name}: 이전 실행에서 완료 — 건너뜀")
+            return
+        with stage(f"load.{name}") as s:
+            result = await load(sink, corpus, resolvers)
+            s.rows_out = result.rows
+        if checkpoint is not None:
+            checkpoint.mark_table_done(name)
+
+    dag = dict(LOAD_DAG)
+    if documents is not None:
+        dag[documents.name] = (documents.deps, documents.load)
+    await run_dag({
+        name: (deps, lambda name=name, load=load: run(name, load))
+        for name, (deps, load) in dag.items()
+    })
+
+
+def load_into(
+    sink: Sink,
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver],
+    documents: Any = None,
+) -> dict | None:
+    """
+    sink에 전체 적재 후 finish() — 반환값은 sink의 검증 집계 (없으면 None)
+    sink는 닫고 처리량 요약을 출력한다 (실패해도).
+    sink에 체크포인트가 있으면 진행 상황을 기록하고, 전체 성공 시 상태 파일을 지운다.
+    """
+    checkpoint = sink.checkpoint
+    try:
+        asyncio.run(load_all_async(sink, corpus, resolvers, documents))
+        with stage(f"load.finish.{sink.name}"):
+            stats = sink.finish()
+    except BaseException:
+        if checkpoint is not None:
+            # 마지막 저장 이후 끝난 배치까지 남겨 둠
+            checkpoint.save(force=True)
+            print(f"  [resume] 진행 상황 저장: {checkpoint.path} (--resume으로 이어서 실행)")
+        raise
+    else:
+        if checkpoint is not None:
+            checkpoint.clear()
+    finally:
+        sink.close()
+        print(sink.summary())
+    return stats
+
+
+def load_all(
+    supabase: "Client",
+    corpus: Corpus,
+    resolvers: dict[str, IdResolver] | None = None,
+    max_in_flight: int = MAX_IN_FLIGHT,
+    batch_bytes: int = INITIAL_BATCH_BYTES,
+    checkpoint: LoadCheckpoint | None = None,
+    documents: Any = None,
+) -> None:
+    """동기 진입점 — Supabase REST sink(BatchUpserter)로 load_into 실행"""
+    resolvers = resolvers or make_id_resolvers(supabase, corpus)
+    upserter = BatchUpserter(
+        supabase, max_in_flight=max_in_flight, batch_bytes=batch_bytes, checkpoint=checkpoint,
+    )
+    load_into(upserter, corpus, resolvers, documents)
+
+
+def print_resolver_stats(resolvers: dict[str, IdResolver]) -> None:
+    for resolver in resolvers.values():
+        print(f"  [id] {resolver.stats()}")
 
 
 def main():
@@ -220,16 +570,15 @@ def main():
     supabase = get_supabase_client()
 
     print("[1/2] 데이터 파싱 중...")
-    unihan = parse_unihan(DATA_DIR / "Unihan.zip")
-    target = filter_target(unihan)
-    ids_map_expr = parse_ids_with_expr(DATA_DIR / "ids.txt")
-    print(f"  → 대상: {len(target)}자, IDS: {len(ids_map_expr)}개\n")
+    corpus = Corpus.load(DATA_DIR / "Unihan.zip", DATA_DIR / "ids.txt")
+    print(f"  → 대상: {len(corpus.target)}자, IDS: {len(corpus.ids_map_expr)}개\n")
 
     print("[2/2] Supabase 적재 중...")
-    load_characters(supabase, target, ids_map_expr)
-    load_readings(supabase, target)
-    load_phonetic_classes(supabase, target)
-    load_decompositions(supabase, target, ids_map_expr)
+    from scripts.etl.documents import DocumentBuilder
+
+    resolvers = make_id_resolvers(supabase, corpus)
+    load_all(supabase, corpus, resolvers, documents=DocumentBuilder(supabase))
+    print_resolver_stats(resolvers)
 
     print("\n[완료] Phase 1 ETL 적재 완료!")
 
@@ -3,12 +3,23 @@ parse_unihan.py — spike.py에서 추출한 Unihan 파싱 모듈
 Phase 1 ETL 파이프라인 컴포넌트
 
 사용법:
-    from scripts.etl.parse_unihan import parse_unihan, filter_target, cp_to_char
+    from scripts.etl.parse_unihan import parse_unihan, filter_target, cp_to_char, parse_strokes
+
+    # kHangul 보유 글자만 파싱
+    unihan = parse_unihan(zip_path, codepoints=hangul_codepoints(zip_path))
 """
 
+import heapq
+import re
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
+from typing import IO, Iterable, Iterator
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.instrument import stage
 
 UNIHAN_FIELDS = {
     "kHangul",       # 한글 음
@@ -16,69 +27,350 @@ UNIHAN_FIELDS = {
     "kPhonetic",     # phonetic class (파생 계열)
     "kTotalStrokes", # 획수
     "kRSUnicode",    # 부수+획수
+    "kFrequency",    # 사용 빈도 등급 (1 = 가장 흔함 ~ 5)
 }
 
 TARGET_COUNT = 2000
 
+# 대상 규모
+#   default — kHangul 보유 글자 중 획수순 TARGET_COUNT자
+#   hangul  — kHangul 보유 글자 전체
+#   full    — Unihan 전체 (kHangul 없는 글자 포함)
+SCALES = ("default", "hangul", "full")
+# 대상이 글자 단위로 정해져 스트리밍 적재(stream.py)가 가능한 규모
+STREAM_SCALES = ("hangul", "full")
+
+# 파싱 대상 Unihan 파일
+UNIHAN_MEMBERS = (
+    "Unihan_Readings.txt",
+    "Unihan_DictionaryLikeData.txt",
+    "Unihan_IRGSources.txt",  # kTotalStrokes, kRSUnicode
+)
+
+READ_CHUNK_SIZE = 4 << 20  # 4MB 단위로 스트리밍
+MIN_TASK_BYTES = 2 << 20   # 병렬 파싱 시 작업 하나의 최소 크기
+
 
 def cp_to_char(cp_str: str) -> str:
     """'U+6E05' → '清'"""
     return chr(int(cp_str[2:], 16))
 
 
-def parse_unihan(zip_path: Path) -> dict[str, dict]:
+def parse_strokes(raw: str | None, default: int | None = None) -> int | None:
+    """kTotalStrokes → 획수 정수 (여러 값이면 첫 번째) — '12 11' → 12"""
+    if not raw:
+        return default
+    try:
+        return int(raw.split()[0])
+    except (ValueError, IndexError):
+        return default
+
+
+def parse_frequency(raw: str | None) -> int | None:
+    """kFrequency → 빈도 등급 정수 (1~5, 없으면 None) — '2' → 2"""
+    if not raw:
+        return None
+    try:
+        return int(raw.split()[0])
+    except (ValueError, IndexError):
+        return None
+
+
+def parse_radical(rs: str | None) -> str | None:
+    """kRSUnicode → 부수 번호 문자열 — '85.8' → '85', "120'.3" → '120'"""
+    if not rs:
+        return None
+    return rs.split(".")[0].rstrip("'")
+
+
+def primary_hangul(raw: str | None) -> str:
+    """kHangul → 첫 번째 음 — '부:0N 불:0E' → '부'"""
+    if not raw:
+        return ""
+    return raw.split()[0].split(":")[0]
+
+
+def _line_pattern(fields: Iterable[str]) -> re.Pattern:
+    """
+    필요한 필드 행만 매칭하는 바이트 정규식
+    'U+6E05<TAB>kHangul<TAB>청:0E' → (b'U+6E05', b'kHangul', b'청:0E')
+    필드 태그가 다른 행과 주석(#) 행은 디코딩 없이 정규식 엔진에서 걸러진다.
+    """
+    alternation = b"|".join(re.escape(f.encode("ascii")) for f in sorted(fields))
+    return re.compile(
+        rb"^(U\+[0-9A-F]+)\t(" + alternation + rb")\t([^\t\r\n]*)",
+        re.MULTILINE,
+    )
+
+
+def _iter_blocks(f: IO[bytes], chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """줄 경계에 맞춘 바이트 블록 단위로 스트리밍"""
+    rest = b""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        chunk = rest + chunk
+        cut = chunk.rfind(b"\n") + 1
+        if cut == 0:
+            rest = chunk
+            continue
+        rest = chunk[cut:]
+        yield chunk[:cut]
+    if rest:
+        yield rest
+
+
+def _parse_blocks(
+    blocks: Iterable[bytes],
+    pattern: re.Pattern,
+    chars: dict[str, dict],
+    codepoints: frozenset[bytes] | None = None,
+) -> int:
+    """바이트 블록들을 chars에 병합 (바이트 단위 매칭, 남는 값만 디코딩) — 반환: 반영한 필드 행 수"""
+    # 필드명은 종류가 몇 개뿐이므로 디코딩 결과를 재사용
+    field_names: dict[bytes, str] = {}
+    count = 0
+    for block in blocks:
+        for cp_raw, field_raw, value_raw in pattern.findall(block):
+            if codepoints is not None and cp_raw not in codepoints:
+                continue
+            field = field_names.get(field_raw)
+            if field is None:
+                field = field_names[field_raw] = field_raw.decode("ascii")
+            chars[cp_raw.decode("ascii")][field] = str(value_raw, "utf-8", "ignore").rstrip()
+            count += 1
+    return count
+
+
+def _line_range(data: bytes, start: int, end: int) -> bytes:
+    """[start, end) 바이트 범위를 줄 경계에 맞춰 잘라냄 (시작 줄은 앞 범위 소유)"""
+    if start > 0:
+        start = data.find(b"\n", start - 1) + 1 or len(data)
+    if end < len(data):
+        end = data.find(b"\n", end - 1) + 1 or len(data)
+    return data[start:end]
+
+
+def _parse_task(
+    zip_path: Path,
+    name: str,
+    fields: tuple[str, ...],
+    codepoints: frozenset[bytes] | None,
+) -> dict[str, dict]:
+    """프로세스 풀 작업 단위: 멤버 하나를 스트리밍 파싱"""
+    chars: dict[str, dict] = defaultdict(dict)
+    with zipfile.ZipFile(zip_path) as zf, zf.open(name) as f:
+        _parse_blocks(_iter_blocks(f), _line_pattern(fields), chars, codepoints)
+    return dict(chars)
+
+
+def _parse_slice(
+    data: bytes,
+    fields: tuple[str, ...],
+    codepoints: frozenset[bytes] | None,
+) -> dict[str, dict]:
+    """프로세스 풀 작업 단위: 부모가 한 번 풀어 줄 경계로 자른 멤버 조각을 파싱"""
+    chars: dict[str, dict] = defaultdict(dict)
+    _parse_blocks([data], _line_pattern(fields), chars, codepoints)
+    return dict(chars)
+
+
+def _plan_tasks(zf: zipfile.ZipFile, jobs: int) -> list[tuple[str, int, int | None]]:
+    """
+    멤버별 (name, start, end) 작업 목록 — namelist 순서, 범위 오름차순
+    큰 멤버는 jobs 수에 맞춰 바이트 범위로 나눈다.
+    """
+    members = [info for info in zf.infolist() if info.filename in UNIHAN_MEMBERS]
+    total = sum(info.file_size for info in members)
+    chunk = max(MIN_TASK_BYTES, -(-total // jobs)) if jobs > 0 else total
+    tasks: list[tuple[str, int, int | None]] = []
+    for info in members:
+        if info.file_size <= chunk:
+            tasks.append((info.filename, 0, None))
+            continue
+        for start in range(0, info.file_size, chunk):
+            tasks.append((info.filename, start, min(start + chunk, info.file_size)))
+    return tasks
+
+
+def parse_unihan(
+    zip_path: Path,
+    fields: set[str] = UNIHAN_FIELDS,
+    codepoints: set[str] | None = None,
+    jobs: int = 1,
+) -> dict[str, dict]:
     """
     Unihan.zip에서 필요한 필드를 파싱하여 반환
     반환: {codepoint_str: {field: value}}
+
+    codepoints를 주면 해당 코드포인트만 남긴다 (예: hangul_codepoints() 결과)
+    jobs > 1이면 멤버(또는 바이트 범위)별로 프로세스 풀에서 파싱 후
+    작업 순서대로 병합한다 — 결과(키 순서 포함)는 직렬 경로와 동일.
     """
-    chars: dict[str, dict] = defaultdict(dict)
+    allow = (
+        frozenset(cp.encode("ascii") for cp in codepoints)
+        if codepoints is not None else None
+    )
 
-    target_files = {
-        "Unihan_Readings.txt",
-        "Unihan_DictionaryLikeData.txt",
-        "Unihan_IRGSources.txt",  # kTotalStrokes, kRSUnicode
-    }
+    if jobs > 1:
+        return _parse_unihan_parallel(zip_path, fields, allow, jobs)
+
+    chars: dict[str, dict] = defaultdict(dict)
+    pattern = _line_pattern(fields)
 
     with zipfile.ZipFile(zip_path) as zf:
         for name in zf.namelist():
-            if name not in target_files:
+            if name not in UNIHAN_MEMBERS:
                 continue
             print(f"  [parse] {name}")
-            with zf.open(name) as f:
-                for raw in f:
-                    line = raw.decode("utf-8", errors="ignore").rstrip()
-                    if not line or line.startswith("#"):
-                        continue
-                    parts = line.split("\t")
-                    if len(parts) < 3:
-                        continue
-                    cp_str, field, value = parts[0], parts[1], parts[2]
-                    if field not in UNIHAN_FIELDS:
-                        continue
-                    chars[cp_str][field] = value
+            with stage(f"parse.unihan.{name}") as s, zf.open(name) as f:
+                s.rows_out = _parse_blocks(_iter_blocks(f), pattern, chars, allow)
 
     return dict(chars)
 
 
-def filter_target(unihan: dict, count: int = TARGET_COUNT) -> dict:
+def _parse_unihan_parallel(
+    zip_path: Path,
+    fields: set[str],
+    allow: frozenset[bytes] | None,
+    jobs: int,
+) -> dict[str, dict]:
+    with zipfile.ZipFile(zip_path) as zf:
+        tasks = _plan_tasks(zf, jobs)
+
+    field_tuple = tuple(sorted(fields))
+    chars: dict[str, dict] = {}
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        # 통째 작업을 먼저 보내 두고, 나눈 멤버는 deflate 스트림이 탐색 불가라
+        # 부모가 멤버마다 한 번만 풀어 줄 경계로 자른 조각을 넘긴다
+        futures = {
+            i: pool.submit(_parse_task, zip_path, name, field_tuple, allow)
+            for i, (name, _, end) in enumerate(tasks) if end is None
+        }
+        with zipfile.ZipFile(zip_path) as zf:
+            data, data_name = b"", None
+            for i, (name, start, end) in enumerate(tasks):
+                if end is None:
+                    continue
+                if name != data_name:
+                    data, data_name = zf.read(name), name
+                futures[i] = pool.submit(_parse_slice, _line_range(data, start, end), field_tuple, allow)
+            del data
+        futures = [futures[i] for i in range(len(tasks))]
+        # 제출 순서(= 파일 순서)대로 병합해야 직렬 경로와 결과가 같다
+        for (name, start, end), future in zip(tasks, futures):
+            part = future.result()
+            label = name if end is None else f"{name} [{start:,}:{end:,}]"
+            print(f"  [parse] {label}")
+            for cp_str, values in part.items():
+                existing = chars.get(cp_str)
+                if existing is None:
+                    chars[cp_str] = values
+                else:
+                    existing.update(values)
+
+    return chars
+
+
+def _iter_member_records(
+    f: IO[bytes],
+    pattern: re.Pattern,
+    name: str,
+) -> Iterator[tuple[int, str, dict]]:
+    """멤버 하나를 (codepoint 정수, codepoint_str, {field: value}) 순으로 — 같은 글자의 행은 묶음"""
+    current: tuple[int, str, dict] | None = None
+    for block in _iter_blocks(f):
+        for cp_raw, field_raw, value_raw in pattern.findall(block):
+            cp_str = cp_raw.decode("ascii")
+            if current is None or current[1] != cp_str:
+                cp = int(cp_str[2:], 16)
+                if current is not None:
+                    if cp < current[0]:
+                        # 병합 조인은 멤버가 codepoint 순으로 정렬돼 있어야 성립
+                        raise ValueError(f"{name}: codepoint 순서가 아님 ({current[1]} 다음 {cp_str})")
+                    yield current
+                current = (cp, cp_str, {})
+            current[2][field_raw.decode("ascii")] = str(value_raw, "utf-8", "ignore").rstrip()
+    if current is not None:
+        yield current
+
+
+def iter_unihan_records(
+    zip_path: Path,
+    fields: set[str] = UNIHAN_FIELDS,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Unihan.zip을 codepoint 순서로 스트리밍 — (codepoint_str, {field: value})
+    멤버 파일들이 모두 codepoint 순으로 정렬돼 있으므로 병합 조인으로 글자 단위 레코드를 만든다.
+    모든 멤버가 그 글자를 지나간 뒤에 내보내므로 각 레코드는 완성된 상태이고,
+    메모리에는 멤버별 읽기 블록만 남는다 (parse_unihan과 결과 값은 같고 순서만 codepoint 순).
+    """
+    pattern = _line_pattern(fields)
+    with zipfile.ZipFile(zip_path) as zf:
+        names = [name for name in zf.namelist() if name in UNIHAN_MEMBERS]
+        files = [zf.open(name) for name in names]
+        try:
+            streams = [_iter_member_records(f, pattern, name) for f, name in zip(files, names)]
+            current: tuple[int, str, dict] | None = None
+            for cp, cp_str, values in heapq.merge(*streams, key=lambda r: r[0]):
+                if current is not None and current[0] == cp:
+                    current[2].update(values)
+                    continue
+                if current is not None:
+                    yield current[1], current[2]
+                current = (cp, cp_str, dict(values))
+            if current is not None:
+                yield current[1], current[2]
+        finally:
+            for f in files:
+                f.close()
+
+
+def hangul_codepoints(zip_path: Path) -> set[str]:
+    """kHangul을 가진 코드포인트 집합 (parse_unihan의 codepoints 인자용)"""
+    pattern = _line_pattern({"kHangul"})
+    result: set[str] = set()
+    with zipfile.ZipFile(zip_path) as zf:
+        with zf.open("Unihan_Readings.txt") as f:
+            for block in _iter_blocks(f):
+                result.update(cp.decode("ascii") for cp, _, _ in pattern.findall(block))
+    return result
+
+
+def filter_target(
+    unihan: dict,
+    count: int | None = TARGET_COUNT,
+    require_hangul: bool = True,
+) -> dict:
     """
     kHangul이 있는 항목만 추출 (한국어권 학습 대상)
-    획수 오름차순으로 count개 제한
+    획수 오름차순으로 count개 제한 (None이면 제한 없음)
+    require_hangul=False면 kHangul 없는 항목도 포함
     """
     filtered = {
         cp: data for cp, data in unihan.items()
-        if "kHangul" in data
+        if not require_hangul or "kHangul" in data
     }
 
     def sort_key(item):
-        strokes = item[1].get("kTotalStrokes", "99")
-        try:
-            return int(strokes.split()[0])
-        except Exception:
-            return 99
+        return parse_strokes(item[1].get("kTotalStrokes"), default=99)
 
     sorted_items = sorted(filtered.items(), key=sort_key)
-    return dict(sorted_items[:count])
+    if count is not None:
+        sorted_items = sorted_items[:count]
+    return dict(sorted_items)
+
+
+def select_target(unihan: dict, scale: str = "default") -> dict:
+    """규모(SCALES)에 맞춰 학습 대상 선정"""
+    if scale == "default":
+        return filter_target(unihan, TARGET_COUNT)
+    if scale == "hangul":
+        return filter_target(unihan, None)
+    if scale == "full":
+        return filter_target(unihan, None, require_hangul=False)
+    raise ValueError(f"알 수 없는 scale: {scale} (가능: {', '.join(SCALES)})")
 
 
 if __name__ == "__main__":
@@ -11,24 +11,181 @@ run_etl.py — Phase 1 ETL 파이프라인 오케스트레이터
 사용법:
     python run_etl.py              # 전체 파이프라인
     python run_etl.py --dry-run    # 파싱 + 검증만 (DB 적재 생략)
+    python run_etl.py --jobs 4     # Unihan 파싱을 4개 프로세스로 병렬 실행
+    python run_etl.py --columnar   # Unihan을 배열 기반 저장소로 보관 (메모리 절약)
+    python run_etl.py --scale hangul --columnar   # kHangul 보유 글자 전체
+    python run_etl.py --max-in-flight 4 --batch-kb 16   # 공유 프로젝트에서 보수적으로 시작
+    python run_etl.py --delta --dry-run   # DB와 비교한 변경분 리포트만 (쓰기 없음)
+    python run_etl.py --delta             # 바뀐 행만 insert / update / delete
+    python run_etl.py --resume            # 중단된 적재를 끝난 테이블/행 이후부터 이어서
+    python run_etl.py --sink copy         # Postgres 직접 연결 + COPY (트랜잭션 하나로 전체 재적재)
+    python run_etl.py --sink sqlite       # 네트워크 없이 로컬 SQLite(data/hanja.sqlite)로 적재 + 검증
+    python run_etl.py --sink jsonl --sink-path out/   # 테이블별 JSONL (실행 간 diff용)
+    python run_etl.py --scale hangul --stream   # 파싱하면서 적재 (파싱 / 적재 시간을 겹침)
+    python run_etl.py --dry-run --profile       # 단계별 계측 표 + cProfile 덤프
+
+단계별 계측(벽시계/CPU 시간, 메모리, 행 수, HTTP 요청·바이트)은 실행이 끝나면 표로 출력하고
+data/etl_reports/run-*.json에 기록한다 (--report로 경로 지정).
 """
 
+import argparse
+import os
 import sys
 import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from scripts.etl.parse_unihan import parse_unihan, filter_target
-from scripts.etl.parse_ids import parse_ids_with_expr
-from scripts.etl.validate import validate_pre_etl, validate_post_etl
+from scripts.etl.corpus import Corpus
+from scripts.etl.parse_unihan import SCALES, STREAM_SCALES
+from scripts.etl.validate import (
+    validate_pre_etl,
+    validate_pre_etl_stream,
+    validate_post_etl,
+    COVERAGE_THRESHOLDS,
+)
+from scripts.etl.checkpoint import LoadCheckpoint, default_state_path, input_fingerprint
+from scripts.etl.sinks import SINK_KINDS
+from scripts.etl.instrument import RunReport, default_report_path, stage
 
 
 # 프로젝트 루트의 data/ 폴더 (hanja-app/ 상위)
 DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
 
+# 로컬 sink의 기본 출력 경로
+DEFAULT_SINK_PATHS = {
+    "sqlite": DATA_DIR / "hanja.sqlite",
+    "jsonl": DATA_DIR / "etl_jsonl",
+}
+
+
+def open_pipeline_sink(
+    sink: str,
+    sink_path: Path | None,
+    max_in_flight: int,
+    batch_kb: int,
+):
+    """--sink 값으로 sink 생성 (rest면 Supabase 클라이언트 포함) — (sink, supabase 또는 None)"""
+    from scripts.etl.sinks import open_sink
+
+    if sink == "rest":
+        from scripts.etl.load_db import get_supabase_client
+
+        supabase = get_supabase_client()
+        return open_sink(
+            "rest", supabase=supabase, max_in_flight=max_in_flight, batch_bytes=batch_kb * 1024,
+        ), supabase
+    return open_sink(sink, sink_path or DEFAULT_SINK_PATHS.get(sink)), None
+
+
+def pipeline_documents(sink: str, supabase=None):
+    """--sink 값에 맞는 DocumentBuilder — copy인데 Supabase 설정이 없으면 None (문서 건너뜀)"""
+    from scripts.etl.documents import DocumentBuilder
+
+    if sink == "rest":
+        return DocumentBuilder(supabase)
+    if sink == "copy":
+        # 문서의 큐레이션 부분(의미 트리 / 解說 등)은 Supabase에서 읽음 — 없으면 문서는 건너뜀
+        try:
+            from scripts.etl.load_db import get_supabase_client
+
+            return DocumentBuilder(get_supabase_client())
+        except ValueError as e:
+            print(f"  [documents] {e} — character_documents 갱신을 건너뜁니다")
+            return None
+    return DocumentBuilder()
+
+
+def run_stream_pipeline(
+    scale: str = "hangul",
+    max_in_flight: int = 8,
+    batch_kb: int = 32,
+    sink: str = "rest",
+    sink_path: Path | None = None,
+) -> None:
+    """
+    스트리밍 모드 (--stream) — 파싱과 적재를 겹쳐 실행한 뒤 Pre/Post-ETL 검증
+    Pre-ETL 검증은 적재가 끝난 뒤 판정하므로, 실패하면 적재 결과를 확인해야 한다.
+    """
+    from scripts.etl.stream import stream_load
 
-def run_pipeline(dry_run: bool = False) -> None:
+    start = time.time()
+    print("=" * 60)
+    print("  Phase 1 ETL 파이프라인 (스트리밍)")
+    print("=" * 60)
+    print()
+
+    unihan_path = DATA_DIR / "Unihan.zip"
+    ids_path = DATA_DIR / "ids.txt"
+    for path in (unihan_path, ids_path):
+        if not path.exists():
+            print(f"  ERROR: {path} 파일이 없습니다")
+            sys.exit(1)
+
+    # ── Step 1: 파싱 + 적재 ──────────────────────
+    print(f"[Step 1/4] 파싱 + DB 적재 (sink={sink}, scale={scale})")
+    print("-" * 40)
+    target_sink, supabase = open_pipeline_sink(sink, sink_path, max_in_flight, batch_kb)
+    stream_stats, stats = stream_load(
+        target_sink, unihan_path, ids_path, scale=scale,
+        documents=pipeline_documents(sink, supabase),
+    )
+    print()
+
+    # ── Step 2: Pre-ETL 검증 (집계 기준) ─────────
+    print("[Step 2/4] Pre-ETL 검증")
+    print("-" * 40)
+    vr_pre = validate_pre_etl_stream(stream_stats)
+    print(vr_pre.report())
+    print()
+
+    # ── Step 3: Post-ETL 검증 ────────────────────
+    print("[Step 3/4] Post-ETL 검증")
+    print("-" * 40)
+    if stats is None and supabase is None:
+        from scripts.etl.load_db import get_supabase_client
+
+        supabase = get_supabase_client()
+    vr_post = validate_post_etl(
+        supabase,
+        expected_count=stream_stats.count,
+        min_ids_coverage=COVERAGE_THRESHOLDS[scale][0],
+        require_readings=scale != "full",
+        stats=stats,
+    )
+    print(vr_post.report())
+    print()
+
+    # ── Step 4: 결과 리포트 ──────────────────────
+    elapsed = time.time() - start
+    print("[Step 4/4] 결과 리포트")
+    print("=" * 60)
+    print(f"  소요 시간: {elapsed:.1f}초")
+    print(f"  대상 글자: {stream_stats.count:,}자")
+    print(f"  Pre-ETL:  {'PASS' if vr_pre.all_passed else 'FAIL'}")
+    print(f"  Post-ETL: {'PASS' if vr_post.all_passed else 'FAIL'}")
+    print("=" * 60)
+
+    if not (vr_pre.all_passed and vr_post.all_passed):
+        print("\n검증에 실패한 항목이 있습니다. 적재 결과 확인이 필요합니다.")
+        sys.exit(1)
+
+    print("\nPhase 1 ETL 파이프라인 완료!")
+
+
+def run_pipeline(
+    dry_run: bool = False,
+    jobs: int = 1,
+    columnar: bool = False,
+    scale: str = "default",
+    max_in_flight: int = 8,
+    batch_kb: int = 32,
+    delta: bool = False,
+    prune: bool = False,
+    resume: bool = False,
+    sink: str = "rest",
+    sink_path: Path | None = None,
+) -> None:
     start = time.time()
     print("=" * 60)
     print("  Phase 1 ETL 파이프라인")
@@ -48,53 +205,121 @@ def run_pipeline(dry_run: bool = False) -> None:
         print(f"  ERROR: {ids_path} 파일이 없습니다")
         sys.exit(1)
 
-    unihan = parse_unihan(unihan_path)
-    target = filter_target(unihan)
-    ids_map_expr = parse_ids_with_expr(ids_path)
-    print(f"  → Unihan 전체: {len(unihan):,}자")
-    print(f"  → 학습 대상: {len(target):,}자")
-    print(f"  → IDS 분해: {len(ids_map_expr):,}자")
+    corpus = Corpus.load(unihan_path, ids_path, scale=scale, jobs=jobs, columnar=columnar)
+    print(corpus.summary())
     print()
 
+    # 전체 적재는 체크포인트를 남겨 --resume으로 이어서 실행할 수 있게 함
+    checkpoint = None
+    if not dry_run and not delta and sink == "rest":
+        from scripts.etl.load_db import component_index_transitive
+
+        checkpoint = LoadCheckpoint.open(
+            default_state_path(unihan_path),
+            input_fingerprint(
+                unihan_path, ids_path, scale,
+                variant=f"component_index={'transitive' if component_index_transitive() else 'direct'}",
+            ),
+            resume=resume,
+        )
+        print()
+
     # ── Step 2: Pre-ETL 검증 ─────────────────────
     print("[Step 2/5] Pre-ETL 검증")
     print("-" * 40)
-    vr_pre, _, _ = validate_pre_etl(unihan_path, ids_path)
-    print(vr_pre.report())
+    if checkpoint is not None and checkpoint.is_stage_done("pre_etl"):
+        print("  같은 입력으로 이미 통과 — 건너뜀")
+    else:
+        vr_pre = validate_pre_etl(corpus)
+        print(vr_pre.report())
+        if not vr_pre.all_passed:
+            print()
+            print("Pre-ETL 검증 실패! 파이프라인을 중단합니다.")
+            sys.exit(1)
+        if checkpoint is not None:
+            checkpoint.mark_stage_done("pre_etl")
     print()
 
-    if not vr_pre.all_passed:
-        print("Pre-ETL 검증 실패! 파이프라인을 중단합니다.")
-        sys.exit(1)
-
-    if dry_run:
+    if dry_run and not delta:
         elapsed = time.time() - start
         print(f"[Dry-run 완료] 파싱 + 검증 성공 ({elapsed:.1f}초)")
         print("  → --dry-run 모드: DB 적재를 건너뜁니다")
         return
 
     # ── Step 3: DB 적재 ──────────────────────────
-    print("[Step 3/5] Supabase DB 적재")
+    print(f"[Step 3/5] DB 적재 (sink={sink}{', delta' if delta else ''})")
     print("-" * 40)
-    from scripts.etl.load_db import (
-        get_supabase_client,
-        load_characters,
-        load_readings,
-        load_phonetic_classes,
-        load_decompositions,
-    )
-
-    supabase = get_supabase_client()
-    load_characters(supabase, target, ids_map_expr)
-    load_readings(supabase, target)
-    load_phonetic_classes(supabase, target)
-    load_decompositions(supabase, target, ids_map_expr)
+    supabase = None
+    stats = None
+    if sink != "rest":
+        from scripts.etl.sinks import open_sink
+        from scripts.etl.load_db import make_id_resolvers, load_into
+
+        path = sink_path or DEFAULT_SINK_PATHS.get(sink)
+        # 결정적 id로 모두 해석되므로 DB 조회 없이 적재
+        stats = load_into(
+            open_sink(sink, path), corpus, make_id_resolvers(None, corpus),
+            documents=pipeline_documents(sink),
+        )
+        if stats is None and sink != "copy":
+            raise RuntimeError(f"{sink} sink가 검증 집계를 돌려주지 않았습니다")
+    else:
+        from scripts.etl.load_db import (
+            get_supabase_client,
+            make_id_resolvers,
+            print_resolver_stats,
+            load_all,
+        )
+
+        supabase = get_supabase_client()
+        resolvers = make_id_resolvers(supabase, corpus)
+        if delta:
+            from scripts.etl.delta import compute_deltas, format_delta_report, apply_deltas
+
+            with stage("delta.compute"):
+                deltas = compute_deltas(supabase, corpus, resolvers, prune=prune)
+            print(format_delta_report(deltas))
+            if dry_run:
+                elapsed = time.time() - start
+                print(f"\n[Dry-run 완료] 변경분 리포트만 출력 ({elapsed:.1f}초)")
+                print("  → --dry-run 모드: DB에 쓰지 않습니다")
+                return
+            with stage("delta.apply") as s:
+                apply_deltas(
+                    supabase, deltas,
+                    max_in_flight=max_in_flight, batch_bytes=batch_kb * 1024,
+                )
+                s.rows_out = sum(d.changed for d in deltas.values())
+            # 문서는 지문 비교로 바뀐 것만 다시 씀 (변경분이 없어도 큐레이션 수정분 반영)
+            from scripts.etl.documents import refresh_documents
+
+            refresh_documents(supabase, corpus, resolvers)
+        else:
+            from scripts.etl.documents import DocumentBuilder
+
+            load_all(
+                supabase, corpus, resolvers,
+                max_in_flight=max_in_flight, batch_bytes=batch_kb * 1024,
+                checkpoint=checkpoint,
+                documents=DocumentBuilder(supabase),
+            )
+        print_resolver_stats(resolvers)
     print()
 
     # ── Step 4: Post-ETL 검증 ────────────────────
     print("[Step 4/5] Post-ETL 검증")
     print("-" * 40)
-    vr_post = validate_post_etl(supabase)
+    if stats is None and supabase is None:
+        from scripts.etl.load_db import get_supabase_client
+
+        supabase = get_supabase_client()
+    vr_post = validate_post_etl(
+        supabase,
+        expected_count=len(corpus.target),
+        min_ids_coverage=COVERAGE_THRESHOLDS[corpus.scale][0],
+        require_readings=corpus.scale != "full",
+        stats=stats,
+    )
     print(vr_post.report())
     print()
 
@@ -103,9 +328,9 @@ def run_pipeline(dry_run: bool = False) -> None:
     print("[Step 5/5] 결과 리포트")
     print("=" * 60)
     print(f"  소요 시간: {elapsed:.1f}초")
-    print(f"  대상 글자: {len(target):,}자")
-    print(f"  IDS 분해: {len(ids_map_expr):,}자")
-    print(f"  Pre-ETL:  {'PASS' if vr_pre.all_passed else 'FAIL'}")
+    print(f"  대상 글자: {len(corpus.target):,}자")
+    print(f"  IDS 분해: {len(corpus.ids_map_expr):,}자")
+    print("  Pre-ETL:  PASS")
     print(f"  Post-ETL: {'PASS' if vr_post.all_passed else 'FAIL'}")
     print("=" * 60)
 
@@ -116,9 +341,147 @@ def run_pipeline(dry_run: bool = False) -> None:
     print("\nPhase 1 ETL 파이프라인 완료!")
 
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Phase 1 ETL 파이프라인")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="파싱 + 검증만 실행 (DB 적재 생략)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help=f"Unihan 파싱 프로세스 수 (기본 1, 0이면 CPU 수 = {os.cpu_count()})",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Unihan을 배열 기반 UnihanStore로 보관 (대규모 대상에서 메모리 절약)",
+    )
+    parser.add_argument(
+        "--scale",
+        choices=SCALES,
+        default="default",
+        help="대상 규모: default(획수순 2,000자) / hangul(kHangul 전체) / full(Unihan 전체)",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=8,
+        metavar="N",
+        help="동시에 보내는 upsert 요청 수 상한 (기본 8, 지연/스로틀링에 따라 자동 조절)",
+    )
+    parser.add_argument(
+        "--batch-kb",
+        type=int,
+        default=32,
+        metavar="KB",
+        help="upsert 배치의 시작 크기 (JSON 본문 KB, 기본 32, 실행 중 자동 조절)",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="DB 현재 상태와 비교해 바뀐 행만 기록 (--dry-run과 함께면 변경분 리포트만)",
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="--delta에서 원본에 없는 characters / phonetic_classes 행도 삭제 (연결 데이터 CASCADE 삭제)",
+    )
+    parser.add_argument(
+        "--sink",
+        choices=SINK_KINDS,
+        default="rest",
+        help="적재 대상: rest(Supabase REST upsert) / copy(Postgres 직접 연결 + COPY, psycopg 필요)"
+        " / sqlite(로컬 SQLite 파일) / jsonl(테이블별 JSONL 파일)",
+    )
+    parser.add_argument(
+        "--sink-path",
+        type=Path,
+        metavar="PATH",
+        help="sqlite / jsonl sink의 출력 경로 (기본 data/hanja.sqlite, data/etl_jsonl/)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="파싱하면서 적재 (hangul / full 규모 전용, --delta / --resume / --dry-run 제외)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="중단된 적재를 체크포인트(data/.cache/load_state.json)부터 이어서 실행",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        metavar="PATH",
+        help="단계별 계측 JSON 경로 (기본 data/etl_reports/run-<시각>.json)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="단계별 cProfile 덤프를 보고서 옆 <보고서>.prof/ 디렉터리에 저장",
+    )
+    args = parser.parse_args(argv)
+    if args.prune and not args.delta:
+        parser.error("--prune은 --delta와 함께 사용하세요")
+    if args.resume and (args.delta or args.dry_run):
+        parser.error("--resume은 전체 적재에서만 사용합니다 (--delta는 매번 DB와 비교하므로 불필요)")
+    if args.sink != "rest" and (args.delta or args.resume):
+        parser.error("--delta / --resume은 rest sink에서만 사용합니다 (다른 sink는 매번 전체를 한 번에 반영)")
+    if args.columnar and args.jobs != 1:
+        parser.error("--columnar는 단일 프로세스로 파싱합니다 (--jobs와 함께 쓸 수 없음)")
+    if args.sink_path is not None and args.sink not in DEFAULT_SINK_PATHS:
+        parser.error("--sink-path는 --sink sqlite / jsonl에서만 사용합니다")
+    if args.stream and args.scale not in STREAM_SCALES:
+        parser.error("--stream은 --scale hangul / full에서만 사용합니다 (default는 획수 정렬에 전체 파싱이 필요)")
+    if args.stream and (args.delta or args.resume or args.dry_run):
+        parser.error("--stream은 --delta / --resume / --dry-run과 함께 쓸 수 없습니다")
+    return args
+
+
 def main():
-    dry_run = "--dry-run" in sys.argv
-    run_pipeline(dry_run=dry_run)
+    args = parse_args()
+    report_path = args.report or default_report_path(DATA_DIR)
+    report = RunReport.start(
+        profile_dir=report_path.with_suffix(".prof") if args.profile else None,
+    )
+    report.meta = {"scale": args.scale, "sink": args.sink, "stream": args.stream, "jobs": args.jobs}
+    try:
+        if args.stream:
+            run_stream_pipeline(
+                scale=args.scale,
+                max_in_flight=args.max_in_flight,
+                batch_kb=args.batch_kb,
+                sink=args.sink,
+                sink_path=args.sink_path,
+            )
+            return
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        run_pipeline(
+            dry_run=args.dry_run,
+            jobs=jobs,
+            columnar=args.columnar,
+            scale=args.scale,
+            max_in_flight=args.max_in_flight,
+            batch_kb=args.batch_kb,
+            delta=args.delta,
+            prune=args.prune,
+            resume=args.resume,
+            sink=args.sink,
+            sink_path=args.sink_path,
+        )
+    finally:
+        # 실패(sys.exit 포함)해도 그때까지의 단계는 남김
+        report.finish()
+        print()
+        print("[계측] 단계별 소요")
+        print(report.table())
+        print(f"  → 보고서: {report.write_json(report_path)}")
+        if report.profile_dir is not None:
+            print(f"  → 프로파일: {report.profile_dir}/ (python -m pstats <파일>)")
 
 
 if __name__ == "__main__":
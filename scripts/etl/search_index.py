@@ -0,0 +1,142 @@
+"""
+search_index.py — 검색어 행(search_terms) 생성
+Phase 1 ETL 파이프라인 컴포넌트
+
+글자별 상세 문서(documents.iter_document_rows의 doc)에서 검색어를 뽑는다.
+search_characters() RPC(011_search_terms.sql)가 term 접두사 / 일치 / 트라이그램으로 찾고
+weight로 순위를 매긴다. 모든 term은 NFC + 소문자.
+    char      글자 자체
+    reading   음 (kHangul + 큐레이션 음) — 대표음이 아니면 가중치 낮춤
+    partial   받침을 뺀 음 ('국' → '구') — 입력 중인 음절로 찾기
+    choseong  초성 ('국' → 'ㄱ') — 초성만 입력해 찾기
+    def       unihan_def 영어 단어 (첫 뜻풀이의 단어가 더 높음)
+    gloss     큐레이션 풀이 (의미 트리 label / short_gloss, 부수 훈) 단어
+strokes / radical은 필터(facet)용으로 행마다 함께 둔다.
+
+사용법:
+    rows = list(iter_search_term_rows(doc))
+    choseong("청")   # 'ㅊ'
+"""
+
+import re
+import unicodedata
+from typing import Iterator
+
+# 종류별 기본 가중치 — 일치(3) / 접두사(2) / 유사도 배율과 곱해 순위가 된다
+TERM_WEIGHTS = {
+    "char": 1.0,
+    "reading": 1.0,
+    "gloss": 0.9,
+    "def": 0.7,
+    "partial": 0.6,
+    "choseong": 0.5,
+}
+SECONDARY_READING = 0.8  # 대표음이 아닌 음
+LATER_SENSE = 0.7        # unihan_def 두 번째 뜻풀이(;) 이후 단어
+MAX_TERM_CHARS = 40
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+_WORD_EN = re.compile(r"[a-z]+(?:['-][a-z]+)*")
+_WORD = re.compile(r"\w+")
+STOPWORDS = frozenset(
+    "a an and as at be by for from in into is it of on or the to with also etc same".split()
+)
+
+
+def normalize_term(text: str) -> str:
+    return unicodedata.normalize("NFC", text).strip().lower()
+
+
+def _syllables(text: str) -> Iterator[tuple[int, int]]:
+    """한글 음절 → (음절 오프셋, 종성 인덱스), 음절이 아닌 문자는 (-1, 0)"""
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            yield offset, offset % 28
+        else:
+            yield -1, 0
+
+
+def choseong(text: str) -> str:
+    """음절마다 초성 ('한자' → 'ㅎㅈ'), 한글 음절이 아닌 문자는 그대로"""
+    return "".join(
+        _CHOSEONG[offset // 588] if offset >= 0 else ch
+        for ch, (offset, _) in zip(text, _syllables(text))
+    )
+
+
+def without_final(text: str) -> str:
+    """마지막 음절의 받침을 뺀 형태 ('국' → '구') — 받침이 없으면 그대로"""
+    if not text:
+        return text
+    offset, final = next(_syllables(text[-1]))
+    if offset < 0 or final == 0:
+        return text
+    return text[:-1] + chr(_HANGUL_BASE + offset - final)
+
+
+def definition_terms(definition: str) -> Iterator[tuple[str, float]]:
+    """unihan_def → (단어, 가중치) — 첫 뜻풀이(; 앞) 단어가 더 높음"""
+    for i, sense in enumerate(definition.lower().split(";")):
+        weight = TERM_WEIGHTS["def"] * (1.0 if i == 0 else LATER_SENSE)
+        for word in _WORD_EN.findall(sense):
+            if len(word) >= 2 and word not in STOPWORDS:
+                yield word, weight
+
+
+def _gloss_texts(doc: dict) -> Iterator[str]:
+    stack = list(doc.get("meaning_tree") or [])
+    while stack:
+        node = stack.pop()
+        yield node.get("label") or ""
+        yield node.get("short_gloss") or ""
+        stack.extend(node.get("children") or [])
+    radical = doc.get("radical")
+    if radical:
+        yield radical.get("reading_hun") or ""
+
+
+def iter_search_terms(doc: dict) -> Iterator[tuple[str, str, float]]:
+    """문서 → (kind, term, weight) — 같은 (kind, term)은 가장 높은 가중치 하나"""
+    best: dict[tuple[str, str], float] = {}
+
+    def add(kind: str, term: str, weight: float) -> None:
+        term = normalize_term(term)[:MAX_TERM_CHARS]
+        if term and weight > best.get((kind, term), 0.0):
+            best[(kind, term)] = weight
+
+    character = doc["character"]
+    add("char", character["char"], TERM_WEIGHTS["char"])
+    for reading in character["readings"]:
+        value = normalize_term(reading["value"])
+        scale = 1.0 if reading["is_primary"] else SECONDARY_READING
+        add("reading", value, TERM_WEIGHTS["reading"] * scale)
+        add("choseong", choseong(value), TERM_WEIGHTS["choseong"] * scale)
+        partial = without_final(value)
+        if partial != value:
+            add("partial", partial, TERM_WEIGHTS["partial"] * scale)
+    for word, weight in definition_terms(character.get("unihan_def") or ""):
+        add("def", word, weight)
+    for text in _gloss_texts(doc):
+        for word in _WORD.findall(text):
+            if not word.isdigit():
+                add("gloss", word, TERM_WEIGHTS["gloss"])
+
+    for (kind, term), weight in sorted(best.items()):
+        yield kind, term, weight
+
+
+def iter_search_term_rows(doc: dict) -> Iterator[dict]:
+    """search_terms 행 — 검색어 + facet (strokes / radical)"""
+    character = doc["character"]
+    for kind, term, weight in iter_search_terms(doc):
+        yield {
+            "character_id": character["id"],
+            "kind": kind,
+            "term": term,
+            "weight": round(weight, 3),
+            "strokes": character["strokes"],
+            "radical": character["radical"],
+        }
@@ -0,0 +1,430 @@
+"""
+sinks.py — 적재 대상(sink) 인터페이스 + 로컬 sink (SQLite / JSONL)
+Phase 1 ETL 파이프라인 컴포넌트
+
+load_db의 적재 함수는 Sink의 upsert()만 호출한다. 구현:
+  rest    Supabase REST upsert (upserter.BatchUpserter)
+  copy    Postgres 직접 연결 + COPY (copy_backend.CopySink)
+  sqlite  hanja 스키마를 흉내 낸 로컬 SQLite 파일 — 네트워크 없이 적재/검증
+  jsonl   테이블별 JSON Lines 파일 — 실행 간 출력 diff용 (키 정렬, 생성 순서 유지)
+
+finish()는 적재가 모두 성공했을 때 한 번 호출되며 (커밋 등),
+etl_validation_stats()와 같은 형식의 집계를 돌려주면 Post-ETL 검증에 쓰인다.
+
+사용법:
+    sink = open_sink("sqlite", DATA_DIR / "hanja.sqlite")
+    stats = load_into(sink, corpus, resolvers)   # load_db
+"""
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, TextIO
+
+SINK_KINDS = ("rest", "copy", "sqlite", "jsonl")
+LOCAL_BATCH_ROWS = 1000  # SQLite executemany 단위
+
+
+@dataclass
+class BatchError:
+    index: int       # 테이블 내 배치 번호 (0부터)
+    rows: int        # 배치 행 수
+    error: BaseException
+
+
+@dataclass
+class UpsertResult:
+    table: str
+    rows: int = 0
+    batches: int = 0
+    errors: list[BatchError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class UpsertError(RuntimeError):
+    def __init__(self, result: UpsertResult) -> None:
+        self.result = result
+        indexes = ", ".join(str(e.index) for e in result.errors[:10])
+        super().__init__(
+            f"{result.table}: 배치 {len(result.errors)}개 실패 (배치 번호: {indexes}) — "
+            f"첫 오류: {result.errors[0].error}"
+        )
+
+
+class Sink:
+    """적재 대상 공통 인터페이스"""
+
+    name = "sink"
+    checkpoint = None  # 체크포인트를 지원하는 sink만 설정 (rest)
+
+    async def upsert(
+        self,
+        table: str,
+        rows: Iterable[dict],
+        on_conflict: str | None = None,
+        total: int | None = None,
+        on_response: Callable[[list[dict]], None] | None = None,
+    ) -> UpsertResult:
+        raise NotImplementedError
+
+    async def delete(
+        self,
+        table: str,
+        key_columns: tuple[str, ...],
+        keys: Iterable[dict],
+        total: int | None = None,
+    ) -> UpsertResult:
+        raise NotImplementedError(f"{self.name} sink는 삭제를 지원하지 않습니다")
+
+    def finish(self) -> dict | None:
+        """전체 적재 성공 후 1회 — 커밋 / 파일 마무리, 검증 집계 반환 (없으면 None)"""
+        return None
+
+    def close(self) -> None:
+        pass
+
+    def summary(self) -> str:
+        return ""
+
+
+class _LocalSink(Sink):
+    """로컬 sink 공통 — 처리량 집계"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.started = time.monotonic()
+        self.rows = 0
+        self.deleted = 0
+
+    def summary(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return (
+            f"  [{self.name}] {self.rows:,}행 / {elapsed:.1f}초 = {self.rows / elapsed:,.0f} rows/sec"
+            + (f", 삭제 {self.deleted:,}행" if self.deleted else "")
+            + f" → {self.path}"
+        )
+
+
+# ── SQLite ───────────────────────────────────────
+
+# hanja 스키마 (001_initial.sql) 중 ETL이 쓰는 테이블 — UUID는 TEXT, 배열은 JSON TEXT
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    id          TEXT PRIMARY KEY,
+    char        TEXT UNIQUE NOT NULL,
+    codepoint   INTEGER NOT NULL,
+    strokes     INTEGER,
+    radical     TEXT,
+    unihan_def  TEXT,
+    grade_level INTEGER
+);
+CREATE TABLE IF NOT EXISTS readings (
+    id           TEXT PRIMARY KEY,
+    character_id TEXT NOT NULL REFERENCES characters(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    type         TEXT NOT NULL DEFAULT 'kHangul',
+    value        TEXT NOT NULL,
+    is_primary   INTEGER DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_readings_character_id ON readings (character_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_readings_natural_key ON readings (character_id, type, value);
+CREATE TABLE IF NOT EXISTS phonetic_classes (
+    id   TEXT PRIMARY KEY,
+    code TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS character_phonetic_class (
+    character_id      TEXT NOT NULL REFERENCES characters(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    phonetic_class_id TEXT NOT NULL REFERENCES phonetic_classes(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    PRIMARY KEY (character_id, phonetic_class_id)
+);
+CREATE TABLE IF NOT EXISTS decompositions (
+    character_id TEXT PRIMARY KEY REFERENCES characters(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    ids          TEXT,
+    components   TEXT NOT NULL,
+    confidence   INTEGER DEFAULT 90,
+    tree         TEXT,
+    depth        INTEGER,
+    primitives   TEXT
+);
+CREATE TABLE IF NOT EXISTS component_index (
+    character_id TEXT NOT NULL REFERENCES characters(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    component    TEXT NOT NULL,
+    char         TEXT NOT NULL,
+    position     INTEGER,
+    operator     TEXT,
+    transitive   INTEGER NOT NULL DEFAULT 0,
+    via          TEXT,
+    strokes      INTEGER,
+    frequency    INTEGER,
+    codepoint    INTEGER NOT NULL,
+    PRIMARY KEY (character_id, component)
+);
+CREATE INDEX IF NOT EXISTS idx_component_index_lookup
+    ON component_index (component, frequency, strokes, codepoint);
+CREATE TABLE IF NOT EXISTS phonetic_series (
+    phonetic_class_id TEXT PRIMARY KEY REFERENCES phonetic_classes(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    code              TEXT NOT NULL,
+    root              TEXT,
+    main_reading      TEXT,
+    consistency       REAL,
+    member_count      INTEGER NOT NULL,
+    readings          TEXT NOT NULL,
+    members           TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS character_documents (
+    char         TEXT PRIMARY KEY,
+    character_id TEXT UNIQUE NOT NULL REFERENCES characters(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    doc          TEXT NOT NULL,
+    doc_hash     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_terms (
+    character_id TEXT NOT NULL REFERENCES characters(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    kind         TEXT NOT NULL,
+    term         TEXT NOT NULL,
+    weight       REAL NOT NULL,
+    strokes      INTEGER,
+    radical      TEXT,
+    PRIMARY KEY (character_id, kind, term)
+);
+CREATE INDEX IF NOT EXISTS idx_search_terms_term ON search_terms (term);
+"""
+
+# on_conflict가 없을 때의 충돌 키 (PK)
+SQLITE_PRIMARY_KEYS = {
+    "characters": ("id",),
+    "readings": ("id",),
+    "phonetic_classes": ("id",),
+    "character_phonetic_class": ("character_id", "phonetic_class_id"),
+    "decompositions": ("character_id",),
+    "component_index": ("character_id", "component"),
+    "phonetic_series": ("phonetic_class_id",),
+    "character_documents": ("char",),
+    "search_terms": ("character_id", "kind", "term"),
+}
+
+# etl_validation_stats()와 같은 형식
+SQLITE_STATS_SQL = """
+SELECT
+    (SELECT count(*) FROM characters),
+    (SELECT count(*) FROM readings),
+    (SELECT count(*) FROM characters c
+      WHERE NOT EXISTS (SELECT 1 FROM readings r WHERE r.character_id = c.id)),
+    (SELECT count(*) FROM decompositions),
+    (SELECT count(*) FROM phonetic_classes),
+    (SELECT count(*) FROM character_phonetic_class)
+"""
+STATS_KEYS = (
+    "characters", "readings", "characters_without_readings",
+    "decompositions", "phonetic_classes", "character_phonetic_links",
+)
+
+
+def _sqlite_value(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class SqliteSink(_LocalSink):
+    """
+    로컬 SQLite 파일에 upsert — 실행 전체가 트랜잭션 하나 (finish()에서 커밋)
+    같은 파일에 다시 적재하면 기존 행은 ON CONFLICT로 갱신된다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SQLITE_SCHEMA)
+        self._statements: dict[tuple, str] = {}
+
+    def _upsert_sql(self, table: str, columns: tuple[str, ...], on_conflict: str | None) -> str:
+        key = (table, columns, on_conflict)
+        sql = self._statements.get(key)
+        if sql is None:
+            conflict = tuple(on_conflict.split(",")) if on_conflict else SQLITE_PRIMARY_KEYS[table]
+            updates = [c for c in columns if c not in conflict]
+            sql = (
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)}) "
+                f"ON CONFLICT ({', '.join(conflict)}) "
+                + (
+                    "DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in updates)
+                    if updates else "DO NOTHING"
+                )
+            )
+            self._statements[key] = sql
+        return sql
+
+    async def upsert(
+        self,
+        table: str,
+        rows: Iterable[dict],
+        on_conflict: str | None = None,
+        total: int | None = None,
+        on_response: Callable[[list[dict]], None] | None = None,
+    ) -> UpsertResult:
+        result = UpsertResult(table)
+        batch: list[dict] = []
+
+        def flush() -> None:
+            columns = tuple(batch[0])
+            self.conn.executemany(
+                self._upsert_sql(table, columns, on_conflict),
+                [tuple(_sqlite_value(row.get(c)) for c in columns) for row in batch],
+            )
+            if on_response is not None:
+                on_response(batch)
+            result.rows += len(batch)
+            result.batches += 1
+
+        for row in rows:
+            # 컬럼 구성이 바뀌면 (선택 컬럼 유무) 배치를 끊음
+            if batch and (len(batch) >= LOCAL_BATCH_ROWS or row.keys() != batch[0].keys()):
+                flush()
+                batch = []
+            batch.append(row)
+        if batch:
+            flush()
+        self.rows += result.rows
+        return result
+
+    async def delete(
+        self,
+        table: str,
+        key_columns: tuple[str, ...],
+        keys: Iterable[dict],
+        total: int | None = None,
+    ) -> UpsertResult:
+        result = UpsertResult(table)
+        where = " AND ".join(f"{c} = ?" for c in key_columns)
+        params = [tuple(k[c] for c in key_columns) for k in keys]
+        # executemany의 rowcount는 키마다 지운 행 수의 합
+        cursor = self.conn.executemany(f"DELETE FROM {table} WHERE {where}", params)
+        result.rows = max(cursor.rowcount, 0)
+        result.batches = len(params)
+        self.deleted += result.rows
+        return result
+
+    def finish(self) -> dict:
+        self.conn.commit()
+        values = self.conn.execute(SQLITE_STATS_SQL).fetchone()
+        return dict(zip(STATS_KEYS, values))
+
+    def close(self) -> None:
+        # finish() 없이 닫히면 (적재 실패) 커밋하지 않은 변경은 버려진다
+        self.conn.close()
+
+
+# ── JSONL ────────────────────────────────────────
+
+
+class JsonlSink(_LocalSink):
+    """
+    <dir>/<table>.jsonl에 행을 한 줄씩 기록 (키 정렬 JSON) — 실행마다 새로 씀
+    삭제는 <table>.deletes.jsonl에 키만 기록한다.
+    검증 집계는 기록한 행으로 계산 (같은 키를 두 번 쓰면 두 번 센다).
+    """
+
+    name = "jsonl"
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        path.mkdir(parents=True, exist_ok=True)
+        # 이전 실행의 테이블 파일만 지움 (디렉터리의 다른 파일은 그대로)
+        for table in SQLITE_PRIMARY_KEYS:
+            for name in (f"{table}.jsonl", f"{table}.deletes.jsonl"):
+                (path / name).unlink(missing_ok=True)
+        self._files: dict[str, TextIO] = {}
+        self._counts: dict[str, int] = {}
+        self._char_ids: set[str] = set()
+        self._reading_char_ids: set[str] = set()
+
+    def _file(self, name: str) -> TextIO:
+        f = self._files.get(name)
+        if f is None:
+            f = self._files[name] = (self.path / f"{name}.jsonl").open("w", encoding="utf-8")
+        return f
+
+    async def upsert(
+        self,
+        table: str,
+        rows: Iterable[dict],
+        on_conflict: str | None = None,
+        total: int | None = None,
+        on_response: Callable[[list[dict]], None] | None = None,
+    ) -> UpsertResult:
+        result = UpsertResult(table)
+        f = self._file(table)
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False, sort_keys=True) + "\n")
+            if table == "characters":
+                self._char_ids.add(row["id"])
+            elif table == "readings":
+                self._reading_char_ids.add(row["character_id"])
+            if on_response is not None:
+                on_response([row])
+            result.rows += 1
+        result.batches = 1
+        self._counts[table] = self._counts.get(table, 0) + result.rows
+        self.rows += result.rows
+        return result
+
+    async def delete(
+        self,
+        table: str,
+        key_columns: tuple[str, ...],
+        keys: Iterable[dict],
+        total: int | None = None,
+    ) -> UpsertResult:
+        result = UpsertResult(table)
+        f = self._file(f"{table}.deletes")
+        for key in keys:
+            f.write(json.dumps({c: key[c] for c in key_columns}, sort_keys=True) + "\n")
+            result.rows += 1
+        self.deleted += result.rows
+        return result
+
+    def finish(self) -> dict:
+        for f in self._files.values():
+            f.flush()
+        return {
+            "characters": self._counts.get("characters", 0),
+            "readings": self._counts.get("readings", 0),
+            "characters_without_readings": len(self._char_ids - self._reading_char_ids),
+            "decompositions": self._counts.get("decompositions", 0),
+            "phonetic_classes": self._counts.get("phonetic_classes", 0),
+            "character_phonetic_links": self._counts.get("character_phonetic_class", 0),
+        }
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+
+def open_sink(kind: str, path: Path | None = None, supabase: Any = None, **options: Any) -> Sink:
+    """
+    kind별 sink 생성
+    rest는 supabase 클라이언트와 BatchUpserter 옵션(max_in_flight 등), copy는 database_url(선택),
+    sqlite / jsonl은 path가 필요하다.
+    """
+    if kind == "rest":
+        from scripts.etl.upserter import BatchUpserter
+        return BatchUpserter(supabase, **options)
+    if kind == "copy":
+        from scripts.etl.copy_backend import CopySink
+        return CopySink(**options)
+    if kind == "sqlite":
+        return SqliteSink(path)
+    if kind == "jsonl":
+        return JsonlSink(path)
+    raise ValueError(f"알 수 없는 sink: {kind} (가능: {', '.join(SINK_KINDS)})")
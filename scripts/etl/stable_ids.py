@@ -0,0 +1,39 @@
+"""
+stable_ids.py — ETL이 직접 생성하는 결정적 UUID
+Phase 1 ETL 파이프라인 컴포넌트
+
+서버 기본값(uuid_generate_v4) 대신 코드포인트·phonetic 코드·음 값으로
+이름 기반 UUID(v5)를 만든다. 같은 입력이면 항상 같은 id가 나오므로
+characters 적재 후 id를 다시 조회할 필요가 없고, 재실행도 멱등이다.
+
+사용법:
+    from scripts.etl.stable_ids import character_id, reading_id, phonetic_class_id
+
+    character_id(0x6E05)                  # '…' (항상 동일)
+    reading_id(0x6E05, "kHangul", "청")
+"""
+
+import uuid
+
+# 프로젝트 고정 네임스페이스 — 바꾸면 모든 id가 바뀌므로 변경 금지
+HANJA_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://github.com/Taek-D/hanja-app#hanja")
+
+
+def _stable_id(kind: str, *parts: object) -> str:
+    name = ":".join([kind, *(str(p) for p in parts)])
+    return str(uuid.uuid5(HANJA_NAMESPACE, name))
+
+
+def character_id(codepoint: int) -> str:
+    """characters.id — 코드포인트 기준 (글자 문자열이 아니라 정수로 고정)"""
+    return _stable_id("character", f"{codepoint:X}")
+
+
+def phonetic_class_id(code: str) -> str:
+    """phonetic_classes.id — kPhonetic 코드 기준"""
+    return _stable_id("phonetic_class", code)
+
+
+def reading_id(codepoint: int, reading_type: str, value: str) -> str:
+    """readings.id — (글자, 읽기 유형, 음) 기준"""
+    return _stable_id("reading", f"{codepoint:X}", reading_type, value)
@@ -0,0 +1,267 @@
+"""
+stream.py — 파싱 / 행 생성 / 적재를 겹쳐 실행하는 스트리밍 파이프라인
+Phase 1 ETL 파이프라인 컴포넌트
+
+단계별 실행(전체 파싱 → 대상 선정 → 검증 → 적재)은 소요 시간이 파싱 + 적재의 합이다.
+스트리밍 모드는 Unihan을 codepoint 순으로 읽으며(iter_unihan_records)
+대상 글자를 STREAM_CHUNK자씩 묶어 크기 제한 큐로 흘려보낸다.
+
+  [파싱 스레드] ─큐─▶ [1단계: characters + 새 phonetic_classes] ─큐─▶ [2단계: readings / decompositions / 연결 / 부품 색인]
+
+- 큐가 가득 차면 앞 단계가 기다린다 (backpressure) → 메모리는 큐 깊이 × 묶음 크기로 제한
+- 1단계가 끝난 묶음만 2단계로 넘어가므로 FK 순서가 지켜진다
+- id는 결정적(stable_ids)이라 묶음 안에서 바로 계산 — DB 조회 없음
+- phonetic_series(계열 요약)는 구성 글자 전체가 필요해 마지막 묶음 뒤에 한 번 적재
+  (kPhonetic 보유 글자만 모아 둠)
+- documents(DocumentBuilder)를 주면 계열 요약 뒤에 글자별 문서 + 검색어를 적재
+  (문서에 계열 형제가 들어가므로 대상 글자를 모두 모아 둠 — 이때 메모리는 단계별 실행과 같음)
+
+획수순 상위 N자를 고르는 default 규모는 전체를 읽어야 대상이 정해지므로 지원하지 않는다
+(hangul / full 전용). Pre-ETL 검증은 흘려보내며 센 집계로 적재 후에 판정한다.
+
+사용법:
+    sink = open_sink("rest", supabase=supabase)
+    stats, db_stats = stream_load(sink, DATA_DIR / "Unihan.zip", DATA_DIR / "ids.txt", scale="hangul")
+    stream_load(sink, unihan_path, ids_path, scale="full", documents=DocumentBuilder(supabase))  # 문서까지
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.corpus import Corpus
+from scripts.etl.cache import cached_parse_ids_with_expr
+from scripts.etl.parse_unihan import STREAM_SCALES, iter_unihan_records
+from scripts.etl.load_db import (
+    READINGS_CONFLICT,
+    iter_character_rows,
+    iter_reading_rows,
+    iter_phonetic_link_rows,
+    iter_decomposition_rows,
+    iter_component_index_rows,
+    iter_phonetic_series_rows,
+    make_id_resolvers,
+)
+from scripts.etl.stable_ids import phonetic_class_id
+from scripts.etl.ids_tree import IdsResolver
+from scripts.etl.sinks import Sink
+from scripts.etl.instrument import stage
+
+STREAM_CHUNK = 2000  # 큐 항목 하나의 글자 수
+QUEUE_DEPTH = 4      # 단계 사이 큐에 쌓일 수 있는 묶음 수
+PUT_POLL = 0.5       # 파싱 스레드가 소비 측 중단을 확인하는 간격 (초)
+
+
+@dataclass
+class StreamStats:
+    """흘려보내며 센 Pre-ETL 집계 + 단계별 대기 시간"""
+    scale: str
+    count: int = 0              # 대상 글자 수
+    ids_matched: int = 0
+    phonetic_count: int = 0
+    no_hangul: int = 0
+    chunks: int = 0
+    parse_wait: float = 0.0     # 1단계가 파싱을 기다린 시간
+    backpressure: float = 0.0   # 파싱 스레드가 큐 자리를 기다린 시간
+
+    def summary(self) -> str:
+        return (
+            f"  [stream] {self.count:,}자 / 묶음 {self.chunks}개, "
+            f"파싱 대기 {self.parse_wait:.1f}초, 적재 대기(backpressure) {self.backpressure:.1f}초"
+        )
+
+
+def _select(record: dict, scale: str) -> bool:
+    return scale == "full" or "kHangul" in record
+
+
+def iter_target_chunks(
+    unihan_path: Path,
+    scale: str,
+    chunk_size: int = STREAM_CHUNK,
+) -> Iterator[dict[str, dict]]:
+    """대상 글자를 codepoint 순으로 {codepoint_str: record} 묶음 단위로"""
+    if scale not in STREAM_SCALES:
+        raise ValueError(f"스트리밍은 {'/'.join(STREAM_SCALES)} 규모만 지원합니다 (scale={scale})")
+    chunk: dict[str, dict] = {}
+    for cp_str, record in iter_unihan_records(unihan_path):
+        if not _select(record, scale):
+            continue
+        chunk[cp_str] = record
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = {}
+    if chunk:
+        yield chunk
+
+
+async def _produce(
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue,
+    chunks: Iterator[dict[str, dict]],
+    stats: StreamStats,
+    stop: threading.Event,
+) -> None:
+    """파싱 스레드 — 묶음을 큐에 넣고, 큐가 차면 자리가 날 때까지 대기"""
+
+    def put(item: dict | None) -> bool:
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        started = time.monotonic()
+        while True:
+            try:
+                future.result(PUT_POLL)
+                stats.backpressure += time.monotonic() - started
+                return True
+            except FutureTimeout:
+                if stop.is_set():
+                    future.cancel()
+                    return False
+
+    def run() -> None:
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        finally:
+            if not stop.is_set():
+                put(None)
+
+    await loop.run_in_executor(None, run)
+
+
+async def stream_load_async(
+    sink: Sink,
+    chunks: Iterator[dict[str, dict]],
+    ids_map_expr: dict,
+    stats: StreamStats,
+    documents: Any = None,
+) -> None:
+    loop = asyncio.get_running_loop()
+    parsed: asyncio.Queue = asyncio.Queue(QUEUE_DEPTH)
+    loaded: asyncio.Queue = asyncio.Queue(QUEUE_DEPTH)
+    stop = threading.Event()
+    seen_codes: set[str] = set()
+    ids_resolver = IdsResolver(ids_map_expr)  # 묶음 사이에서 재귀 분해 메모 공유
+    series_target: dict[str, dict] = {}  # kPhonetic 보유 글자 — 계열 요약은 전체를 본 뒤 계산
+    doc_target: dict[str, dict] = {}     # documents가 있을 때만 — 대상 글자 전체
+
+    async def parents() -> None:
+        """1단계 — 묶음의 characters와 처음 나온 phonetic_classes"""
+        while True:
+            started = time.monotonic()
+            target = await parsed.get()
+            stats.parse_wait += time.monotonic() - started
+            if target is None:
+                await loaded.put(None)
+                return
+            corpus = Corpus(target, target, ids_map_expr, stats.scale)
+            stats.chunks += 1
+            stats.count += len(corpus)
+            for _, char, data in corpus.items():
+                stats.ids_matched += char in ids_map_expr
+                stats.phonetic_count += bool(data.get("kPhonetic"))
+                stats.no_hangul += not data.get("kHangul")
+
+            series_target.update((cp, data) for cp, data in target.items() if data.get("kPhonetic"))
+            if documents is not None:
+                doc_target.update(target)
+            codes = {data.get("kPhonetic", "") for data in target.values()} - seen_codes
+            codes.discard("")
+            seen_codes.update(codes)
+            jobs = [sink.upsert(
+                "characters", iter_character_rows(corpus), on_conflict="char", total=len(corpus),
+            )]
+            if codes:
+                jobs.append(sink.upsert(
+                    "phonetic_classes",
+                    [{"id": phonetic_class_id(code), "code": code} for code in sorted(codes)],
+                    on_conflict="code",
+                ))
+            await asyncio.gather(*jobs)
+            print(f"  [stream] 묶음 {stats.chunks}: characters {len(corpus):,}자 적재")
+            await loaded.put(corpus)
+
+    async def children() -> None:
+        """2단계 — characters가 적재된 묶음의 하위 테이블"""
+        while True:
+            corpus = await loaded.get()
+            if corpus is None:
+                print(ids_resolver.summary())
+                return
+            char_ids = {row["char"]: row["id"] for row in iter_character_rows(corpus)}
+            code_ids = {code: phonetic_class_id(code) for code in seen_codes}
+            await asyncio.gather(
+                sink.upsert(
+                    "readings", iter_reading_rows(corpus, char_ids), on_conflict=READINGS_CONFLICT,
+                ),
+                sink.upsert(
+                    "decompositions", iter_decomposition_rows(corpus, char_ids, ids_resolver),
+                    on_conflict="character_id",
+                ),
+                sink.upsert(
+                    "character_phonetic_class", iter_phonetic_link_rows(corpus, char_ids, code_ids),
+                ),
+                sink.upsert(
+                    "component_index", iter_component_index_rows(corpus, char_ids, ids_resolver),
+                ),
+            )
+
+    async def series() -> None:
+        """마지막 — 모든 묶음을 본 뒤 계열 요약 (phonetic_classes는 1단계에서 이미 적재)"""
+        corpus = Corpus(series_target, series_target, ids_map_expr, stats.scale)
+        char_ids = {row["char"]: row["id"] for row in iter_character_rows(corpus)}
+        result = await sink.upsert(
+            "phonetic_series", iter_phonetic_series_rows(corpus, char_ids, ids_resolver),
+        )
+        print(f"  [stream] phonetic_series {result.rows:,}개 계열 적재")
+
+    async def documents_last() -> None:
+        """계열 요약 뒤 — 글자별 문서 + 검색어 (documents.DocumentBuilder)"""
+        corpus = Corpus(doc_target, doc_target, ids_map_expr, stats.scale)
+        await documents.load(sink, corpus, make_id_resolvers(None, corpus))
+
+    producer = asyncio.ensure_future(_produce(loop, parsed, chunks, stats, stop))
+    try:
+        # 파싱이 중간에 실패해도 끝 표시는 가므로 1·2단계는 끝나지만, producer의 예외가 여기서 올라와
+        # 일부 글자만 본 series_target으로 계열 요약을 덮어쓰지 않는다
+        await asyncio.gather(producer, parents(), children())
+        await series()
+        if documents is not None:
+            await documents_last()
+    finally:
+        # 소비 측이 실패하면 파싱 스레드도 멈춤 (큐 대기 중이면 PUT_POLL 안에 빠져나옴)
+        stop.set()
+        await producer
+
+
+def stream_load(
+    sink: Sink,
+    unihan_path: Path,
+    ids_path: Path,
+    scale: str = "hangul",
+    documents: Any = None,
+) -> tuple[StreamStats, dict | None]:
+    """
+    동기 진입점 — 스트리밍 적재 (documents를 주면 글자별 문서까지) 후 sink.finish()
+    반환: (Pre-ETL 집계, sink의 검증 집계 또는 None). sink는 닫고 처리량 요약을 출력한다.
+    """
+    stats = StreamStats(scale)
+    ids_map_expr = cached_parse_ids_with_expr(ids_path)
+    chunks = iter_target_chunks(unihan_path, scale)
+    try:
+        with stage("stream.load") as s:
+            asyncio.run(stream_load_async(sink, chunks, ids_map_expr, stats, documents))
+            s.rows_out = stats.count
+        with stage(f"load.finish.{sink.name}"):
+            db_stats = sink.finish()
+    finally:
+        sink.close()
+        print(sink.summary())
+        print(stats.summary())
+    return stats, db_stats
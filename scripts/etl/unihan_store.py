@@ -0,0 +1,253 @@
+"""
+unihan_store.py — 배열 기반 Unihan 저장소 (메모리 절약형)
+Phase 1 ETL 파이프라인 컴포넌트
+
+parse_unihan()의 {codepoint_str: {field: value}} 딕셔너리 대신
+정수 코드포인트 배열 + 필드별 값 인덱스 배열 + 인턴된 값 블롭으로 저장한다.
+filter_target / load_* / 검증 코드가 쓰는 매핑 API(items, get, in)는 그대로 유지.
+
+사용법:
+    from scripts.etl.unihan_store import parse_unihan_store
+
+    store = parse_unihan_store(DATA_DIR / "Unihan.zip")
+    store["U+6E05"].get("kHangul")   # '청:0E'
+    print(store.memory_report())
+"""
+
+import zipfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterator
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.parse_unihan import (
+    UNIHAN_FIELDS,
+    UNIHAN_MEMBERS,
+    _line_pattern,
+    _iter_blocks,
+)
+from scripts.etl.instrument import stage
+
+MISSING = -1
+
+# 값이 거의 모두 고유한 필드 — 인턴 사전을 만들지 않고 바로 블롭에 추가
+UNIQUE_VALUE_FIELDS = {"kDefinition"}
+
+
+def _cp_key(cp: int) -> str:
+    """27141 → 'U+6E05'"""
+    return f"U+{cp:04X}"
+
+
+class UnihanRow(Mapping):
+    """저장소의 한 행 — {field: value} 딕셔너리처럼 동작하는 읽기 전용 뷰"""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "UnihanStore", row: int) -> None:
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, field: str) -> str:
+        value = self._store._value(field, self._row)
+        if value is None:
+            raise KeyError(field)
+        return value
+
+    def get(self, field: str, default=None):
+        value = self._store._value(field, self._row)
+        return default if value is None else value
+
+    def __contains__(self, field: object) -> bool:
+        column = self._store._columns.get(field)  # type: ignore[arg-type]
+        return column is not None and column[self._row] != MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        for field, column in self._store._columns.items():
+            if column[self._row] != MISSING:
+                yield field
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"UnihanRow({dict(self.items())!r})"
+
+
+class UnihanStore(Mapping):
+    """
+    codepoint_str → UnihanRow 매핑
+    행은 입력 순서를 유지하고, 조회는 정렬된 코드포인트 인덱스로 이진 탐색한다.
+    """
+
+    def __init__(
+        self,
+        codepoints: array,
+        columns: dict[str, array],
+        blobs: dict[str, bytes],
+        offsets: dict[str, array],
+    ) -> None:
+        self._codepoints = codepoints          # 행 번호 → 정수 코드포인트 (입력 순서)
+        self._columns = columns                # field → 행별 값 번호 (없으면 -1)
+        self._blobs = blobs                    # field → 인턴된 값들의 UTF-8 연결
+        self._offsets = offsets                # field → 값 번호별 blob 오프셋 (n+1개)
+        self._sorted_rows = array("i", sorted(range(len(codepoints)), key=codepoints.__getitem__))
+        self._sorted_cps = array("i", (codepoints[r] for r in self._sorted_rows))
+
+    # ── 내부 조회 ────────────────────────────────
+    def _value(self, field: str, row: int) -> str | None:
+        column = self._columns.get(field)
+        if column is None:
+            return None
+        idx = column[row]
+        if idx == MISSING:
+            return None
+        offsets = self._offsets[field]
+        return self._blobs[field][offsets[idx]:offsets[idx + 1]].decode("utf-8", "ignore")
+
+    def _row_of(self, cp_str: str) -> int | None:
+        try:
+            cp = int(cp_str[2:], 16)
+        except (TypeError, ValueError):
+            return None
+        i = bisect_left(self._sorted_cps, cp)
+        if i < len(self._sorted_cps) and self._sorted_cps[i] == cp:
+            return self._sorted_rows[i]
+        return None
+
+    # ── Mapping API ──────────────────────────────
+    def __getitem__(self, cp_str: str) -> UnihanRow:
+        row = self._row_of(cp_str)
+        if row is None:
+            raise KeyError(cp_str)
+        return UnihanRow(self, row)
+
+    def __contains__(self, cp_str: object) -> bool:
+        return isinstance(cp_str, str) and self._row_of(cp_str) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for cp in self._codepoints:
+            yield _cp_key(cp)
+
+    def __len__(self) -> int:
+        return len(self._codepoints)
+
+    def items(self):
+        # 행 순서대로 직접 순회 (키 → 행 이진 탐색 생략)
+        for row, cp in enumerate(self._codepoints):
+            yield _cp_key(cp), UnihanRow(self, row)
+
+    def values(self):
+        for row in range(len(self._codepoints)):
+            yield UnihanRow(self, row)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(self._columns)
+
+    # ── 메모리 리포트 ────────────────────────────
+    def nbytes(self) -> int:
+        """배열·블롭 버퍼 크기 합 (바이트)"""
+        total = sum(len(a) * a.itemsize for a in (self._codepoints, self._sorted_rows, self._sorted_cps))
+        for field in self._columns:
+            total += len(self._columns[field]) * self._columns[field].itemsize
+            total += len(self._offsets[field]) * self._offsets[field].itemsize
+            total += len(self._blobs[field])
+        return total
+
+    def memory_report(self) -> str:
+        lines = [f"  [store] {len(self):,}행, {self.nbytes() / 1024 / 1024:.1f}MB"]
+        for field, column in self._columns.items():
+            distinct = len(self._offsets[field]) - 1
+            present = sum(1 for idx in column if idx != MISSING)
+            lines.append(
+                f"    {field:<14} 값 {present:,}개 (고유 {distinct:,}개), "
+                f"블롭 {len(self._blobs[field]) / 1024:.0f}KB"
+            )
+        return "\n".join(lines)
+
+
+class UnihanStoreBuilder:
+    """(codepoint, field, value)를 받아 UnihanStore를 만든다 (값은 필드별로 인턴)"""
+
+    def __init__(self, fields: set[str]) -> None:
+        self._fields = sorted(fields)
+        # 코드포인트(≤ 0x10FFFF)와 값 번호는 4바이트 정수로 충분
+        self._codepoints = array("i")
+        self._row_by_cp: dict[int, int] = {}
+        self._columns = {f: array("i") for f in self._fields}
+        self._interned: dict[str, dict[bytes, int] | None] = {
+            f: None if f in UNIQUE_VALUE_FIELDS else {} for f in self._fields
+        }
+        self._blobs = {f: bytearray() for f in self._fields}
+        self._offsets = {f: array("I", [0]) for f in self._fields}
+
+    def add(self, cp: int, field: str, value: bytes) -> None:
+        """value는 UTF-8 바이트 (디코딩 없이 블롭에 저장, 조회 시 디코딩)"""
+        row = self._row_by_cp.get(cp)
+        if row is None:
+            row = self._row_by_cp[cp] = len(self._codepoints)
+            self._codepoints.append(cp)
+            for column in self._columns.values():
+                column.append(MISSING)
+
+        interned = self._interned[field]
+        idx = interned.get(value) if interned is not None else None
+        if idx is None:
+            offsets = self._offsets[field]
+            idx = len(offsets) - 1
+            if interned is not None:
+                interned[value] = idx
+            blob = self._blobs[field]
+            blob += value
+            offsets.append(len(blob))
+        self._columns[field][row] = idx
+
+    def build(self) -> UnihanStore:
+        store = UnihanStore(
+            self._codepoints,
+            self._columns,
+            {f: bytes(b) for f, b in self._blobs.items()},
+            self._offsets,
+        )
+        self._row_by_cp.clear()
+        self._interned.clear()
+        return store
+
+
+def parse_unihan_store(
+    zip_path: Path,
+    fields: set[str] = UNIHAN_FIELDS,
+    codepoints: set[str] | None = None,
+) -> UnihanStore:
+    """parse_unihan()과 같은 입력/필터로 UnihanStore를 직접 생성"""
+    builder = UnihanStoreBuilder(fields)
+    pattern = _line_pattern(fields)
+    allow = (
+        frozenset(cp.encode("ascii") for cp in codepoints)
+        if codepoints is not None else None
+    )
+    field_names: dict[bytes, str] = {}
+
+    with zipfile.ZipFile(zip_path) as zf:
+        for name in zf.namelist():
+            if name not in UNIHAN_MEMBERS:
+                continue
+            print(f"  [parse] {name} (columnar)")
+            with stage(f"parse.unihan.{name}") as s, zf.open(name) as f:
+                count = 0
+                for block in _iter_blocks(f):
+                    for cp_raw, field_raw, value_raw in pattern.findall(block):
+                        if allow is not None and cp_raw not in allow:
+                            continue
+                        field = field_names.get(field_raw)
+                        if field is None:
+                            field = field_names[field_raw] = field_raw.decode("ascii")
+                        builder.add(int(cp_raw[2:], 16), field, value_raw.rstrip())
+                        count += 1
+                s.rows_out = count
+
+    return builder.build()
@@ -0,0 +1,301 @@
+"""
+upserter.py — asyncio 기반 동시 배치 upsert 엔진
+Phase 1 ETL 파이프라인 컴포넌트
+
+배치를 순서대로 만들되 HTTP 왕복은 여러 개를 겹쳐 보낸다.
+배치 크기(바이트)와 동시 요청 수는 WriteController가 지연/스로틀링을 보고 조절하며,
+413 / 429 / 5xx / 타임아웃은 재시도하고 그 외 오류는 해당 배치만 실패로 처리한다.
+진행률은 앞에서부터 연속으로 끝난 배치 기준으로 출력하고,
+한 배치가 실패해도 나머지 배치는 계속 진행한 뒤 실패 목록을 모아 UpsertError로 알린다.
+
+사용법:
+    upserter = BatchUpserter(supabase, max_in_flight=8)
+    result = await upserter.upsert("characters", rows, on_conflict="char", total=2000)
+    print(upserter.controller.summary())
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from postgrest.types import ReturnMethod
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scripts.etl.write_control import (
+    WriteController,
+    INITIAL_BATCH_BYTES,
+    classify_error,
+)
+from scripts.etl.checkpoint import LoadCheckpoint, TableCheckpoint
+from scripts.etl.sinks import BatchError, Sink, UpsertError, UpsertResult
+from scripts.etl.instrument import attach_http
+
+MAX_IN_FLIGHT = 8  # 동시에 진행 중인 upsert 요청 수 (상한)
+DELETE_CHUNK = 100  # DELETE 1회당 키 수 (URL 길이 제한)
+DB_SCHEMA = "hanja"
+
+
+class _RequestFailed(Exception):
+    """작업 스레드에서 난 예외 + 그 요청의 HTTP 상태 / Retry-After"""
+
+    def __init__(self, error: BaseException, status: int | None, retry_after: float | None) -> None:
+        super().__init__(str(error))
+        self.error = error
+        self.status = status
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더 (초 단위만 지원, HTTP-date는 무시)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class _OrderedProgress:
+    """완료 순서와 무관하게 앞에서부터 연속으로 끝난 배치까지만 출력"""
+
+    def __init__(self, table: str, total: int | None) -> None:
+        self.table = table
+        self.total = total
+        self._sizes: dict[int, int] = {}
+        self._next = 0
+        self.rows_done = 0
+
+    def complete(self, index: int, size: int) -> None:
+        self._sizes[index] = size
+        advanced = False
+        while self._next in self._sizes:
+            self.rows_done += self._sizes.pop(self._next)
+            self._next += 1
+            advanced = True
+        if advanced:
+            total = self.total if self.total is not None else "?"
+            print(f"  → [{self.table}] {self.rows_done}/{total} 완료")
+
+
+class BatchUpserter(Sink):
+    """
+    supabase 클라이언트 하나를 공유하는 동시 upsert 엔진 (sink "rest")
+    배치 크기·in-flight 제한은 엔진 전체(모든 테이블 합산) 기준으로 controller가 조절한다.
+    """
+
+    name = "rest"
+
+    def __init__(
+        self,
+        supabase: Any,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        batch_bytes: int = INITIAL_BATCH_BYTES,
+        schema: str = DB_SCHEMA,
+        checkpoint: LoadCheckpoint | None = None,
+    ) -> None:
+        self.supabase = supabase
+        # 있으면 upsert()가 테이블별 완료 행을 기록하고, 이미 끝난 행은 건너뜀
+        self.checkpoint = checkpoint
+        self.max_in_flight = max(1, max_in_flight)
+        self.controller = WriteController(self.max_in_flight, batch_bytes=batch_bytes)
+        # schema()는 호출마다 새 HTTP 클라이언트를 만들므로 한 번만 생성해 연결 재사용
+        self._db = supabase.schema(schema)
+        attach_http(self._db)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="upsert"
+        )
+        # 요청 스레드별 마지막 응답 (APIError에 HTTP 상태가 남지 않는 경우 대비)
+        self._last = threading.local()
+        session = getattr(self._db, "session", None)
+        if session is not None and hasattr(session, "event_hooks"):
+            hooks = session.event_hooks
+            hooks["response"] = [*hooks.get("response", []), self._on_response]
+            session.event_hooks = hooks
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def summary(self) -> str:
+        return self.controller.summary()
+
+    def _on_response(self, response: Any) -> None:
+        self._last.status = response.status_code
+        self._last.retry_after = _parse_retry_after(response.headers.get("retry-after"))
+
+    def _execute(self, request: Callable[[list[dict]], Any], batch: list[dict]) -> list[dict]:
+        self._last.status = None
+        self._last.retry_after = None
+        try:
+            resp = request(batch)
+        except Exception as e:
+            raise _RequestFailed(e, self._last.status, self._last.retry_after) from e
+        return resp.data
+
+    async def _send(
+        self,
+        table: str,
+        batch: list[dict],
+        nbytes: int,
+        request: Callable[[list[dict]], Any],
+    ) -> list[dict]:
+        """
+        배치 1개 전송 — 스로틀/일시 오류는 백오프 후 재시도, 413이면 반으로 나눠 전송
+        재시도할 수 없는 오류는 원래 예외를 그대로 던진다.
+        """
+        loop = asyncio.get_running_loop()
+        controller = self.controller
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                data = await loop.run_in_executor(self._executor, self._execute, request, batch)
+            except _RequestFailed as failure:
+                kind = classify_error(failure.error, failure.status)
+                if kind == "too_large" and len(batch) > 1:
+                    controller.on_too_large(nbytes)
+                    print(f"  → [{table}] 413 ({nbytes // 1024}KB, {len(batch)}행) → 분할 재전송")
+                    half = len(batch) // 2
+                    data = []
+                    for part in (batch[:half], batch[half:]):
+                        part_bytes = nbytes * len(part) // len(batch)
+                        data.extend(await self._send(table, part, part_bytes, request) or [])
+                    return data
+                if kind == "retry" and attempt < controller.max_retries:
+                    controller.on_throttle(nbytes)
+                    delay = controller.backoff(attempt, failure.retry_after)
+                    attempt += 1
+                    reason = (
+                        failure.status
+                        or getattr(failure.error, "code", None)
+                        or type(failure.error).__name__
+                    )
+                    print(
+                        f"  → [{table}] {reason} → {delay:.1f}초 후 재시도 "
+                        f"({attempt}/{controller.max_retries})"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                raise failure.error from None
+            controller.on_success(len(batch), nbytes, time.monotonic() - started)
+            return data
+
+    async def _run(
+        self,
+        table: str,
+        batches: Iterator[tuple[list[dict], int]],
+        request: Callable[[list[dict]], Any],
+        total: int | None,
+        on_response: Callable[[list[dict]], None] | None = None,
+        checkpoint: TableCheckpoint | None = None,
+    ) -> UpsertResult:
+        """배치들을 동시 전송 — 실패한 배치가 있으면 나머지를 모두 끝낸 뒤 UpsertError"""
+        controller = self.controller
+        result = UpsertResult(table)
+        progress = _OrderedProgress(table, total)
+
+        async def run(index: int, batch: list[dict], nbytes: int, rows: list[int] | None) -> None:
+            try:
+                data = await self._send(table, batch, nbytes, request)
+                if on_response is not None:
+                    on_response(data)
+                if checkpoint is not None:
+                    checkpoint.complete(rows)
+                result.rows += len(batch)
+            except Exception as e:
+                result.errors.append(BatchError(index, len(batch), e))
+                print(f"  → [{table}] 배치 {index} 실패: {e}")
+            finally:
+                progress.complete(index, len(batch))
+                await controller.release()
+
+        tasks = []
+        index = 0
+        while True:
+            # 슬롯이 빌 때까지 다음 배치를 만들지 않음 → 메모리 상한 유지, 최신 배치 크기 반영
+            await controller.acquire()
+            item = next(batches, None)
+            if item is None:
+                await controller.release()
+                break
+            batch, nbytes = item
+            rows = checkpoint.take(len(batch)) if checkpoint is not None else None
+            tasks.append(asyncio.create_task(run(index, batch, nbytes, rows)))
+            result.batches += 1
+            index += 1
+        await asyncio.gather(*tasks)
+        if checkpoint is not None and checkpoint.skipped:
+            print(f"  → [{table}] 이전 실행에서 끝난 {checkpoint.skipped:,}행 건너뜀")
+
+        if result.errors:
+            result.errors.sort(key=lambda e: e.index)
+            raise UpsertError(result)
+        return result
+
+    async def upsert(
+        self,
+        table: str,
+        rows: Iterable[dict],
+        on_conflict: str | None = None,
+        total: int | None = None,
+        on_response: Callable[[list[dict]], None] | None = None,
+    ) -> UpsertResult:
+        """
+        rows를 controller의 바이트 예산 단위 배치로 동시 upsert
+        on_response가 있으면 배치별 응답 행을 넘긴다 (없으면 return=minimal)
+        체크포인트가 있으면 이전 실행에서 끝난 행은 보내지 않는다.
+        """
+        returning = ReturnMethod.representation if on_response else ReturnMethod.minimal
+
+        def request(batch: list[dict]) -> Any:
+            query = self._db.table(table)
+            if on_conflict:
+                return query.upsert(batch, on_conflict=on_conflict, returning=returning).execute()
+            return query.upsert(batch, returning=returning).execute()
+
+        checkpoint = self.checkpoint.table(table) if self.checkpoint is not None else None
+        if checkpoint is not None:
+            rows = checkpoint.pending(rows)
+        return await self._run(
+            table, self.controller.batches(rows), request, total, on_response, checkpoint
+        )
+
+    async def delete(
+        self,
+        table: str,
+        key_columns: tuple[str, ...],
+        keys: Iterable[dict],
+        total: int | None = None,
+    ) -> UpsertResult:
+        """
+        키 행({key_column: value})을 DELETE ... WHERE key IN (...)로 동시 삭제
+        키는 URL 쿼리스트링으로 가므로 바이트 예산 대신 DELETE_CHUNK개씩 묶는다.
+        복합 키는 첫 컬럼이 같은 행끼리 묶어 eq(첫 컬럼) + in_(둘째 컬럼)으로 보낸다.
+        """
+        if len(key_columns) not in (1, 2):
+            raise ValueError(f"{table}: 키 컬럼은 1~2개만 지원 ({key_columns})")
+        first, *rest = key_columns
+
+        def request(batch: list[dict]) -> Any:
+            query = self._db.table(table).delete(returning=ReturnMethod.minimal)
+            if rest:
+                query = query.eq(first, batch[0][first]).in_(rest[0], [k[rest[0]] for k in batch])
+            else:
+                query = query.in_(first, [k[first] for k in batch])
+            return query.execute()
+
+        def batches() -> Iterator[tuple[list[dict], int]]:
+            ordered = sorted(keys, key=lambda k: str(k[first])) if rest else list(keys)
+            chunk: list[dict] = []
+            for key in ordered:
+                if chunk and (len(chunk) >= DELETE_CHUNK or (rest and key[first] != chunk[0][first])):
+                    yield chunk, 0
+                    chunk = []
+                chunk.append(key)
+            if chunk:
+                yield chunk, 0
+
+        return await self._run(table, batches(), request, total)
@@ -15,8 +15,9 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from scripts.etl.parse_unihan import parse_unihan, filter_target, cp_to_char
-from scripts.etl.parse_ids import parse_ids_with_expr
+from scripts.etl.corpus import Corpus
+from scripts.etl.bulk_reader import BulkReader, READ_PARALLEL
+from scripts.etl.instrument import attach_http, stage
 
 
 # 기준값
@@ -26,6 +27,14 @@ EXPECTED_CHAR_COUNT = 2000
 MIN_IDS_COVERAGE = 0.85
 MIN_PHONETIC_COVERAGE = 0.90
 
+# 규모(scale)별 최소 커버리지 (IDS, kPhonetic)
+# hangul/full은 획수 정렬 상위 2,000자보다 희귀자 비중이 커서 낮게 잡은 초기값 — 첫 실측 후 조정
+COVERAGE_THRESHOLDS = {
+    "default": (MIN_IDS_COVERAGE, MIN_PHONETIC_COVERAGE),
+    "hangul": (0.80, 0.60),
+    "full": (0.75, 0.20),
+}
+
 
 class ValidationResult:
     def __init__(self) -> None:
@@ -46,123 +55,181 @@ class ValidationResult:
         return "\n".join(lines)
 
 
-def validate_pre_etl(unihan_zip: Path, ids_path: Path) -> ValidationResult:
+def validate_pre_etl(corpus: Corpus) -> ValidationResult:
     """Pre-ETL 검증: 파싱 결과 무결성 확인"""
     result = ValidationResult()
+    target = corpus.target
+    ids_map_expr = corpus.ids_map_expr
+    min_ids, min_phonetic = COVERAGE_THRESHOLDS[corpus.scale]
 
-    print("[검증] Pre-ETL 데이터 파싱 중...")
-    unihan = parse_unihan(unihan_zip)
-    target = filter_target(unihan)
-    ids_map_expr = parse_ids_with_expr(ids_path)
-
-    # 1. Unihan 파싱 결과 카운트
+    # 1. Unihan 파싱 결과 카운트 — default(획수 정렬 상위 N자)만 해당
+    # hangul / full은 대상이 선정 조건(kHangul 보유 / 전체) 그대로라 같은 값끼리의 비교가 됨
     count = len(target)
-    result.add(
-        "Unihan 대상 글자 수",
-        count == EXPECTED_CHAR_COUNT,
-        f"{count:,}자 (기대: {EXPECTED_CHAR_COUNT:,}자)",
-    )
+    if corpus.scale == "default":
+        expected = corpus.expected_count
+        result.add(
+            "Unihan 대상 글자 수",
+            count == expected,
+            f"{count:,}자 (기대: {expected:,}자, scale={corpus.scale})",
+        )
 
     # 2. IDS 매핑 커버리지 (≥ 90%)
-    ids_matched = sum(1 for cp in target if cp_to_char(cp) in ids_map_expr)
+    with stage("validate.pre.ids_coverage", rows_in=count):
+        ids_matched = sum(1 for ch in corpus.char_by_cp.values() if ch in ids_map_expr)
     ids_coverage = ids_matched / count if count > 0 else 0
     result.add(
         "IDS 커버리지",
-        ids_coverage >= MIN_IDS_COVERAGE,
-        f"{ids_coverage:.1%} ({ids_matched:,}/{count:,}, 최소: {MIN_IDS_COVERAGE:.0%})",
+        ids_coverage >= min_ids,
+        f"{ids_coverage:.1%} ({ids_matched:,}/{count:,}, 최소: {min_ids:.0%})",
     )
 
     # 3. kPhonetic 커버리지
-    phonetic_count = sum(1 for data in target.values() if data.get("kPhonetic"))
+    with stage("validate.pre.phonetic_coverage", rows_in=count):
+        phonetic_count = sum(1 for data in target.values() if data.get("kPhonetic"))
     phonetic_coverage = phonetic_count / count if count > 0 else 0
     result.add(
         "kPhonetic 커버리지",
-        phonetic_coverage >= MIN_PHONETIC_COVERAGE,
-        f"{phonetic_coverage:.1%} ({phonetic_count:,}/{count:,})",
+        phonetic_coverage >= min_phonetic,
+        f"{phonetic_coverage:.1%} ({phonetic_count:,}/{count:,}, 최소: {min_phonetic:.0%})",
     )
 
     # 4. 중복 검사 (같은 글자가 다른 codepoint로 등록되는 경우)
-    char_set: dict[str, list[str]] = {}
-    for cp_str in target:
-        char = cp_to_char(cp_str)
-        char_set.setdefault(char, []).append(cp_str)
-    duplicates = {ch: cps for ch, cps in char_set.items() if len(cps) > 1}
+    with stage("validate.pre.duplicates", rows_in=count):
+        char_set: dict[str, list[str]] = {}
+        for cp_str, char in corpus.char_by_cp.items():
+            char_set.setdefault(char, []).append(cp_str)
+        duplicates = {ch: cps for ch, cps in char_set.items() if len(cps) > 1}
     result.add(
         "중복 글자 검사",
         len(duplicates) == 0,
         f"중복 {len(duplicates)}건" + (f" — {dict(list(duplicates.items())[:3])}" if duplicates else ""),
     )
 
-    # 5. kHangul 보유 확인 (모든 대상이 kHangul을 가져야 함)
-    no_hangul = [cp for cp, data in target.items() if not data.get("kHangul")]
+    # 5. kHangul 보유 확인 (full 규모가 아니면 모든 대상이 kHangul을 가져야 함)
+    if corpus.scale != "full":
+        with stage("validate.pre.hangul", rows_in=count):
+            no_hangul = [cp for cp, data in target.items() if not data.get("kHangul")]
+        result.add(
+            "kHangul 보유",
+            len(no_hangul) == 0,
+            f"누락 {len(no_hangul)}건",
+        )
+
+    return result
+
+
+def validate_pre_etl_stream(stats) -> ValidationResult:
+    """
+    스트리밍 모드의 Pre-ETL 검증 — stream.StreamStats 집계로 커버리지 / kHangul 보유 판정
+    (대상 선정 조건 자체가 kHangul / 전체라 글자 수·중복 검사는 해당 없음)
+    """
+    result = ValidationResult()
+    min_ids, min_phonetic = COVERAGE_THRESHOLDS[stats.scale]
+    count = stats.count
+
+    ids_coverage = stats.ids_matched / count if count > 0 else 0
     result.add(
-        "kHangul 보유",
-        len(no_hangul) == 0,
-        f"누락 {len(no_hangul)}건",
+        "IDS 커버리지",
+        ids_coverage >= min_ids,
+        f"{ids_coverage:.1%} ({stats.ids_matched:,}/{count:,}, 최소: {min_ids:.0%})",
     )
-
-    return result, target, ids_map_expr
-
-
-def _fetch_all(supabase, schema: str, table: str, columns: str) -> list[dict]:
-    """Supabase 기본 1,000행 제한을 우회하여 전체 행을 조회"""
-    all_rows: list[dict] = []
-    page_size = 1000
-    offset = 0
-    while True:
-        resp = (
-            supabase.schema(schema)
-            .table(table)
-            .select(columns)
-            .range(offset, offset + page_size - 1)
-            .execute()
-        )
-        all_rows.extend(resp.data)
-        if len(resp.data) < page_size:
-            break
-        offset += page_size
-    return all_rows
+    phonetic_coverage = stats.phonetic_count / count if count > 0 else 0
+    result.add(
+        "kPhonetic 커버리지",
+        phonetic_coverage >= min_phonetic,
+        f"{phonetic_coverage:.1%} ({stats.phonetic_count:,}/{count:,}, 최소: {min_phonetic:.0%})",
+    )
+    if stats.scale != "full":
+        result.add("kHangul 보유", stats.no_hangul == 0, f"누락 {stats.no_hangul}건")
+    return result
 
 
-def validate_post_etl(supabase) -> ValidationResult:
-    """Post-ETL 검증: DB 적재 결과 확인"""
+def _post_etl_stats_rpc(supabase) -> dict:
+    """서버 측 집계 (006_validation_stats.sql의 hanja.etl_validation_stats)"""
+    db = supabase.schema("hanja")
+    attach_http(db)
+    return db.rpc("etl_validation_stats", {}).execute().data
+
+
+def _post_etl_stats_scan(supabase) -> dict:
+    """
+    RPC가 없을 때(마이그레이션 006 미적용)의 대체 경로 — 필요한 컬럼만 keyset 스캔해 집계
+    결과 형식은 etl_validation_stats()와 같다.
+    """
+    reader = BulkReader(supabase, "hanja", parallel=READ_PARALLEL)
+    char_ids = {c["id"] for c in reader.iter_rows("characters", "id")}
+    reading_count = 0
+    reading_char_ids: set[str] = set()
+    for r in reader.iter_rows("readings", "character_id"):
+        reading_count += 1
+        reading_char_ids.add(r["character_id"])
+    return {
+        "characters": len(char_ids),
+        "readings": reading_count,
+        "characters_without_readings": len(char_ids - reading_char_ids),
+        "decompositions": reader.count("decompositions"),
+        "phonetic_classes": reader.count("phonetic_classes"),
+        "character_phonetic_links": reader.count("character_phonetic_class"),
+    }
+
+
+def fetch_post_etl_stats(supabase) -> dict:
+    """집계 RPC 우선, 실패하면 스캔으로 대체"""
+    try:
+        stats = _post_etl_stats_rpc(supabase)
+        if isinstance(stats, dict) and "characters" in stats:
+            print("  [validate] 서버 측 집계 (rpc etl_validation_stats)")
+            return stats
+        raise ValueError(f"예상하지 못한 응답: {stats!r}")
+    except Exception as e:
+        print(f"  [validate] 집계 RPC 사용 불가 ({e}) → 테이블 스캔으로 대체")
+        return _post_etl_stats_scan(supabase)
+
+
+def validate_post_etl(
+    supabase,
+    expected_count: int = EXPECTED_CHAR_COUNT,
+    min_ids_coverage: float = MIN_IDS_COVERAGE,
+    require_readings: bool = True,
+    stats: dict | None = None,
+) -> ValidationResult:
+    """
+    Post-ETL 검증: DB 적재 결과 확인 (기대값은 적재한 대상 규모 기준)
+    stats를 주면 (COPY 백엔드가 같은 연결에서 받은 집계) DB 조회 없이 검증
+    """
     result = ValidationResult()
-    schema = "hanja"
+    if stats is None:
+        with stage("validate.post.stats"):
+            stats = fetch_post_etl_stats(supabase)
 
-    # 1. characters 테이블 row count (페이지네이션 적용)
-    all_chars = _fetch_all(supabase, schema, "characters", "id,char")
-    char_count = len(all_chars)
+    # 1. characters 테이블 row count
+    char_count = stats["characters"]
     result.add(
         "characters 테이블",
-        char_count >= EXPECTED_CHAR_COUNT,
-        f"{char_count:,}행 (기대: ≥{EXPECTED_CHAR_COUNT:,})",
+        char_count >= expected_count,
+        f"{char_count:,}행 (기대: ≥{expected_count:,})",
     )
 
     # 2. readings 테이블 — 모든 character에 최소 1개 reading
-    all_readings = _fetch_all(supabase, schema, "readings", "character_id")
-    reading_count = len(all_readings)
-    reading_char_ids = {r["character_id"] for r in all_readings}
-    all_char_ids = {c["id"] for c in all_chars}
-    missing_readings = all_char_ids - reading_char_ids
+    #    (full 규모에서는 kHangul 없는 글자가 있으므로 require_readings=False로 누락 건수만 참고)
+    missing_readings = stats["characters_without_readings"]
     result.add(
         "readings 매핑",
-        len(missing_readings) == 0,
-        f"readings {reading_count:,}행, 누락 {len(missing_readings)}건",
+        missing_readings == 0 or not require_readings,
+        f"readings {stats['readings']:,}행, 누락 {missing_readings}건",
     )
 
     # 3. decompositions 커버리지
-    all_decomps = _fetch_all(supabase, schema, "decompositions", "character_id")
-    decomp_count = len(all_decomps)
+    decomp_count = stats["decompositions"]
     decomp_ratio = decomp_count / char_count if char_count > 0 else 0
     result.add(
         "decompositions 커버리지",
-        decomp_ratio >= MIN_IDS_COVERAGE,
+        decomp_ratio >= min_ids_coverage,
         f"{decomp_ratio:.1%} ({decomp_count:,}/{char_count:,})",
     )
 
     # 4. phonetic_classes 테이블
-    all_pcs = _fetch_all(supabase, schema, "phonetic_classes", "id")
-    pc_count = len(all_pcs)
+    pc_count = stats["phonetic_classes"]
     result.add(
         "phonetic_classes 테이블",
         pc_count > 0,
@@ -180,7 +247,9 @@ def main():
         print("=" * 50)
         print("[Pre-ETL 검증]")
         print("=" * 50)
-        vr, _, _ = validate_pre_etl(data_dir / "Unihan.zip", data_dir / "ids.txt")
+        print("[검증] Pre-ETL 데이터 파싱 중...")
+        corpus = Corpus.load(data_dir / "Unihan.zip", data_dir / "ids.txt")
+        vr = validate_pre_etl(corpus)
         print(vr.report())
         print()
         status = "ALL PASSED" if vr.all_passed else "SOME FAILED"
@@ -0,0 +1,216 @@
+"""
+write_control.py — PostgREST 쓰기 속도 제어 (바이트 예산 배치 + AIMD)
+Phase 1 ETL 파이프라인 컴포넌트
+
+- 배치는 행 수가 아니라 JSON 인코딩 바이트 예산(batch_bytes)으로 자른다.
+  characters 행(unihan_def 최대 500자)은 적게, character_phonetic_class 행(UUID 2개)은 많이 묶인다.
+- 지연이 목표 이하로 유지되면 batch_bytes와 동시 요청 한도를 조금씩 늘리고 (additive increase)
+  429 / 5xx / 타임아웃이 오면 절반으로 줄인다 (multiplicative decrease). 413은 배치를 반으로 나눠 재전송.
+- 재시도는 지수 백오프 + full jitter, Retry-After 헤더가 있으면 그 값 이상 대기
+- 실행이 끝나면 summary()로 처리량(rows/sec) 요약
+
+사용법:
+    controller = WriteController(max_in_flight=8)
+    for batch, nbytes in controller.batches(rows): ...
+    await controller.acquire(); ...; await controller.release()
+    print(controller.summary())
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Iterable, Iterator
+
+# 배치 바이트 예산 (AIMD 대상)
+MIN_BATCH_BYTES = 8 * 1024
+MAX_BATCH_BYTES = 1024 * 1024  # PostgREST/게이트웨이 본문 한도보다 충분히 작게
+INITIAL_BATCH_BYTES = 32 * 1024
+BATCH_BYTES_STEP = 16 * 1024
+MAX_BATCH_ROWS = 1000  # 바이트와 별개로 한 요청의 행 수 상한
+
+# 지연 목표 — 이 이하면 늘리고, 2배를 넘으면 배치만 줄인다
+TARGET_LATENCY = 0.5  # 초
+INCREASE_EVERY = 4    # 연속 성공 N회마다 한 단계 증가
+
+# 재시도
+MAX_RETRIES = 6
+BACKOFF_BASE = 0.5  # 초
+BACKOFF_CAP = 30.0  # 초
+
+# 재시도할 HTTP 상태 / PostgreSQL 오류 코드
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+TOO_LARGE_STATUS = 413
+RETRY_PG_CODES = {"57014", "40001", "40P01", "53300"}  # 타임아웃, 직렬화 실패, 데드락, 연결 초과
+
+
+def encoded_size(row: dict) -> int:
+    """요청 본문에서 행이 차지하는 바이트 수 (구분자 ',' 포함)"""
+    return len(json.dumps(row, ensure_ascii=False).encode("utf-8")) + 1
+
+
+def classify_error(exc: BaseException, status: int | None = None) -> str:
+    """
+    실패 분류: 'too_large' | 'retry' | 'fatal'
+    status는 마지막 HTTP 응답 상태 — APIError.code는 JSON 오류 본문이면
+    PostgreSQL 오류 코드라서 HTTP 상태를 따로 받는다.
+    """
+    code = getattr(exc, "code", None)
+    if status is None and isinstance(code, int):
+        status = code
+
+    if status == TOO_LARGE_STATUS:
+        return "too_large"
+    if status in RETRY_STATUSES:
+        return "retry"
+    if isinstance(code, str) and code in RETRY_PG_CODES:
+        return "retry"
+
+    # 네트워크 계층 오류 (httpx.TransportError: 타임아웃, 연결 끊김 등)
+    try:
+        import httpx
+        if isinstance(exc, httpx.TransportError):
+            return "retry"
+    except ImportError:
+        pass
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return "retry"
+    return "fatal"
+
+
+class WriteController:
+    """
+    엔진 전체(모든 테이블 합산)에 하나 — 배치 크기와 동시 요청 한도를 함께 조절
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        batch_bytes: int = INITIAL_BATCH_BYTES,
+        min_bytes: int = MIN_BATCH_BYTES,
+        max_bytes: int = MAX_BATCH_BYTES,
+        max_rows: int = MAX_BATCH_ROWS,
+        target_latency: float = TARGET_LATENCY,
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
+        self.max_in_flight = max(1, max_in_flight)
+        # 처음엔 절반에서 시작해 지연을 보며 올린다
+        self.in_flight_limit = max(1, self.max_in_flight // 2)
+        self.min_bytes = min_bytes
+        self.max_bytes = max_bytes
+        self.batch_bytes = max(min_bytes, min(batch_bytes, max_bytes))
+        self.max_rows = max_rows
+        self.target_latency = target_latency
+        self.max_retries = max_retries
+
+        self._in_flight = 0
+        self._cond: asyncio.Condition | None = None
+        self._streak = 0
+
+        # 통계
+        self.started = time.monotonic()
+        self.rows = 0
+        self.bytes_sent = 0
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.splits = 0
+        self._latency_sum = 0.0
+        self._latency_count = 0
+
+    # ── 배치 구성 ────────────────────────────────
+    def batches(self, rows: Iterable[dict]) -> Iterator[tuple[list[dict], int]]:
+        """
+        (batch, 인코딩 바이트) 생성 — batch_bytes 또는 max_rows에 닿으면 자름
+        batch_bytes는 적재 도중에도 바뀌므로 배치마다 다시 읽는다.
+        """
+        batch: list[dict] = []
+        size = 2  # '[' ']'
+        for row in rows:
+            row_size = encoded_size(row)
+            if batch and (len(batch) >= self.max_rows or size + row_size > self.batch_bytes):
+                yield batch, size
+                batch, size = [], 2
+            batch.append(row)
+            size += row_size
+        if batch:
+            yield batch, size
+
+    # ── 동시 요청 한도 ───────────────────────────
+    def _condition(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    async def acquire(self) -> None:
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self._in_flight < self.in_flight_limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        cond = self._condition()
+        async with cond:
+            self._in_flight -= 1
+            cond.notify_all()
+
+    # ── AIMD ────────────────────────────────────
+    def on_success(self, rows: int, nbytes: int, latency: float) -> None:
+        self.requests += 1
+        self.rows += rows
+        self.bytes_sent += nbytes
+        self._latency_sum += latency
+        self._latency_count += 1
+
+        if latency > self.target_latency * 2:
+            # 실패 전이지만 응답이 느려지는 중 — 배치만 줄이고 동시성은 유지
+            self.batch_bytes = max(self.min_bytes, self.batch_bytes * 3 // 4)
+            self._streak = 0
+            return
+        if latency > self.target_latency:
+            self._streak = 0
+            return
+        self._streak += 1
+        if self._streak >= INCREASE_EVERY:
+            self._streak = 0
+            self.batch_bytes = min(self.max_bytes, self.batch_bytes + BATCH_BYTES_STEP)
+            # 늘어난 슬롯은 다음 release()의 notify_all로 깨어난다
+            self.in_flight_limit = min(self.max_in_flight, self.in_flight_limit + 1)
+
+    def on_throttle(self, nbytes: int) -> None:
+        """429 / 5xx / 타임아웃 — 배치와 동시성 모두 절반으로"""
+        self.requests += 1
+        self.throttled += 1
+        self.bytes_sent += nbytes
+        self._streak = 0
+        self.batch_bytes = max(self.min_bytes, self.batch_bytes // 2)
+        self.in_flight_limit = max(1, self.in_flight_limit // 2)
+
+    def on_too_large(self, nbytes: int) -> None:
+        """413 — 상한을 거절된 크기 아래로 내리고 배치도 절반으로"""
+        self.requests += 1
+        self.splits += 1
+        self.bytes_sent += nbytes
+        self._streak = 0
+        self.max_bytes = max(self.min_bytes, min(self.max_bytes, nbytes // 2))
+        self.batch_bytes = max(self.min_bytes, min(self.batch_bytes // 2, self.max_bytes))
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """attempt번째 재시도 대기 시간 (full jitter) — Retry-After가 있으면 그 값 이상"""
+        self.retries += 1
+        delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, BACKOFF_CAP))
+        return delay
+
+    # ── 요약 ────────────────────────────────────
+    def summary(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        avg_latency = self._latency_sum / self._latency_count if self._latency_count else 0.0
+        return (
+            f"  [write] {self.rows:,}행 / {elapsed:.1f}초 = {self.rows / elapsed:,.0f} rows/sec, "
+            f"{self.bytes_sent / 1024 / 1024:.1f}MB, 요청 {self.requests:,}회 "
+            f"(평균 지연 {avg_latency * 1000:.0f}ms, 재시도 {self.retries}, "
+            f"스로틀 {self.throttled}, 413 분할 {self.splits})\n"
+            f"  [write] 최종 배치 {self.batch_bytes // 1024}KB, 동시 요청 {self.in_flight_limit}"
+        )
@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from "react";
 import {
+  getCharacterDocument,
   getCharacterByChar,
   getCharacterDetails,
   getPhoneticSiblings,
@@ -26,6 +27,37 @@ export function useCharacter(char: string) {
       setError(null);
 
       try {
+        // ETL이 만든 문서가 있으면 한 번의 조회로 끝
+        const doc = await getCharacterDocument(char);
+        if (cancelled) return;
+
+        if (doc) {
+          const c = doc.character;
+          setCharacter(c);
+          setPhoneticRoot(doc.phonetic?.root ?? null);
+          setSiblings(doc.phonetic?.siblings ?? []);
+          setMeaningTree(doc.meaning_tree);
+          setCharDetails(
+            doc.details && {
+              ...doc.details,
+              character_id: c.id,
+              // 문서에는 created_at이 없음 (상세 패널에서 쓰지 않음)
+              character: {
+                id: c.id,
+                char: c.char,
+                codepoint: c.codepoint,
+                strokes: c.strokes,
+                radical: c.radical,
+                unihan_def: c.unihan_def,
+                grade_level: c.grade_level,
+                created_at: "",
+              },
+              reading: c.readings.find((r) => r.is_primary)?.value || "",
+            }
+          );
+          return;
+        }
+
         const charData = await getCharacterByChar(char);
         if (cancelled) return;
 
@@ -2,11 +2,11 @@
 
 import { useState, useEffect, useRef } from "react";
 import { searchCharacters } from "@/lib/queries";
-import type { Character } from "@/types/hanja";
+import { isOffline, searchPack, type PackSearchResult } from "@/lib/pack";
 
 export function useSearch(query: string, debounceMs = 300) {
   const trimmedQuery = query.trim();
-  const [results, setResults] = useState<(Character & { reading: string })[]>([]);
+  const [results, setResults] = useState<PackSearchResult[]>([]);
   const [loading, setLoading] = useState(false);
   const timeoutRef = useRef<ReturnType<typeof setTimeout>>(undefined);
   const requestIdRef = useRef(0);
@@ -24,7 +24,13 @@ export function useSearch(query: string, debounceMs = 300) {
 
     timeoutRef.current = setTimeout(async () => {
       try {
-        const data = await searchCharacters(trimmedQuery);
+        // 온라인이면 서버 순위 검색 (search_characters RPC — 초성 / 받침 뺀 음 / 풀이 단어 포함)
+        // 오프라인이거나 서버 검색이 실패하면 오프라인 팩 색인
+        let data: PackSearchResult[] | null = null;
+        if (!isOffline()) {
+          data = await searchCharacters(trimmedQuery).catch(() => null);
+        }
+        data ??= (await searchPack(trimmedQuery)) ?? [];
         if (requestIdRef.current === requestId) {
           setResults(data);
         }
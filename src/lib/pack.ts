@@ -0,0 +1,136 @@
+// 오프라인 사전 팩 (scripts/etl/build_pack.py가 만든 public/packs/)
+// 매니페스트만 매번 확인하고, 내용 해시가 붙은 샤드 / 색인 파일은 Cache Storage에 둔다.
+// 새 버전이 나오면 캐시에 없는 파일(= 바뀐 샤드)만 받고, 더 이상 참조하지 않는 파일은 지운다.
+// 팩은 오프라인용 — 온라인이면 호출 측이 DB(문서 / 검색 RPC)를 먼저 쓰고 실패할 때만 팩을 읽는다.
+
+import type { Character, CharacterDocument } from '@/types/hanja';
+
+const PACK_BASE = '/packs';
+const PACK_CACHE = 'hanja-pack';
+const MANIFEST_URL = `${PACK_BASE}/manifest.json`;
+
+export interface PackFile {
+  file: string;
+  hash: string;
+  bytes: number;
+  count: number;
+}
+
+export interface PackManifest {
+  format: number;
+  version: string;
+  built_at: string;
+  count: number;
+  shard_mod: number;
+  index: PackFile;
+  shards: (PackFile & { id: number })[];
+}
+
+// [char, codepoint, strokes, 음[], 뜻 앞부분, id]
+type PackIndexEntry = [string, number, number | null, string[], string, string];
+
+export type PackSearchResult = Pick<Character, 'id' | 'char' | 'codepoint' | 'strokes' | 'unihan_def'> & {
+  reading: string;
+};
+
+let manifestPromise: Promise<PackManifest | null> | null = null;
+const filePromises = new Map<string, Promise<unknown>>();
+
+export function isOffline(): boolean {
+  // navigator가 없거나 (서버) onLine을 모르면 온라인으로 본다
+  return typeof navigator !== 'undefined' && navigator.onLine === false;
+}
+
+function packAvailable(): boolean {
+  return typeof window !== 'undefined' && 'caches' in window && 'DecompressionStream' in window;
+}
+
+async function syncManifest(): Promise<PackManifest | null> {
+  const cache = await caches.open(PACK_CACHE);
+  const cached = await cache.match(MANIFEST_URL);
+  const current = cached ? ((await cached.json()) as PackManifest) : null;
+
+  let latest: PackManifest | null = null;
+  try {
+    const res = await fetch(MANIFEST_URL, { cache: 'no-store' });
+    if (res.ok) latest = (await res.json()) as PackManifest;
+  } catch {
+    // 오프라인 — 캐시된 버전 사용
+  }
+  if (!latest || latest.version === current?.version) return current;
+
+  // 새 버전: 캐시에 없는 파일만 받음 (파일 이름이 내용 해시라 안 바뀐 샤드는 그대로)
+  const files = [latest.index, ...latest.shards].map((f) => `${PACK_BASE}/${f.file}`);
+  try {
+    await Promise.all(
+      files.map(async (url) => {
+        if (!(await cache.match(url))) await cache.add(url);
+      })
+    );
+  } catch {
+    return current; // 받다 실패하면 이전 버전 유지 (받은 파일은 다음에 재사용)
+  }
+
+  const live = new Set(files.map((url) => new URL(url, location.origin).href));
+  for (const req of await cache.keys()) {
+    if (req.url.endsWith('.json.gz') && !live.has(req.url)) await cache.delete(req);
+  }
+  await cache.put(MANIFEST_URL, new Response(JSON.stringify(latest)));
+  filePromises.clear();
+  return latest;
+}
+
+export function getPackManifest(): Promise<PackManifest | null> {
+  if (!packAvailable()) return Promise.resolve(null);
+  manifestPromise ??= syncManifest().catch(() => null);
+  return manifestPromise;
+}
+
+async function readPackFile<T>(file: string): Promise<T | null> {
+  const cache = await caches.open(PACK_CACHE);
+  const res = await cache.match(`${PACK_BASE}/${file}`);
+  if (!res?.body) return null;
+  const stream = res.body.pipeThrough(new DecompressionStream('gzip'));
+  return (await new Response(stream).json()) as T;
+}
+
+function loadPackFile<T>(file: string): Promise<T | null> {
+  let promise = filePromises.get(file) as Promise<T | null> | undefined;
+  if (!promise) {
+    promise = readPackFile<T>(file).catch(() => null);
+    filePromises.set(file, promise);
+  }
+  return promise;
+}
+
+export async function getPackedDocument(char: string): Promise<CharacterDocument | null> {
+  const manifest = await getPackManifest();
+  const codepoint = char.codePointAt(0);
+  if (!manifest || codepoint === undefined) return null;
+
+  const shard = manifest.shards[codepoint % manifest.shard_mod];
+  const data = await loadPackFile<{ docs: Record<string, CharacterDocument> }>(shard.file);
+  return data?.docs[char] ?? null;
+}
+
+export async function searchPack(query: string, limit = 20): Promise<PackSearchResult[] | null> {
+  // 팩이 없으면 null — 호출 측이 서버 검색으로 대체
+  const manifest = await getPackManifest();
+  if (!manifest) return null;
+  const index = await loadPackFile<PackIndexEntry[]>(manifest.index.file);
+  if (!index) return null;
+
+  const q = query.toLowerCase();
+  const exact: PackSearchResult[] = [];
+  const partial: PackSearchResult[] = [];
+  for (const [char, codepoint, strokes, readings, gloss, id] of index) {
+    const result = { id, char, codepoint, strokes, unihan_def: gloss, reading: readings[0] ?? '' };
+    if (char === query || readings.includes(query)) {
+      exact.push(result);
+    } else if (readings.some((r) => r.includes(query)) || gloss.toLowerCase().includes(q)) {
+      partial.push(result);
+    }
+    if (exact.length >= limit) break;
+  }
+  return [...exact, ...partial].slice(0, limit);
+}
@@ -1,4 +1,5 @@
 import { supabase } from './supabase';
+import { getPackedDocument, isOffline } from './pack';
 import type {
   CharacterDetail,
   CharacterDetailInfo,
@@ -12,8 +13,29 @@ import type {
   Lesson,
   RadicalWithCharacter,
   RelatedCharacter,
+  ComponentIndexEntry,
+  PhoneticSeries,
+  CharacterDocument,
 } from '@/types/hanja';
 
+export async function getCharacterDocument(char: string): Promise<CharacterDocument | null> {
+  // ETL이 조립한 글자별 문서 — char PK 조회 한 번
+  // 없으면 (큐레이션 수정 후 재생성 전) null → 호출 측이 테이블별 조회로 대체
+  // 팩은 다시 빌드하기 전까지 옛 문서를 가지고 있으므로 온라인이면 DB가 우선
+  if (!isOffline()) {
+    const { data, error } = await supabase
+      .from('character_documents')
+      .select('doc')
+      .eq('char', char)
+      .maybeSingle();
+
+    if (!error) return data ? (data.doc as CharacterDocument) : null;
+  }
+
+  // 오프라인이거나 요청 실패 (마이그레이션 010 미적용 포함) — 오프라인 팩
+  return getPackedDocument(char);
+}
+
 export async function getCharacterByChar(char: string): Promise<CharacterDetail | null> {
   const { data: character, error } = await supabase
     .from('characters')
@@ -43,9 +65,40 @@ export async function getCharacterByChar(char: string): Promise<CharacterDetail
   };
 }
 
+type SeriesEmbed = {
+  phonetic_classes: { phonetic_series: PhoneticSeries | PhoneticSeries[] | null } | null;
+};
+
+export async function getPhoneticSeries(characterId: string): Promise<PhoneticSeries | null> {
+  // ETL이 계산한 계열 요약 — 연결 → 계열 → 요약을 한 번의 요청으로 embed
+  const { data, error } = await supabase
+    .from('character_phonetic_class')
+    .select('phonetic_classes(phonetic_series(*))')
+    .eq('character_id', characterId)
+    .limit(1)
+    .maybeSingle();
+
+  if (error || !data) return null;
+  const series = (data as SeriesEmbed).phonetic_classes?.phonetic_series;
+  return (Array.isArray(series) ? series[0] : series) ?? null;
+}
+
 export async function getPhoneticSiblings(characterId: string): Promise<{
   phoneticRoot: string | null;
   siblings: PhoneticSibling[];
+}> {
+  const series = await getPhoneticSeries(characterId);
+  if (series) {
+    return { phoneticRoot: series.root, siblings: series.members };
+  }
+
+  // 대체: phonetic_series가 없으면 (마이그레이션 009 미적용 / ETL 미실행) 테이블별 조회
+  return getPhoneticSiblingsByScan(characterId);
+}
+
+async function getPhoneticSiblingsByScan(characterId: string): Promise<{
+  phoneticRoot: string | null;
+  siblings: PhoneticSibling[];
 }> {
   // 이 한자의 음류(phonetic class) 조회
   const { data: cpc } = await supabase
@@ -122,6 +175,29 @@ export async function getPhoneticSiblings(characterId: string): Promise<{
   return { phoneticRoot, siblings };
 }
 
+export async function getCharactersByComponent(
+  component: string,
+  options: { transitive?: boolean; limit?: number } = {}
+): Promise<ComponentIndexEntry[]> {
+  const { transitive = false, limit = 100 } = options;
+
+  // component_index 역색인 — (component, frequency, strokes, codepoint) 인덱스 순서 그대로
+  let query = supabase
+    .from('component_index')
+    .select('*')
+    .eq('component', component);
+
+  if (!transitive) query = query.eq('transitive', false);
+
+  const { data } = await query
+    .order('frequency', { ascending: true, nullsFirst: false })
+    .order('strokes', { ascending: true })
+    .order('codepoint', { ascending: true })
+    .limit(limit);
+
+  return (data as ComponentIndexEntry[]) || [];
+}
+
 export async function getMeaningTree(characterId: string): Promise<MeaningTreeNode[]> {
   const [sensesRes, edgesRes] = await Promise.all([
     supabase
@@ -174,22 +250,49 @@ export async function getMeaningTree(characterId: string): Promise<MeaningTreeNo
 
 export async function searchCharacters(
   query: string,
-  limit = 20
+  limit = 20,
+  filters: { strokes?: number; radical?: string } = {}
+): Promise<(Character & { reading: string })[]> {
+  // search_terms 색인 RPC — 음 / 초성 / 뜻 단어 일치·접두사 순위를 한 번의 요청으로
+  const { data, error } = await supabase.rpc('search_characters', {
+    q: query,
+    max_results: limit,
+    strokes_filter: filters.strokes ?? null,
+    radical_filter: filters.radical ?? null,
+  });
+
+  if (!error && data) {
+    return (data as (Character & { reading: string | null })[]).map((c) => ({
+      ...c,
+      reading: c.reading || '',
+    }));
+  }
+
+  // 대체: RPC가 없으면 (마이그레이션 011 미적용) 테이블별 조회
+  return searchCharactersByScan(query, limit);
+}
+
+async function searchCharactersByScan(
+  query: string,
+  limit: number
 ): Promise<(Character & { reading: string })[]> {
   // 한자 직접 검색
-  const { data: byChar } = await supabase
+  const { data: byChar, error: charError } = await supabase
     .from('characters')
     .select('*')
     .eq('char', query)
     .limit(1);
 
   // 한글 음으로 검색
-  const { data: byReading } = await supabase
+  const { data: byReading, error: readingError } = await supabase
     .from('readings')
     .select('character_id, value')
     .ilike('value', `%${query}%`)
     .limit(limit);
 
+  // 둘 다 실패 (네트워크 등) — 빈 결과 대신 오류로 알려 호출 측이 오프라인 팩으로 대체
+  if (charError && readingError) throw charError;
+
   const charIds = new Set<string>();
   const results: (Character & { reading: string })[] = [];
 
@@ -17,11 +17,17 @@ export interface Reading {
   is_primary: boolean;
 }
 
+// IDS 트리 — 리프는 부품 문자, 노드는 [연산자, 자식...]
+export type IdsTree = string | [string, ...IdsTree[]];
+
 export interface Decomposition {
   character_id: string;
   ids: string | null;
   components: string[];
   confidence: number;
+  tree: IdsTree | null;
+  depth: number | null;
+  primitives: string[] | null;
 }
 
 export interface PhoneticClass {
@@ -112,6 +118,17 @@ export interface PhoneticSibling {
   character_id: string;
 }
 
+export interface PhoneticSeries {
+  phonetic_class_id: string;
+  code: string;
+  root: string | null;
+  main_reading: string | null;
+  consistency: number | null;
+  member_count: number;
+  readings: { reading: string; count: number }[];
+  members: PhoneticSibling[];
+}
+
 export interface MeaningTreeNode {
   id: string;
   label: string;
@@ -129,6 +146,19 @@ export interface RelatedCharacter {
   reading: string;
 }
 
+export interface ComponentIndexEntry {
+  character_id: string;
+  component: string;
+  char: string;
+  position: number | null;
+  operator: string | null;
+  transitive: boolean;
+  via: string | null;
+  strokes: number | null;
+  frequency: number | null;
+  codepoint: number;
+}
+
 export interface CharacterDetailInfo {
   character_id: string;
   explanation: string | null;
@@ -137,3 +167,20 @@ export interface CharacterDetailInfo {
   character: Character;
   reading: string;
 }
+
+// ETL이 조립한 글자별 상세 문서 (character_documents.doc)
+export interface CharacterDocument {
+  version: number;
+  character: CharacterDetail & { grade_level: number | null };
+  phonetic: {
+    phonetic_class_id: string;
+    code: string;
+    root: string | null;
+    main_reading: string | null;
+    consistency: number | null;
+    siblings: PhoneticSibling[];
+  } | null;
+  meaning_tree: MeaningTreeNode[];
+  details: Pick<CharacterDetailInfo, 'explanation' | 'shuowen_chinese' | 'shuowen_korean'> | null;
+  radical: Omit<RadicalDetail, 'character_id'> | null;
+}
@@ -0,0 +1,97 @@
+-- ============================================================
+-- 005_stable_ids.sql
+-- ETL이 결정적 UUID(v5)를 직접 지정하도록 FK에 ON UPDATE CASCADE 추가
+-- 기존 uuid_generate_v4() id는 다음 ETL 실행 때 upsert(on_conflict=char/code)로
+-- 새 id로 교체되며, 참조 테이블은 CASCADE로 함께 갱신된다.
+-- readings는 id(v4 → v5)로는 옛 행과 맞춰지지 않으므로 자연 키 (character_id, type, value)에
+-- UNIQUE를 걸고 ETL이 그 키로 upsert한다 (옛 행은 id만 v5로 갱신됨).
+-- DEFAULT uuid_generate_v4()는 ETL 외 수동 삽입용으로 유지
+-- ============================================================
+
+-- ============================================================
+-- characters(id) 참조
+-- ============================================================
+ALTER TABLE hanja.readings
+    DROP CONSTRAINT IF EXISTS readings_character_id_fkey,
+    ADD CONSTRAINT readings_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE hanja.character_phonetic_class
+    DROP CONSTRAINT IF EXISTS character_phonetic_class_character_id_fkey,
+    ADD CONSTRAINT character_phonetic_class_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE hanja.decompositions
+    DROP CONSTRAINT IF EXISTS decompositions_character_id_fkey,
+    ADD CONSTRAINT decompositions_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE hanja.meaning_senses
+    DROP CONSTRAINT IF EXISTS meaning_senses_character_id_fkey,
+    ADD CONSTRAINT meaning_senses_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE hanja.meaning_edges
+    DROP CONSTRAINT IF EXISTS meaning_edges_character_id_fkey,
+    ADD CONSTRAINT meaning_edges_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE hanja.user_progress
+    DROP CONSTRAINT IF EXISTS user_progress_character_id_fkey,
+    ADD CONSTRAINT user_progress_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE hanja.favorites
+    DROP CONSTRAINT IF EXISTS favorites_character_id_fkey,
+    ADD CONSTRAINT favorites_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE hanja.radical_details
+    DROP CONSTRAINT IF EXISTS radical_details_character_id_fkey,
+    ADD CONSTRAINT radical_details_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE hanja.character_details
+    DROP CONSTRAINT IF EXISTS character_details_character_id_fkey,
+    ADD CONSTRAINT character_details_character_id_fkey
+        FOREIGN KEY (character_id) REFERENCES hanja.characters(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- ============================================================
+-- phonetic_classes(id) 참조
+-- ============================================================
+ALTER TABLE hanja.character_phonetic_class
+    DROP CONSTRAINT IF EXISTS character_phonetic_class_phonetic_class_id_fkey,
+    ADD CONSTRAINT character_phonetic_class_phonetic_class_id_fkey
+        FOREIGN KEY (phonetic_class_id) REFERENCES hanja.phonetic_classes(id)
+        ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- ============================================================
+-- readings 자연 키
+-- id 기준 upsert로 이미 한 번 적재했다면 같은 음이 v4 / v5 id로 두 벌 있으므로
+-- 하나만 남기고 지운다 (남는 행의 id는 다음 ETL 실행이 v5로 맞춤).
+-- UNIQUE를 걸기 위해 kHangul 외 유형의 완전 중복도 함께 정리
+-- ============================================================
+DELETE FROM hanja.readings a
+USING hanja.readings b
+WHERE a.character_id = b.character_id
+  AND a.type = b.type
+  AND a.value = b.value
+  AND a.id < b.id;
+
+ALTER TABLE hanja.readings
+    DROP CONSTRAINT IF EXISTS readings_character_id_type_value_key,
+    ADD CONSTRAINT readings_character_id_type_value_key
+        UNIQUE (character_id, type, value);
+
+COMMENT ON COLUMN hanja.characters.id IS 'ETL 결정적 UUID v5 (codepoint 기준)';
+COMMENT ON COLUMN hanja.phonetic_classes.id IS 'ETL 결정적 UUID v5 (kPhonetic 코드 기준)';
+COMMENT ON COLUMN hanja.readings.id IS 'ETL 결정적 UUID v5 (codepoint + type + value 기준)';
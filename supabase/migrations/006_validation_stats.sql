@@ -0,0 +1,40 @@
+-- ============================================================
+-- 006_validation_stats.sql
+-- Post-ETL 검증용 서버 측 집계 함수
+-- validate_post_etl()이 테이블 전체를 내려받지 않고 RPC 한 번으로
+-- 행 수 / reading 누락 수(anti-join) / 분해 커버리지를 받도록 한다.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION hanja.etl_validation_stats()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SET search_path = hanja, pg_temp
+AS $$
+    SELECT jsonb_build_object(
+        'characters',
+            (SELECT count(*) FROM hanja.characters),
+        'readings',
+            (SELECT count(*) FROM hanja.readings),
+        'characters_without_readings',
+            (SELECT count(*) FROM hanja.characters c
+              WHERE NOT EXISTS (
+                  SELECT 1 FROM hanja.readings r WHERE r.character_id = c.id
+              )),
+        'decompositions',
+            (SELECT count(*) FROM hanja.decompositions),
+        'phonetic_classes',
+            (SELECT count(*) FROM hanja.phonetic_classes),
+        'character_phonetic_links',
+            (SELECT count(*) FROM hanja.character_phonetic_class)
+    );
+$$;
+
+COMMENT ON FUNCTION hanja.etl_validation_stats() IS
+    'Post-ETL 검증 집계 (행 수, reading 없는 한자 수, 분해 수) — scripts/etl/validate.py';
+
+-- ============================================================
+-- 권한 (ETL용 service_role만 실행)
+-- ============================================================
+REVOKE ALL ON FUNCTION hanja.etl_validation_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION hanja.etl_validation_stats() TO service_role;
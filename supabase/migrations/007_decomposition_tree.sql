@@ -0,0 +1,21 @@
+-- ============================================================
+-- 007_decomposition_tree.sql
+-- decompositions에 IDS 구조 트리와 재귀 분해 결과를 함께 저장
+-- ETL(scripts/etl/ids_tree.py)이 계산해 적재하므로 조회 시 재귀 계산이 필요 없다.
+--   tree       연산자 인자 수 기준 트리 (리프 = 문자열, 노드 = [연산자, 자식...])
+--   depth      원자 부품까지의 분해 단계 (1 = 한 단계로 끝남)
+--   primitives 더 이상 분해되지 않는 원자 부품 (중복 없음)
+-- ============================================================
+
+ALTER TABLE hanja.decompositions
+    ADD COLUMN IF NOT EXISTS tree       JSONB,
+    ADD COLUMN IF NOT EXISTS depth      SMALLINT,
+    ADD COLUMN IF NOT EXISTS primitives TEXT[];
+
+COMMENT ON COLUMN hanja.decompositions.tree IS 'IDS 트리 (예: ["⿱", ["⿰", "木", "木"], "一"])';
+COMMENT ON COLUMN hanja.decompositions.depth IS '원자 부품까지의 분해 단계';
+COMMENT ON COLUMN hanja.decompositions.primitives IS '재귀 분해한 원자 부품 배열';
+
+-- 부품 질의: 원자 부품 X를 포함하는 글자 (primitives @> ARRAY['X'])
+CREATE INDEX IF NOT EXISTS idx_decompositions_primitives
+    ON hanja.decompositions USING GIN (primitives);
@@ -0,0 +1,41 @@
+-- ============================================================
+-- 008_component_index.sql
+-- 부품 → 글자 역색인 (ETL이 IDS 트리 / 재귀 분해로 생성)
+-- "靑이 들어간 글자"를 decompositions.components 배열 스캔 대신
+-- (component, 정렬 키) 인덱스 한 번으로 조회한다.
+--   transitive = false  IDS에 직접 나오는 부품 (position / operator는 트리 기준)
+--   transitive = true   직접 부품을 재귀로 펼쳐 나온 부품 (via = 그 직접 부품)
+-- 정렬: frequency(kFrequency 1~5, 없으면 뒤) → strokes → codepoint
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS hanja.component_index (
+    character_id  UUID NOT NULL REFERENCES hanja.characters(id)
+                  ON DELETE CASCADE ON UPDATE CASCADE,
+    component     TEXT NOT NULL,          -- '靑'
+    char          TEXT NOT NULL,          -- 부품을 포함한 글자 '淸'
+    position      SMALLINT,               -- 트리 리프 순서 (왼쪽부터 0)
+    operator      TEXT,                   -- 바로 위 IDS 연산자 (예: '⿰')
+    transitive    BOOLEAN NOT NULL DEFAULT false,
+    via           TEXT,                   -- 간접 부품을 품은 직접 부품
+    strokes       INT,
+    frequency     SMALLINT,
+    codepoint     INT NOT NULL,
+    PRIMARY KEY (character_id, component)
+);
+
+CREATE INDEX IF NOT EXISTS idx_component_index_lookup
+    ON hanja.component_index (component, frequency ASC NULLS LAST, strokes, codepoint);
+
+-- 직접 부품만 찾는 조회용 (transitive = false)
+CREATE INDEX IF NOT EXISTS idx_component_index_direct
+    ON hanja.component_index (component, frequency ASC NULLS LAST, strokes, codepoint)
+    WHERE NOT transitive;
+
+COMMENT ON TABLE hanja.component_index IS '부품 → 글자 역색인 (IDS 기반, ETL 생성)';
+
+GRANT SELECT ON hanja.component_index TO anon, authenticated;
+GRANT ALL ON hanja.component_index TO service_role;
+
+ALTER TABLE hanja.component_index ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "공개 읽기" ON hanja.component_index;
+CREATE POLICY "공개 읽기" ON hanja.component_index FOR SELECT USING (true);
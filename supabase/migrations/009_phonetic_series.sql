@@ -0,0 +1,31 @@
+-- ============================================================
+-- 009_phonetic_series.sql
+-- kPhonetic 계열 요약 (ETL이 계열마다 한 번 계산)
+-- 음 계열 형제 패널(/hanja/[char])이 계열 / 연결 / 글자 / 음 / 분해를 차례로 읽고
+-- 성부를 매번 추정하던 것을 character_phonetic_class → phonetic_series 한 번의 조회로 대체한다.
+--   root          구성 글자 2자 이상이 공유하는 직접 부품 중 가장 많은 것
+--   members       [{character_id, char, reading, meaning}] (빈도 → 획수 → codepoint 순)
+--   readings      [{reading, count}] 대표음 분포 (많은 순)
+--   consistency   가장 흔한 대표음의 비율 (0~1)
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS hanja.phonetic_series (
+    phonetic_class_id UUID PRIMARY KEY REFERENCES hanja.phonetic_classes(id)
+                      ON DELETE CASCADE ON UPDATE CASCADE,
+    code              TEXT NOT NULL,
+    root              TEXT,
+    main_reading      TEXT,
+    consistency       REAL,
+    member_count      INT NOT NULL,
+    readings          JSONB NOT NULL DEFAULT '[]',
+    members           JSONB NOT NULL DEFAULT '[]'
+);
+
+COMMENT ON TABLE hanja.phonetic_series IS 'kPhonetic 계열 요약 (성부 / 구성 글자 / 음 일관성, ETL 생성)';
+
+GRANT SELECT ON hanja.phonetic_series TO anon, authenticated;
+GRANT ALL ON hanja.phonetic_series TO service_role;
+
+ALTER TABLE hanja.phonetic_series ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "공개 읽기" ON hanja.phonetic_series;
+CREATE POLICY "공개 읽기" ON hanja.phonetic_series FOR SELECT USING (true);
@@ -0,0 +1,99 @@
+-- ============================================================
+-- 010_character_documents.sql
+-- 글자별 상세 문서 (ETL이 글자마다 조립한 JSONB 한 건)
+-- /hanja/[char]가 characters / readings / decompositions / phonetic_series /
+-- meaning_senses / meaning_edges / character_details를 따로 읽던 것을 char PK 조회 한 번으로 대체한다.
+--   doc        {version, character{..., readings, decomposition}, phonetic, meaning_tree, details, radical}
+--   doc_hash   doc의 정규화 JSON 해시 — ETL은 지문이 같은 문서를 다시 쓰지 않음
+-- 큐레이션 테이블(解說 / 부수 / 의미 트리 / kHangul 외 음 / 급수)이 바뀌면 트리거가
+-- 해당 글자 문서를 지운다. 프론트는 문서가 없으면 정규화 테이블 조회로 대체하고,
+-- 다음 ETL 실행(또는 scripts/etl/documents.py)이 다시 만든다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS hanja.character_documents (
+    char          TEXT PRIMARY KEY,
+    character_id  UUID NOT NULL UNIQUE REFERENCES hanja.characters(id)
+                  ON DELETE CASCADE ON UPDATE CASCADE,
+    doc           JSONB NOT NULL,
+    doc_hash      TEXT NOT NULL
+);
+
+COMMENT ON TABLE hanja.character_documents IS '글자별 상세 문서 (ETL 생성, 큐레이션 수정 시 트리거로 무효화)';
+
+GRANT SELECT ON hanja.character_documents TO anon, authenticated;
+GRANT ALL ON hanja.character_documents TO service_role;
+
+ALTER TABLE hanja.character_documents ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "공개 읽기" ON hanja.character_documents;
+CREATE POLICY "공개 읽기" ON hanja.character_documents FOR SELECT USING (true);
+
+-- ------------------------------------------------------------
+-- 무효화 트리거 — 바뀐 행(변경 전/후)의 글자 문서를 삭제
+-- TG_ARGV[0]: 글자 id 컬럼 이름 (characters는 id, 나머지는 character_id)
+-- ------------------------------------------------------------
+CREATE OR REPLACE FUNCTION hanja.invalidate_character_document()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = hanja, pg_temp
+AS $$
+DECLARE
+    id_column TEXT := TG_ARGV[0];
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM hanja.character_documents
+        WHERE character_id = (to_jsonb(OLD) ->> id_column)::uuid;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        DELETE FROM hanja.character_documents
+        WHERE character_id = (to_jsonb(NEW) ->> id_column)::uuid;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_character_details_document ON hanja.character_details;
+CREATE TRIGGER trg_character_details_document
+    AFTER INSERT OR UPDATE OR DELETE ON hanja.character_details
+    FOR EACH ROW EXECUTE FUNCTION hanja.invalidate_character_document('character_id');
+
+DROP TRIGGER IF EXISTS trg_radical_details_document ON hanja.radical_details;
+CREATE TRIGGER trg_radical_details_document
+    AFTER INSERT OR UPDATE OR DELETE ON hanja.radical_details
+    FOR EACH ROW EXECUTE FUNCTION hanja.invalidate_character_document('character_id');
+
+DROP TRIGGER IF EXISTS trg_meaning_senses_document ON hanja.meaning_senses;
+CREATE TRIGGER trg_meaning_senses_document
+    AFTER INSERT OR UPDATE OR DELETE ON hanja.meaning_senses
+    FOR EACH ROW EXECUTE FUNCTION hanja.invalidate_character_document('character_id');
+
+DROP TRIGGER IF EXISTS trg_meaning_edges_document ON hanja.meaning_edges;
+CREATE TRIGGER trg_meaning_edges_document
+    AFTER INSERT OR UPDATE OR DELETE ON hanja.meaning_edges
+    FOR EACH ROW EXECUTE FUNCTION hanja.invalidate_character_document('character_id');
+
+-- kHangul 음은 ETL이 쓰면서 문서도 같이 갱신하므로 큐레이션 음만
+DROP TRIGGER IF EXISTS trg_readings_document_ins ON hanja.readings;
+CREATE TRIGGER trg_readings_document_ins
+    AFTER INSERT ON hanja.readings
+    FOR EACH ROW WHEN (NEW.type <> 'kHangul')
+    EXECUTE FUNCTION hanja.invalidate_character_document('character_id');
+
+DROP TRIGGER IF EXISTS trg_readings_document_upd ON hanja.readings;
+CREATE TRIGGER trg_readings_document_upd
+    AFTER UPDATE ON hanja.readings
+    FOR EACH ROW WHEN (OLD.type <> 'kHangul' OR NEW.type <> 'kHangul')
+    EXECUTE FUNCTION hanja.invalidate_character_document('character_id');
+
+DROP TRIGGER IF EXISTS trg_readings_document_del ON hanja.readings;
+CREATE TRIGGER trg_readings_document_del
+    AFTER DELETE ON hanja.readings
+    FOR EACH ROW WHEN (OLD.type <> 'kHangul')
+    EXECUTE FUNCTION hanja.invalidate_character_document('character_id');
+
+-- 급수는 ETL이 쓰지 않는 characters 컬럼
+DROP TRIGGER IF EXISTS trg_characters_grade_document ON hanja.characters;
+CREATE TRIGGER trg_characters_grade_document
+    AFTER UPDATE OF grade_level ON hanja.characters
+    FOR EACH ROW WHEN (OLD.grade_level IS DISTINCT FROM NEW.grade_level)
+    EXECUTE FUNCTION hanja.invalidate_character_document('id');
@@ -0,0 +1,115 @@
+-- ============================================================
+-- 011_search_terms.sql
+-- 검색어 색인 (ETL이 글자별 문서에서 생성 — scripts/etl/search_index.py)
+-- searchCharacters()가 readings.value ILIKE '%q%' (B-tree로 못 찾는 순차 스캔) 뒤
+-- 결과마다 추가 조회하던 것을 search_characters() RPC 한 번으로 대체한다.
+--   kind      char / reading / partial(받침 뺀 음) / choseong(초성) / def(영어 뜻 단어) / gloss(큐레이션 풀이 단어)
+--   term      NFC + 소문자, COLLATE "C" — 일치 / 접두사(범위)를 B-tree 하나로
+--   weight    종류별 가중치 (대표음 > 다른 음, 첫 뜻풀이 > 나머지)
+--   strokes / radical   필터(facet)용 (characters와 같은 값)
+-- 순위: weight × (일치 3 / 접두사 2 / 트라이그램 유사도) 중 글자별 최댓값 → 획수 → codepoint
+-- ============================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE TABLE IF NOT EXISTS hanja.search_terms (
+    character_id  UUID NOT NULL REFERENCES hanja.characters(id)
+                  ON DELETE CASCADE ON UPDATE CASCADE,
+    kind          TEXT NOT NULL,
+    term          TEXT COLLATE "C" NOT NULL,
+    weight        REAL NOT NULL,
+    strokes       INT,
+    radical       TEXT,
+    PRIMARY KEY (character_id, kind, term)
+);
+
+-- 일치 / 접두사 (term >= q AND term < q || U+10FFFF)
+CREATE INDEX IF NOT EXISTS idx_search_terms_term
+    ON hanja.search_terms (term);
+
+-- 3자 이상 질의의 오타 허용 (영어 뜻 단어 등)
+CREATE INDEX IF NOT EXISTS idx_search_terms_trgm
+    ON hanja.search_terms USING GIN (term gin_trgm_ops);
+
+-- 부수 필터 (획수는 idx_characters_strokes와 같은 값이라 term 인덱스 뒤 필터로 충분)
+CREATE INDEX IF NOT EXISTS idx_search_terms_radical
+    ON hanja.search_terms (radical, term);
+
+COMMENT ON TABLE hanja.search_terms IS '검색어 색인 (음 / 초성 / 뜻 단어 / 큐레이션 풀이, ETL 생성)';
+
+GRANT SELECT ON hanja.search_terms TO anon, authenticated;
+GRANT ALL ON hanja.search_terms TO service_role;
+
+ALTER TABLE hanja.search_terms ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "공개 읽기" ON hanja.search_terms;
+CREATE POLICY "공개 읽기" ON hanja.search_terms FOR SELECT USING (true);
+
+-- ============================================================
+-- 검색 RPC — 글자 + 대표음 + 점수를 한 번에
+-- ============================================================
+CREATE OR REPLACE FUNCTION hanja.search_characters(
+    q               TEXT,
+    max_results     INT DEFAULT 20,
+    strokes_filter  INT DEFAULT NULL,
+    radical_filter  TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    id          UUID,
+    "char"      TEXT,
+    codepoint   INT,
+    strokes     INT,
+    radical     TEXT,
+    unihan_def  TEXT,
+    grade_level INT,
+    created_at  TIMESTAMPTZ,
+    reading     TEXT,
+    score       REAL
+)
+LANGUAGE sql
+STABLE
+SET search_path = hanja, public, extensions, pg_temp
+AS $$
+    WITH query AS (
+        SELECT lower(btrim(normalize(q, NFC))) COLLATE "C" AS q
+    ),
+    hits AS (
+        SELECT t.character_id,
+               t.weight * CASE WHEN t.term = query.q THEN 3 ELSE 2 END AS score
+        FROM hanja.search_terms t, query
+        WHERE query.q <> ''
+          AND t.term >= query.q
+          AND t.term < query.q || chr(1114111)
+          AND (strokes_filter IS NULL OR t.strokes = strokes_filter)
+          AND (radical_filter IS NULL OR t.radical = radical_filter)
+        UNION ALL
+        SELECT t.character_id,
+               t.weight * similarity(t.term, query.q) AS score
+        FROM hanja.search_terms t, query
+        WHERE length(query.q) >= 3
+          AND t.term % query.q
+          AND (strokes_filter IS NULL OR t.strokes = strokes_filter)
+          AND (radical_filter IS NULL OR t.radical = radical_filter)
+    ),
+    ranked AS (
+        SELECT character_id, max(score)::REAL AS score
+        FROM hits
+        GROUP BY character_id
+    )
+    SELECT c.id, c.char, c.codepoint, c.strokes, c.radical, c.unihan_def,
+           c.grade_level, c.created_at, r.value AS reading, ranked.score
+    FROM ranked
+    JOIN hanja.characters c ON c.id = ranked.character_id
+    LEFT JOIN LATERAL (
+        SELECT value FROM hanja.readings
+        WHERE character_id = c.id AND is_primary
+        ORDER BY type = 'kHangul' DESC, value
+        LIMIT 1
+    ) r ON true
+    ORDER BY ranked.score DESC, c.strokes NULLS LAST, c.codepoint
+    LIMIT LEAST(GREATEST(max_results, 1), 100);
+$$;
+
+COMMENT ON FUNCTION hanja.search_characters(TEXT, INT, INT, TEXT) IS
+    '글자 / 음 / 초성 / 뜻 검색 (search_terms 기반 순위) — src/lib/queries.ts searchCharacters';
+
+GRANT EXECUTE ON FUNCTION hanja.search_characters(TEXT, INT, INT, TEXT) TO anon, authenticated, service_role;